@@ -2,13 +2,72 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import html
 import json
+import mmap
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from hashlib import sha256
-from pathlib import Path
-from typing import Any, Iterable
+from io import StringIO
+from pathlib import Path, PurePosixPath
+from typing import Any, Iterable, Iterator, TextIO
+
+import json_codec
+import profiling
+from aoi_report_templates import (
+    ALERT_BOX,
+    DOCUMENT_START_LINES,
+    FIELD_ROW,
+    INPUT_ROW,
+    LEAFLET_HEAD_LINES,
+    METRIC_ROW,
+    PARCEL_ROW,
+    RUN_CORE_LINK_ITEM,
+    RUN_EVIDENCE_ITEM,
+    RUN_HEADER_LINES,
+    RUN_STYLE_LINES,
+    SUMMARY_EVIDENCE_ITEM,
+    SUMMARY_STYLE_LINES,
+    map_script_lines,
+)
+
+
+# Bump whenever rendered output changes so .render_cache.json entries are invalidated.
+RENDERER_VERSION = "4"
+RENDER_CACHE_NAME = ".render_cache.json"
+DIGEST_CACHE_NAME = ".digest_cache.json"
+# Files modified this recently are not cached: a same-size rewrite within the
+# filesystem's mtime granularity would otherwise go unnoticed.
+DIGEST_CACHE_RACY_WINDOW_NS = 2_000_000_000
+# Files at or above this size are hashed through mmap instead of buffered reads.
+MMAP_HASH_THRESHOLD = 4 * 1024 * 1024
+HASH_BUFFER_SIZE = 1024 * 1024
+DEFAULT_HASH_WORKERS = min(8, os.cpu_count() or 1)
+RUN_REPORT_HTML = "report.html"
+# Simplified display copies (build_map_display_layers.py) sit next to their sources
+# as <name>.display<ext>; the original map_config.json and masks stay the evidence.
+DISPLAY_SUFFIX = ".display"
+# AOI boundaries larger than this are fetched by the map script instead of inlined.
+MAP_INLINE_BOUNDARY_MAX_BYTES = 256 * 1024
+
+
+@dataclass(frozen=True)
+class MapInputs:
+    """The config the map script loads and the JSON inlined into the page (None: fetched)."""
+
+    script_relpath: str
+    config_json: str | None
+    boundary_json: str | None
+
+    def cache_inputs(self) -> dict[str, Any]:
+        return {
+            "map_script_relpath": self.script_relpath,
+            "map_config_sha256": sha256(self.config_json.encode("utf-8")).hexdigest() if self.config_json else None,
+            "aoi_boundary_sha256": sha256(self.boundary_json.encode("utf-8")).hexdigest() if self.boundary_json else None,
+        }
 
 
 @dataclass(frozen=True)
@@ -16,26 +75,143 @@ class RenderedArtifacts:
     html_relpath: str
     json_relpath: str
     metrics_relpath: str
+    cached: bool = False
 
 
 def load_report(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    with profiling.span("load_report"):
+        profiling.add_read_file(path)
+        return json_codec.loads(path.read_bytes())
+
+
+class EvidenceIndex:
+    """Lookup tables over report["evidence_artifacts"], built once per report.
+
+    Entries are indexed by relpath, file extension, meta.role and content_type;
+    arbitrary suffix lookups are answered from the extension table when the
+    suffix is a bare extension and memoized otherwise. Lookups return the first
+    match in declaration order, like the linear scans they replace.
+    """
+
+    __slots__ = ("entries", "by_relpath", "by_extension", "by_role", "by_content_type", "_suffix_memo", "_sorted")
+
+    def __init__(self, evidence: Iterable[Any]) -> None:
+        self.entries: list[dict[str, Any]] = [entry for entry in evidence if isinstance(entry, dict)]
+        self.by_relpath: dict[str, dict[str, Any]] = {}
+        self.by_extension: dict[str, list[str]] = {}
+        self.by_role: dict[str, list[dict[str, Any]]] = {}
+        self.by_content_type: dict[str, list[dict[str, Any]]] = {}
+        self._suffix_memo: dict[str, str | None] = {}
+        self._sorted: list[dict[str, Any]] | None = None
+        for entry in self.entries:
+            relpath = entry.get("relpath") or ""
+            if relpath:
+                self.by_relpath.setdefault(relpath, entry)
+                _stem, dot, extension = relpath.rpartition("/")[2].rpartition(".")
+                if dot:
+                    self.by_extension.setdefault(f".{extension}", []).append(relpath)
+            meta = entry.get("meta")
+            if isinstance(meta, dict) and meta.get("role"):
+                self.by_role.setdefault(str(meta["role"]), []).append(entry)
+            if entry.get("content_type"):
+                self.by_content_type.setdefault(str(entry["content_type"]), []).append(entry)
+
+    @classmethod
+    def from_report(cls, report: dict[str, Any]) -> "EvidenceIndex":
+        return cls(report.get("evidence_artifacts") or [])
+
+    def find_suffix(self, suffix: str) -> str | None:
+        """Return the first declared relpath ending with suffix, or None."""
+
+        if suffix in self._suffix_memo:
+            return self._suffix_memo[suffix]
+        if suffix.startswith(".") and "." not in suffix[1:] and "/" not in suffix:
+            matches = self.by_extension.get(suffix)
+            found = matches[0] if matches else None
+        else:
+            found = next(
+                (entry["relpath"] for entry in self.entries if (entry.get("relpath") or "").endswith(suffix)),
+                None,
+            )
+        self._suffix_memo[suffix] = found
+        return found
+
+    def relpaths_with_extension(self, extension: str) -> list[str]:
+        return list(self.by_extension.get(extension, []))
+
+    def with_role(self, role: str) -> list[dict[str, Any]]:
+        return list(self.by_role.get(role, []))
+
+    def with_content_type(self, content_type: str) -> list[dict[str, Any]]:
+        return list(self.by_content_type.get(content_type, []))
+
+    @property
+    def sorted_entries(self) -> list[dict[str, Any]]:
+        if self._sorted is None:
+            self._sorted = sorted(self.entries, key=lambda item: str(item.get("relpath", "")))
+        return self._sorted
+
+
+def find_artifact_relpath(report: dict[str, Any], suffix: str, index: EvidenceIndex | None = None) -> str:
+    relpath = (index or EvidenceIndex.from_report(report)).find_suffix(suffix)
+    if relpath is None:
+        raise ValueError(f"No evidence_artifacts entry ends with {suffix}")
+    return relpath
+
+
+def find_html_relpath(report: dict[str, Any], index: EvidenceIndex | None = None) -> str:
+    relpath = (index or EvidenceIndex.from_report(report)).find_suffix(".html")
+    if relpath is None:
+        raise ValueError("No HTML evidence_artifacts entry found")
+    return relpath
 
 
-def find_artifact_relpath(report: dict[str, Any], suffix: str) -> str:
-    for entry in report.get("evidence_artifacts", []):
-        relpath = entry.get("relpath", "")
-        if relpath.endswith(suffix):
-            return relpath
-    raise ValueError(f"No evidence_artifacts entry ends with {suffix}")
+def display_relpath(relpath: str) -> str:
+    path = PurePosixPath(relpath)
+    return str(path.with_name(f"{path.stem}{DISPLAY_SUFFIX}{path.suffix}"))
 
 
-def find_html_relpath(report: dict[str, Any]) -> str:
-    for entry in report.get("evidence_artifacts", []):
-        relpath = entry.get("relpath", "")
-        if relpath.endswith(".html"):
-            return relpath
-    raise ValueError("No HTML evidence_artifacts entry found")
+def map_script_relpath(run_dir: Path, config_relpath: str) -> str:
+    """The map config the interactive map loads: the display copy when one was built."""
+
+    display = display_relpath(config_relpath)
+    return display if (run_dir / display).is_file() else config_relpath
+
+
+def script_json(value: Any) -> str:
+    """Compact JSON that is safe to embed in an inline <script> block."""
+
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).replace("<", "\\u003c")
+
+
+def load_map_inputs(run_dir: Path, config_relpath: str) -> MapInputs:
+    """Read the map config (and the AOI boundary it points at) for inlining into the page.
+
+    Unreadable or non-JSON files are left to the map script to fetch at runtime.
+    """
+
+    script_relpath = map_script_relpath(run_dir, config_relpath)
+    config_path = run_dir / script_relpath
+    try:
+        config = json.loads(config_path.read_text(encoding="utf-8"))
+        profiling.add_read_file(config_path)
+    except (OSError, ValueError):
+        return MapInputs(script_relpath, None, None)
+    if not isinstance(config, dict):
+        return MapInputs(script_relpath, None, None)
+
+    boundary_json = None
+    layers = config.get("layers") if isinstance(config.get("layers"), dict) else {}
+    boundary_href = layers.get("aoi_boundary")
+    if isinstance(boundary_href, str) and boundary_href:
+        boundary_path = config_path.parent / boundary_href
+        try:
+            if boundary_path.stat().st_size <= MAP_INLINE_BOUNDARY_MAX_BYTES:
+                boundary_json = script_json(json.loads(boundary_path.read_text(encoding="utf-8")))
+                profiling.add_read_file(boundary_path)
+        except (OSError, ValueError):
+            boundary_json = None
+    return MapInputs(script_relpath, script_json(config), boundary_json)
 
 
 def relpath_from_html(run_dir: Path, html_path: Path, target_relpath: str) -> str:
@@ -66,8 +242,8 @@ def render_metrics_rows(report: dict[str, Any]) -> list[dict[str, str]]:
     return rows
 
 
-def render_metrics_csv(report: dict[str, Any]) -> str:
-    rows = render_metrics_rows(report)
+def render_metrics_csv(report: dict[str, Any], view: AoiReportView | None = None) -> str:
+    rows = view.metrics_rows if view is not None else render_metrics_rows(report)
     output = []
     header = ["variable", "value", "unit", "notes", "source"]
     output.append(header)
@@ -76,7 +252,6 @@ def render_metrics_csv(report: dict[str, Any]) -> str:
     with_rows = []
     for row in output:
         with_rows.append(row)
-    from io import StringIO
 
     buffer = StringIO()
     writer = csv.writer(buffer, lineterminator="\n")
@@ -85,598 +260,614 @@ def render_metrics_csv(report: dict[str, Any]) -> str:
 
 
 def render_report_json(report: dict[str, Any]) -> str:
-    return json.dumps(report, sort_keys=True, indent=2, ensure_ascii=False) + "\n"
+    return json_codec.dumps_pretty(report, sort_keys=True) + "\n"
 
 
-def render_report_html(report: dict[str, Any], run_dir: Path, html_relpath: str) -> str:
-    html_path = run_dir / html_relpath
-    aoi_id = str(report.get("aoi_id", ""))
-    bundle_id = str(report.get("bundle_id", ""))
-    report_version = str(report.get("report_version", ""))
-    geometry_ref = report.get("aoi_geometry_ref", {})
-    report_metadata = report.get("report_metadata")
-    evidence_registry = report.get("evidence_registry")
-    if evidence_registry is None and isinstance(report_metadata, dict):
-        evidence_registry = report_metadata.get("evidence_registry")
-    evidence_classes_list: list[dict[str, Any]] = []
-    if isinstance(evidence_registry, dict):
-        evidence_classes_list = [
-            entry for entry in evidence_registry.get("evidence_classes", []) if isinstance(entry, dict)
-        ]
-    elif isinstance(evidence_registry, list):
-        evidence_classes_list = [entry for entry in evidence_registry if isinstance(entry, dict)]
-    acceptance_criteria = report.get("acceptance_criteria")
-    if acceptance_criteria is None and isinstance(report_metadata, dict):
-        acceptance_criteria = report_metadata.get("acceptance_criteria")
-    results = report.get("results")
-    regulatory_traceability = report.get("regulatory_traceability")
-    assumptions = report.get("assumptions")
-    if assumptions is None and isinstance(report_metadata, dict):
-        assumptions = report_metadata.get("assumptions")
-    map_assets = report.get("map_assets") if isinstance(report.get("map_assets"), dict) else None
+CRITERIA_ALERT_STATUSES = {"unmet", "unevaluable", "not_evaluable", "missing", "unknown", "not_evaluated"}
+EVIDENCE_MISSING_STATUSES = {"missing", "absent", "unavailable", "not_found"}
+ALERT_ROW_STYLE = " style=\"background:#fff5f5; border-left:4px solid #b00020;\""
 
-    inputs = report.get("inputs", {}).get("sources", [])
-    inputs_sorted = sorted(inputs, key=lambda item: str(item.get("source_id", "")))
-
-    evidence = report.get("evidence_artifacts", [])
-    evidence_sorted = sorted(evidence, key=lambda item: str(item.get("relpath", "")))
-
-    criteria_alert_statuses = {"unmet", "unevaluable", "not_evaluable", "missing", "unknown", "not_evaluated"}
-
-    def anchor_id(prefix: str, value: Any) -> str:
-        safe = str(value).strip().replace(" ", "-")
-        return f"{prefix}-{safe}"
-
-    def format_criteria_refs(value: Any) -> str:
-        if value is None:
-            return "Not declared"
-        if isinstance(value, list):
-            return ", ".join(str(item) for item in value) if value else "Not declared"
-        return str(value)
-
-    lines: list[str] = []
-    lines.append("<!doctype html>")
-    lines.append('<html lang="en">')
-    lines.append("<head>")
-    lines.append("  <meta charset=\"utf-8\" />")
-    lines.append("  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />")
-    lines.append(f"  <title>AOI Report Summary — {html.escape(aoi_id)}</title>")
-    lines.append("  <style>")
-    lines.append("    body { font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial; margin: 24px; }")
-    lines.append("    table { border-collapse: collapse; width: 100%; }")
-    lines.append("    th, td { border: 1px solid #ddd; padding: 8px; vertical-align: top; }")
-    lines.append("    th { background: #f6f6f6; text-align: left; width: 240px; }")
-    lines.append("    h2 { margin-top: 28px; }")
-    lines.append("    code { background: #f6f6f6; padding: 1px 4px; border-radius: 4px; }")
-    lines.append("    #map { height: 420px; border: 1px solid #ddd; border-radius: 8px; margin: 12px 0 16px; background: #fafafa; }")
-    lines.append("  </style>")
-    if map_assets and map_assets.get("config_relpath"):
-        lines.append(
-            "  <link rel=\"stylesheet\" href=\"https://unpkg.com/leaflet@1.9.4/dist/leaflet.css\" "
-            "integrity=\"sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY=\" crossorigin=\"\" />"
-        )
-        lines.append(
-            "  <script src=\"https://unpkg.com/leaflet@1.9.4/dist/leaflet.js\" "
-            "integrity=\"sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo=\" crossorigin=\"\"></script>"
-        )
-    lines.append("</head>")
-    lines.append("<body>")
-    if not report_metadata:
-        lines.append(
-            "  <div style=\"border:2px solid #b00020; background:#fff5f5; padding:12px; margin-bottom:16px;\">"
-            "<strong>INVALID FOR INSPECTION:</strong> report_metadata is missing."
-            "</div>"
-        )
+
+def write_lines(fp: TextIO, lines: Iterable[str]) -> None:
+    """Stream rendered lines to fp, newline-terminated (same bytes as "\\n".join(lines) + "\\n")."""
+
+    for line in lines:
+        fp.write(line)
+        fp.write("\n")
+
+
+def _anchor_id(prefix: str, value: Any) -> str:
+    safe = str(value).strip().replace(" ", "-")
+    return f"{prefix}-{safe}"
+
+
+def _format_criteria_refs(value: Any) -> str:
+    if value is None:
+        return "Not declared"
+    if isinstance(value, list):
+        return ", ".join(str(item) for item in value) if value else "Not declared"
+    return str(value)
+
+
+def _json_code(value: Any, sort_keys: bool = True) -> str:
+    return html.escape(json.dumps(value, sort_keys=sort_keys, ensure_ascii=False))
+
+
+def _link_or_error(prefix: str, value: Any, declared_ids: set[str]) -> str:
+    if value is None:
+        return "<strong>missing</strong>"
+    anchor = _anchor_id(prefix, value)
+    if anchor in declared_ids:
+        return f"<a href=\"#{html.escape(anchor)}\">{html.escape(str(value))}</a>"
+    return f"<strong>missing-link</strong> {html.escape(str(value))}"
+
+
+def _evidence_class_id(entry: dict[str, Any]) -> Any:
+    return entry.get("class_id") or entry.get("class") or entry.get("evidence_class") or entry.get("id")
+
+
+def _criteria_id(entry: dict[str, Any]) -> Any:
+    return entry.get("criteria_id") or entry.get("id") or entry.get("name") or entry.get("criteria")
+
+
+def _result_anchor_ids(results: Any) -> set[str]:
+    return {
+        _anchor_id("result", r.get("result_id"))
+        for r in results or []
+        if isinstance(r, dict) and r.get("result_id") is not None
+    }
+
+
+class AoiReportView:
+    """Normalized view of a loaded report, built once and shared by both pages and the CSV.
+
+    Resolves fields that may live at the top level or under report_metadata and
+    precomputes the anchor sets, status map, evidence gaps and metrics rows the
+    renderers would otherwise re-derive per page.
+    """
+
+    __slots__ = (
+        "report",
+        "aoi_id",
+        "report_metadata",
+        "evidence_registry",
+        "evidence_classes",
+        "acceptance_criteria",
+        "results",
+        "assumptions",
+        "map_config_relpath",
+        "evidence_anchor_ids",
+        "criteria_anchor_ids",
+        "result_anchor_ids",
+        "status_map",
+        "evidence_gaps",
+        "metrics_rows",
+        "index",
+        "_map_inputs",
+    )
+
+    def __init__(self, report: dict[str, Any]) -> None:
+        self.report = report
+        self.aoi_id = str(report.get("aoi_id", ""))
+        report_metadata = report.get("report_metadata")
+        self.report_metadata = report_metadata
+        metadata = report_metadata if isinstance(report_metadata, dict) else {}
+
+        evidence_registry = report.get("evidence_registry")
+        if evidence_registry is None:
+            evidence_registry = metadata.get("evidence_registry")
+        self.evidence_registry = evidence_registry
+        evidence_classes: list[dict[str, Any]] = []
+        if isinstance(evidence_registry, dict):
+            evidence_classes = [
+                entry for entry in evidence_registry.get("evidence_classes", []) if isinstance(entry, dict)
+            ]
+        elif isinstance(evidence_registry, list):
+            evidence_classes = [entry for entry in evidence_registry if isinstance(entry, dict)]
+        self.evidence_classes = evidence_classes
+
+        acceptance_criteria = report.get("acceptance_criteria")
+        if acceptance_criteria is None:
+            acceptance_criteria = metadata.get("acceptance_criteria")
+        self.acceptance_criteria = acceptance_criteria
+        assumptions = report.get("assumptions")
+        if assumptions is None:
+            assumptions = metadata.get("assumptions")
+        self.assumptions = assumptions
+        self.results = report.get("results")
+
+        map_assets = report.get("map_assets")
+        config_relpath = map_assets.get("config_relpath") if isinstance(map_assets, dict) else None
+        self.map_config_relpath = str(config_relpath) if config_relpath else None
+
+        self.evidence_anchor_ids = {_anchor_id("evidence", _evidence_class_id(entry)) for entry in evidence_classes}
+        self.criteria_anchor_ids = {
+            _anchor_id("criteria", _criteria_id(entry))
+            for entry in (acceptance_criteria if isinstance(acceptance_criteria, list) else [])
+            if isinstance(entry, dict)
+        }
+        self.result_anchor_ids = _result_anchor_ids(self.results if isinstance(self.results, list) else [])
+        self.status_map = _run_status_map(self.results or [])
+        self.evidence_gaps = _run_evidence_gaps(report)
+        self.metrics_rows = render_metrics_rows(report)
+        self.index = EvidenceIndex.from_report(report)
+        self._map_inputs: tuple[Path, MapInputs] | None = None
+
+    def map_inputs(self, run_dir: Path) -> MapInputs:
+        """load_map_inputs for this report's map config, read once per run directory."""
+
+        if self.map_config_relpath is None:
+            raise ValueError("Report has no map_assets.config_relpath")
+        if self._map_inputs is None or self._map_inputs[0] != run_dir:
+            self._map_inputs = (run_dir, load_map_inputs(run_dir, self.map_config_relpath))
+        return self._map_inputs[1]
+
+    @property
+    def evidence_sorted(self) -> list[dict[str, Any]]:
+        return self.index.sorted_entries
+
+
+def _summary_head_lines(aoi_id: str, with_map: bool) -> Iterator[str]:
+    yield from DOCUMENT_START_LINES
+    yield f"  <title>AOI Report Summary — {html.escape(aoi_id)}</title>"
+    yield from SUMMARY_STYLE_LINES
+    if with_map:
+        yield from LEAFLET_HEAD_LINES
+    yield "</head>"
+    yield "<body>"
+
+
+def _report_intent_lines(report_metadata: Any) -> Iterator[str]:
+    yield "  <h2>Report Intent & Scope</h2>"
+    yield "  <table>"
+    yield "    <tr><th>Field</th><th>Value</th></tr>"
+    if isinstance(report_metadata, dict):
+        for key in sorted(report_metadata.keys()):
+            yield (
+                "    <tr>"
+                f"<td>{html.escape(str(key))}</td>"
+                f"<td><code>{_json_code(report_metadata[key])}</code></td>"
+                "</tr>"
+            )
     else:
-        lines.append("  <h2>Report Intent & Scope</h2>")
-        lines.append("  <table>")
-        lines.append("    <tr><th>Field</th><th>Value</th></tr>")
-        if isinstance(report_metadata, dict):
-            for key in sorted(report_metadata.keys()):
-                value = json.dumps(report_metadata[key], sort_keys=True, ensure_ascii=False)
-                lines.append(
+        yield (
+            "    <tr>"
+            "<td>value</td>"
+            f"<td><code>{_json_code(report_metadata)}</code></td>"
+            "</tr>"
+        )
+    yield "  </table>"
+    yield "  <div style=\"height:12px;\"></div>"
+
+
+def _traceability_lines(regulatory_traceability: Any, view: AoiReportView) -> Iterator[str]:
+    yield "  <h2>Regulatory traceability</h2>"
+    if not regulatory_traceability:
+        yield ALERT_BOX.render("Traceability not declared in report JSON", "")
+        return
+    yield "  <table>"
+    yield "    <tr><th>Regulation</th><th>Article</th><th>Evidence class</th><th>Acceptance criteria</th><th>Result ref</th></tr>"
+    evidence_ids = view.evidence_anchor_ids
+    criteria_ids = view.criteria_anchor_ids
+    result_ids = view.result_anchor_ids
+    if isinstance(regulatory_traceability, list):
+        for entry in regulatory_traceability:
+            if not isinstance(entry, dict):
+                yield (
                     "    <tr>"
-                    f"<td>{html.escape(str(key))}</td>"
-                    f"<td><code>{html.escape(value)}</code></td>"
+                    f"<td colspan=\"5\"><code>{_json_code(entry)}</code></td>"
                     "</tr>"
                 )
-        else:
-            value = json.dumps(report_metadata, sort_keys=True, ensure_ascii=False)
-            lines.append(
+                continue
+            regulation = entry.get("regulation")
+            article = entry.get("article_ref")
+            yield (
                 "    <tr>"
-                "<td>value</td>"
-                f"<td><code>{html.escape(value)}</code></td>"
+                f"<td>{html.escape(str(regulation)) if regulation is not None else '<strong>missing</strong>'}</td>"
+                f"<td>{html.escape(str(article)) if article is not None else '<strong>missing</strong>'}</td>"
+                f"<td>{_link_or_error('evidence', entry.get('evidence_class'), evidence_ids)}</td>"
+                f"<td>{_link_or_error('criteria', entry.get('acceptance_criteria'), criteria_ids)}</td>"
+                f"<td>{_link_or_error('result', entry.get('result_ref'), result_ids)}</td>"
                 "</tr>"
             )
-        lines.append("  </table>")
-        lines.append("  <div style=\"height:12px;\"></div>")
-        lines.append("  <h2>Regulatory traceability</h2>")
-        if not regulatory_traceability:
-            lines.append(
-                "  <div style=\"border:2px solid #b00020; background:#fff5f5; padding:12px; margin-bottom:16px;\">"
-                "<strong>Traceability not declared in report JSON</strong>"
-                "</div>"
-            )
-        else:
-            lines.append("  <table>")
-            lines.append("    <tr><th>Regulation</th><th>Article</th><th>Evidence class</th><th>Acceptance criteria</th><th>Result ref</th></tr>")
-            evidence_ids = {
-                anchor_id("evidence", e.get("class_id") or e.get("class") or e.get("evidence_class") or e.get("id"))
-                for e in evidence_classes_list
-            }
-            criteria_ids = {
-                anchor_id(
-                    "criteria",
-                    c.get("criteria_id") or c.get("id") or c.get("name") or c.get("criteria"),
-                )
-                for c in acceptance_criteria or []
-                if isinstance(c, dict)
-            }
-            result_ids = {anchor_id("result", r.get("result_id")) for r in results or [] if isinstance(r, dict) and r.get("result_id") is not None}
-
-            def link_or_error(prefix: str, value: Any, declared_ids: set[str]) -> str:
-                if value is None:
-                    return "<strong>missing</strong>"
-                anchor = anchor_id(prefix, value)
-                if anchor in declared_ids:
-                    return f"<a href=\"#{html.escape(anchor)}\">{html.escape(str(value))}</a>"
-                return f"<strong>missing-link</strong> {html.escape(str(value))}"
-
-            if isinstance(regulatory_traceability, list):
-                for entry in regulatory_traceability:
-                    if not isinstance(entry, dict):
-                        value = json.dumps(entry, sort_keys=True, ensure_ascii=False)
-                        lines.append(
-                            "    <tr>"
-                            f"<td colspan=\"5\"><code>{html.escape(value)}</code></td>"
-                            "</tr>"
-                        )
-                        continue
-                    regulation = entry.get("regulation")
-                    article = entry.get("article_ref")
-                    evidence_class = entry.get("evidence_class")
-                    criteria = entry.get("acceptance_criteria")
-                    result_ref = entry.get("result_ref")
-                    lines.append(
-                        "    <tr>"
-                        f"<td>{html.escape(str(regulation)) if regulation is not None else '<strong>missing</strong>'}</td>"
-                        f"<td>{html.escape(str(article)) if article is not None else '<strong>missing</strong>'}</td>"
-                        f"<td>{link_or_error('evidence', evidence_class, evidence_ids)}</td>"
-                        f"<td>{link_or_error('criteria', criteria, criteria_ids)}</td>"
-                        f"<td>{link_or_error('result', result_ref, result_ids)}</td>"
-                        "</tr>"
-                    )
-            else:
-                value = json.dumps(regulatory_traceability, sort_keys=True, ensure_ascii=False)
-                lines.append(
-                    "    <tr>"
-                    f"<td colspan=\"5\"><code>{html.escape(value)}</code></td>"
-                    "</tr>"
-                )
-            lines.append("  </table>")
-        lines.append("  <div style=\"height:12px;\"></div>")
+    else:
+        yield (
+            "    <tr>"
+            f"<td colspan=\"5\"><code>{_json_code(regulatory_traceability)}</code></td>"
+            "</tr>"
+        )
+    yield "  </table>"
+
 
-    lines.append("  <h2>Evidence Registry</h2>")
+def _evidence_registry_lines(evidence_registry: Any, evidence_classes_list: list[dict[str, Any]]) -> Iterator[str]:
+    yield "  <h2>Evidence Registry</h2>"
     if not evidence_registry:
-        lines.append(
-            "  <div style=\"border:2px solid #b00020; background:#fff5f5; padding:12px; margin-bottom:16px;\">"
-            "<strong>INVALID FOR INSPECTION:</strong> evidence_registry is missing."
-            "</div>"
-        )
-    else:
-        lines.append("  <table>")
-        lines.append("    <tr><th>Evidence Class</th><th>Mandatory</th><th>Status</th></tr>")
-        if evidence_classes_list:
-            for entry in evidence_classes_list:
-                if not isinstance(entry, dict):
-                    value = json.dumps(entry, sort_keys=True, ensure_ascii=False)
-                    lines.append(
-                        "    <tr>"
-                        "<td><code>value</code></td>"
-                        "<td></td>"
-                        f"<td><code>{html.escape(value)}</code></td>"
-                        "</tr>"
-                    )
-                    continue
-                evidence_class = entry.get("class_id") or entry.get("class") or entry.get("evidence_class") or entry.get("id")
-                mandatory = entry.get("mandatory")
-                status = entry.get("status")
-                status_text = "" if status is None else str(status)
-                mandatory_text = "" if mandatory is None else str(mandatory)
-                is_missing = bool(mandatory is True and status_text.lower() in {"missing", "absent", "unavailable", "not_found"})
-                row_style = " style=\"background:#fff5f5; border-left:4px solid #b00020;\"" if is_missing else ""
-                evidence_id = anchor_id("evidence", evidence_class)
-                lines.append(
-                    f"    <tr{row_style}>"
-                    f"<td id=\"{html.escape(evidence_id)}\">{html.escape(str(evidence_class))}</td>"
-                    f"<td>{html.escape(mandatory_text)}</td>"
-                    f"<td>{html.escape(status_text)}</td>"
-                    "</tr>"
-                )
-        else:
-            value = json.dumps(evidence_registry, sort_keys=True, ensure_ascii=False)
-            lines.append(
-                "    <tr>"
-                "<td><code>value</code></td>"
-                "<td></td>"
-                f"<td><code>{html.escape(value)}</code></td>"
+        yield ALERT_BOX.render("INVALID FOR INSPECTION:", " evidence_registry is missing.")
+        return
+    yield "  <table>"
+    yield "    <tr><th>Evidence Class</th><th>Mandatory</th><th>Status</th></tr>"
+    if evidence_classes_list:
+        for entry in evidence_classes_list:
+            evidence_class = _evidence_class_id(entry)
+            mandatory = entry.get("mandatory")
+            status = entry.get("status")
+            status_text = "" if status is None else str(status)
+            mandatory_text = "" if mandatory is None else str(mandatory)
+            is_missing = bool(mandatory is True and status_text.lower() in EVIDENCE_MISSING_STATUSES)
+            row_style = ALERT_ROW_STYLE if is_missing else ""
+            evidence_id = _anchor_id("evidence", evidence_class)
+            yield (
+                f"    <tr{row_style}>"
+                f"<td id=\"{html.escape(evidence_id)}\">{html.escape(str(evidence_class))}</td>"
+                f"<td>{html.escape(mandatory_text)}</td>"
+                f"<td>{html.escape(status_text)}</td>"
                 "</tr>"
             )
-        lines.append("  </table>")
-        lines.append("  <div style=\"height:12px;\"></div>")
+    else:
+        yield (
+            "    <tr>"
+            "<td><code>value</code></td>"
+            "<td></td>"
+            f"<td><code>{_json_code(evidence_registry)}</code></td>"
+            "</tr>"
+        )
+    yield "  </table>"
+    yield "  <div style=\"height:12px;\"></div>"
+
 
-    lines.append("  <h2>Acceptance Criteria</h2>")
+def _acceptance_criteria_lines(acceptance_criteria: Any) -> Iterator[str]:
+    yield "  <h2>Acceptance Criteria</h2>"
     if not acceptance_criteria:
-        lines.append("  <p><em>No acceptance criteria declared.</em></p>")
+        yield "  <p><em>No acceptance criteria declared.</em></p>"
     else:
-        lines.append("  <table>")
-        lines.append("    <tr><th>Criteria</th><th>Status</th><th>Details</th></tr>")
+        yield "  <table>"
+        yield "    <tr><th>Criteria</th><th>Status</th><th>Details</th></tr>"
         if isinstance(acceptance_criteria, list):
             for entry in acceptance_criteria:
                 if not isinstance(entry, dict):
-                    value = json.dumps(entry, sort_keys=True, ensure_ascii=False)
-                    lines.append(
+                    yield (
                         "    <tr>"
-                        f"<td><code>{html.escape(value)}</code></td>"
+                        f"<td><code>{_json_code(entry)}</code></td>"
                         "<td></td>"
                         "<td></td>"
                         "</tr>"
                     )
                     continue
-                criteria_id = entry.get("criteria_id") or entry.get("id") or entry.get("name") or entry.get("criteria")
+                criteria_id = _criteria_id(entry)
                 status = entry.get("status")
                 status_text = "" if status is None else str(status)
-                details_value = json.dumps(entry, sort_keys=True, ensure_ascii=False)
-                is_alert = status_text.lower() in criteria_alert_statuses
-                row_style = " style=\"background:#fff5f5; border-left:4px solid #b00020;\"" if is_alert else ""
-                criteria_anchor = anchor_id("criteria", criteria_id)
-                lines.append(
+                row_style = ALERT_ROW_STYLE if status_text.lower() in CRITERIA_ALERT_STATUSES else ""
+                criteria_anchor = _anchor_id("criteria", criteria_id)
+                yield (
                     f"    <tr{row_style}>"
                     f"<td id=\"{html.escape(criteria_anchor)}\">{html.escape(str(criteria_id))}</td>"
                     f"<td>{html.escape(status_text)}</td>"
-                    f"<td><code>{html.escape(details_value)}</code></td>"
+                    f"<td><code>{_json_code(entry)}</code></td>"
                     "</tr>"
                 )
         else:
-            value = json.dumps(acceptance_criteria, sort_keys=True, ensure_ascii=False)
-            lines.append(
+            yield (
                 "    <tr>"
-                f"<td><code>{html.escape(value)}</code></td>"
+                f"<td><code>{_json_code(acceptance_criteria)}</code></td>"
                 "<td></td>"
                 "<td></td>"
                 "</tr>"
             )
-        lines.append("  </table>")
-    lines.append("  <div style=\"height:12px;\"></div>")
-    lines.append("  <h1>AOI Report Summary</h1>")
-    lines.append("  <table>")
-    lines.append(f"    <tr><th>AOI</th><td>{html.escape(aoi_id)}</td></tr>")
-    lines.append(f"    <tr><th>Bundle</th><td>{html.escape(bundle_id)}</td></tr>")
-    lines.append(f"    <tr><th>Report Version</th><td>{html.escape(report_version)}</td></tr>")
+        yield "  </table>"
+    yield "  <div style=\"height:12px;\"></div>"
+
+
+def _summary_table_lines(report: dict[str, Any]) -> Iterator[str]:
+    geometry_ref = report.get("aoi_geometry_ref", {})
+    yield "  <h1>AOI Report Summary</h1>"
+    yield "  <table>"
+    yield f"    <tr><th>AOI</th><td>{html.escape(str(report.get('aoi_id', '')))}</td></tr>"
+    yield f"    <tr><th>Bundle</th><td>{html.escape(str(report.get('bundle_id', '')))}</td></tr>"
+    yield f"    <tr><th>Report Version</th><td>{html.escape(str(report.get('report_version', '')))}</td></tr>"
     if geometry_ref:
         geometry_kind = html.escape(str(geometry_ref.get("kind", "")))
         geometry_value = html.escape(str(geometry_ref.get("value", "")))
-        lines.append(f"    <tr><th>Geometry Ref</th><td>{geometry_kind}: {geometry_value}</td></tr>")
-    lines.append("  </table>")
-
-    lines.append("  <h2>Inputs</h2>")
-    lines.append("  <table>")
-    lines.append("    <tr><th>Source</th><th>URI</th><th>SHA256</th><th>Content Type</th></tr>")
-    for source in inputs_sorted:
-        lines.append(
-            "    <tr>"
-            f"<td>{html.escape(str(source.get('source_id', '')))}</td>"
-            f"<td>{html.escape(str(source.get('uri', '')))}</td>"
-            f"<td><code>{html.escape(str(source.get('sha256', '')))}</code></td>"
-            f"<td>{html.escape(str(source.get('content_type', '')))}</td>"
-            "</tr>"
-        )
-    lines.append("  </table>")
-
-    lines.append("  <h2>Metrics</h2>")
-    lines.append("  <table>")
-    lines.append("    <tr><th>Metric</th><th>Value</th><th>Unit</th><th>Notes</th><th>Source</th><th>Criteria</th></tr>")
-    for row in render_metrics_rows(report):
-        metric_entry = report.get("metrics", {}).get(row["variable"], {})
-        criteria_refs = format_criteria_refs(metric_entry.get("criteria_refs") or metric_entry.get("acceptance_criteria"))
-        lines.append(
-            "    <tr>"
-            f"<td>{html.escape(row['variable'])}</td>"
-            f"<td>{html.escape(row['value'])}</td>"
-            f"<td>{html.escape(row['unit'])}</td>"
-            f"<td>{html.escape(row['notes'])}</td>"
-            f"<td>{html.escape(row['source'])}</td>"
-            f"<td>{html.escape(criteria_refs)}</td>"
-            "</tr>"
-        )
-    lines.append("  </table>")
+        yield f"    <tr><th>Geometry Ref</th><td>{geometry_kind}: {geometry_value}</td></tr>"
+    yield "  </table>"
 
-    validation = report.get("validation", {}) if isinstance(report.get("validation"), dict) else {}
-    maaamet_validation = validation.get("maaamet", {}) if isinstance(validation.get("maaamet"), dict) else {}
-    if maaamet_validation:
-        lines.append("  <h2>Maa-amet parcels</h2>")
-        lines.append("  <table>")
-        lines.append("    <tr><th>Field</th><th>Value</th></tr>")
-        for key in ["enabled", "parcel_layer", "parcel_count", "notes"]:
-            if key in maaamet_validation:
-                value = maaamet_validation.get(key)
-                lines.append(
-                    "    <tr>"
-                    f"<td>{html.escape(key)}</td>"
-                    f"<td><code>{html.escape(json.dumps(value, ensure_ascii=False))}</code></td>"
-                    "</tr>"
+
+def _inputs_lines(report: dict[str, Any]) -> Iterator[str]:
+    inputs = report.get("inputs", {}).get("sources", [])
+    yield "  <h2>Inputs</h2>"
+    yield "  <table>"
+    yield "    <tr><th>Source</th><th>URI</th><th>SHA256</th><th>Content Type</th></tr>"
+    for source in sorted(inputs, key=lambda item: str(item.get("source_id", ""))):
+        yield INPUT_ROW.render(
+            source.get("source_id", ""),
+            source.get("uri", ""),
+            source.get("sha256", ""),
+            source.get("content_type", ""),
+        )
+    yield "  </table>"
+
+
+def _metrics_lines(view: AoiReportView) -> Iterator[str]:
+    metrics = view.report.get("metrics", {})
+    yield "  <h2>Metrics</h2>"
+    yield "  <table>"
+    yield "    <tr><th>Metric</th><th>Value</th><th>Unit</th><th>Notes</th><th>Source</th><th>Criteria</th></tr>"
+    for row in view.metrics_rows:
+        metric_entry = metrics.get(row["variable"], {})
+        criteria_refs = _format_criteria_refs(metric_entry.get("criteria_refs") or metric_entry.get("acceptance_criteria"))
+        yield METRIC_ROW.render(row["variable"], row["value"], row["unit"], row["notes"], row["source"], criteria_refs)
+    yield "  </table>"
+
+
+def _field_row(key: str, value: Any) -> str:
+    return FIELD_ROW.render(key, json.dumps(value, ensure_ascii=False))
+
+
+def _maaamet_lines(maaamet_validation: dict[str, Any]) -> Iterator[str]:
+    yield "  <h2>Maa-amet parcels</h2>"
+    yield "  <table>"
+    yield "    <tr><th>Field</th><th>Value</th></tr>"
+    for key in [
+        "enabled",
+        "parcel_layer",
+        "parcel_count",
+        "notes",
+        "maaamet_land_area_ha_sum",
+        "hansen_land_area_ha_sum",
+        "land_area_diff_ha",
+        "land_area_diff_pct",
+    ]:
+        if key in maaamet_validation:
+            yield _field_row(key, maaamet_validation.get(key))
+    yield "  </table>"
+
+    parcels = maaamet_validation.get("parcels")
+    if isinstance(parcels, list):
+        yield "  <h3>Top 10 parcels (by forest area)</h3>"
+        yield "  <table>"
+        yield "    <tr><th>Parcel ID</th><th>Hansen land (ha)</th><th>Maa-amet land (ha)</th><th>Hansen forest (ha)</th><th>Maa-amet forest (ha)</th><th>Forest loss (ha)</th></tr>"
+        if parcels:
+            for row in parcels:
+                if not isinstance(row, dict):
+                    continue
+                yield PARCEL_ROW.render(
+                    row.get("parcel_id", ""),
+                    row.get("hansen_land_area_ha", ""),
+                    row.get("maaamet_land_area_ha", ""),
+                    row.get("hansen_forest_area_ha", ""),
+                    row.get("maaamet_forest_area_ha", ""),
+                    row.get("hansen_forest_loss_ha", ""),
                 )
-        for key in [
-            "maaamet_land_area_ha_sum",
-            "hansen_land_area_ha_sum",
-            "land_area_diff_ha",
-            "land_area_diff_pct",
-        ]:
-            if key in maaamet_validation:
-                value = maaamet_validation.get(key)
-                lines.append(
+        else:
+            yield "    <tr><td colspan=\"6\"><em>No Maa-amet parcels available.</em></td></tr>"
+        yield "  </table>"
+
+
+def _forest_crosscheck_lines(forest_crosscheck: dict[str, Any], run_dir: Path, html_path: Path) -> Iterator[str]:
+    yield "  <h2>Hansen vs Maa-amet forest area crosscheck</h2>"
+    yield "  <table>"
+    yield "    <tr><th>Field</th><th>Value</th></tr>"
+    for key in ["source", "outcome", "reason", "reference", "computed", "comparison"]:
+        if key in forest_crosscheck:
+            yield _field_row(key, forest_crosscheck.get(key))
+    for ref_key in ["csv_ref", "summary_ref"]:
+        ref = forest_crosscheck.get(ref_key)
+        if isinstance(ref, dict):
+            relpath = ref.get("relpath")
+            if relpath:
+                href = html.escape(relpath_from_html(run_dir, html_path, str(relpath)))
+                yield (
                     "    <tr>"
-                    f"<td>{html.escape(key)}</td>"
-                    f"<td><code>{html.escape(json.dumps(value, ensure_ascii=False))}</code></td>"
+                    f"<td>{html.escape(ref_key)}</td>"
+                    f"<td><a href=\"{href}\">{html.escape(str(relpath))}</a></td>"
                     "</tr>"
                 )
-        lines.append("  </table>")
-
-        parcels = maaamet_validation.get("parcels")
-        if isinstance(parcels, list):
-            lines.append("  <h3>Top 10 parcels (by forest area)</h3>")
-            lines.append("  <table>")
-            lines.append("    <tr><th>Parcel ID</th><th>Hansen land (ha)</th><th>Maa-amet land (ha)</th><th>Hansen forest (ha)</th><th>Maa-amet forest (ha)</th><th>Forest loss (ha)</th></tr>")
-            if parcels:
-                for row in parcels:
-                    if not isinstance(row, dict):
-                        continue
-                    lines.append(
-                        "    <tr>"
-                        f"<td>{html.escape(str(row.get('parcel_id','')))}</td>"
-                        f"<td>{html.escape(str(row.get('hansen_land_area_ha','')))}</td>"
-                        f"<td>{html.escape(str(row.get('maaamet_land_area_ha','')))}</td>"
-                        f"<td>{html.escape(str(row.get('hansen_forest_area_ha','')))}</td>"
-                        f"<td>{html.escape(str(row.get('maaamet_forest_area_ha','')))}</td>"
-                        f"<td>{html.escape(str(row.get('hansen_forest_loss_ha','')))}</td>"
-                        "</tr>"
-                    )
-            else:
-                lines.append("    <tr><td colspan=\"6\"><em>No Maa-amet parcels available.</em></td></tr>")
-            lines.append("  </table>")
+    yield "  </table>"
 
-    forest_crosscheck = validation.get("forest_area_crosscheck", {}) if isinstance(validation.get("forest_area_crosscheck"), dict) else {}
+
+def _validation_lines(report: dict[str, Any], run_dir: Path, html_path: Path) -> Iterator[str]:
+    validation = report.get("validation", {}) if isinstance(report.get("validation"), dict) else {}
+    maaamet_validation = validation.get("maaamet", {}) if isinstance(validation.get("maaamet"), dict) else {}
+    if maaamet_validation:
+        yield from _maaamet_lines(maaamet_validation)
+    forest_crosscheck = (
+        validation.get("forest_area_crosscheck", {})
+        if isinstance(validation.get("forest_area_crosscheck"), dict)
+        else {}
+    )
     if forest_crosscheck:
-        lines.append("  <h2>Hansen vs Maa-amet forest area crosscheck</h2>")
-        lines.append("  <table>")
-        lines.append("    <tr><th>Field</th><th>Value</th></tr>")
-        for key in ["source", "outcome", "reason"]:
-            if key in forest_crosscheck:
-                lines.append(
-                    "    <tr>"
-                    f"<td>{html.escape(key)}</td>"
-                    f"<td><code>{html.escape(json.dumps(forest_crosscheck.get(key), ensure_ascii=False))}</code></td>"
-                    "</tr>"
-                )
-        for key in ["reference", "computed", "comparison"]:
-            if key in forest_crosscheck:
-                lines.append(
-                    "    <tr>"
-                    f"<td>{html.escape(key)}</td>"
-                    f"<td><code>{html.escape(json.dumps(forest_crosscheck.get(key), ensure_ascii=False))}</code></td>"
-                    "</tr>"
-                )
-        for ref_key in ["csv_ref", "summary_ref"]:
-            ref = forest_crosscheck.get(ref_key)
-            if isinstance(ref, dict):
-                relpath = ref.get("relpath")
-                if relpath:
-                    href = html.escape(relpath_from_html(run_dir, html_path, str(relpath)))
-                    lines.append(
-                        "    <tr>"
-                        f"<td>{html.escape(ref_key)}</td>"
-                        f"<td><a href=\"{href}\">{html.escape(str(relpath))}</a></td>"
-                        "</tr>"
-                    )
-        lines.append("  </table>")
-
-    if map_assets and map_assets.get("config_relpath"):
-        map_config_relpath = str(map_assets.get("config_relpath"))
-        map_href = html.escape(relpath_from_html(run_dir, html_path, map_config_relpath))
-        lines.append("  <h2>Map (interactive)</h2>")
-        lines.append(f"  <p><a href=\"{map_href}\">map_config.json</a></p>")
-        lines.append("  <div id=\"map\"></div>")
-        lines.append("  <script>")
-        lines.append("    (function () {")
-        lines.append("      const map = L.map('map', { zoomControl: true });")
-        lines.append("      const satellite = L.tileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}', {")
-        lines.append("        attribution: 'Tiles © Esri — Source: Esri, Maxar, Earthstar Geographics, and the GIS User Community',")
-        lines.append("      }).addTo(map);")
-        lines.append(f"      const configUrl = '{map_href}';")
-        lines.append("      fetch(configUrl)")
-        lines.append("        .then((resp) => resp.json())")
-        lines.append("        .then((config) => {")
-        lines.append("          const bbox = config.aoi_bbox;")
-        lines.append("          const bounds = L.latLngBounds([")
-        lines.append("            [bbox.min_lat, bbox.min_lon],")
-        lines.append("            [bbox.max_lat, bbox.max_lon],")
-        lines.append("          ]);")
-        lines.append("          map.fitBounds(bounds);")
-        lines.append("          const overlays = {};")
-        lines.append("          const baseLayers = { Satellite: satellite };")
-        lines.append("          const addGeoJson = (label, url, options) => {")
-        lines.append("            if (!url) return;")
-        lines.append("            fetch(url)")
-        lines.append("              .then((r) => r.json())")
-        lines.append("              .then((data) => {")
-        lines.append("                const layer = L.geoJSON(data, options).addTo(map);")
-        lines.append("                overlays[label] = layer;")
-        lines.append("              });")
-        lines.append("          };")
-        lines.append("          addGeoJson('Forest cover 2000', config.layers.forest_2000, { style: { color: '#2e7d32', weight: 1, fillOpacity: 0.3 } });")
-        lines.append("          addGeoJson(`Forest cover ${config.latest_year}`, config.layers.forest_end_year, { style: { color: '#1b5e20', weight: 1, fillOpacity: 0.3 } });")
-        lines.append("          addGeoJson('Forest loss since 2020', config.layers.forest_loss_post_2020, { style: { color: '#c62828', weight: 1, fillOpacity: 0.4 } });")
-        lines.append("          addGeoJson('AOI boundary', config.layers.aoi_boundary, { style: { color: '#1976d2', weight: 2, fillOpacity: 0 } });")
-        lines.append("          addGeoJson('Maa-amet parcels', config.layers.parcels, {")
-        lines.append("            style: { color: '#6a1b9a', weight: 1, fillOpacity: 0.05 },")
-        lines.append("            onEachFeature: (feature, layer) => {")
-        lines.append("              const props = feature.properties || {};")
-        lines.append("              const label = `${props.parcel_id || ''} | forest_ha=${props.hansen_forest_area_ha ?? ''} | loss_ha=${props.hansen_forest_loss_ha ?? ''}`;")
-        lines.append("              layer.bindTooltip(label, { sticky: true });")
-        lines.append("            },")
-        lines.append("          });")
-        lines.append("          L.control.layers(baseLayers, overlays, { collapsed: false }).addTo(map);")
-        lines.append("        });")
-        lines.append("    })();")
-        lines.append("  </script>")
-
-    lines.append("  <h2>Assumptions & Limitations</h2>")
+        yield from _forest_crosscheck_lines(forest_crosscheck, run_dir, html_path)
+
+
+def _map_section(
+    run_dir: Path, html_path: Path, view: AoiReportView, config_relpath: str
+) -> tuple[str, str, MapInputs]:
+    """(escaped href of the declared map_config.json, escaped href the map script loads, inlined inputs)."""
+
+    inputs = view.map_inputs(run_dir)
+    return (
+        html.escape(relpath_from_html(run_dir, html_path, config_relpath)),
+        html.escape(relpath_from_html(run_dir, html_path, inputs.script_relpath)),
+        inputs,
+    )
+
+
+def _summary_map_lines(map_href: str, script_href: str, inputs: MapInputs) -> Iterator[str]:
+    yield "  <h2>Map (interactive)</h2>"
+    yield f"  <p><a href=\"{map_href}\">map_config.json</a></p>"
+    yield "  <div id=\"map\"></div>"
+    yield from map_script_lines("  ", script_href, inputs.config_json, inputs.boundary_json)
+
+
+def _assumptions_lines(assumptions: Any, result_ids: set[str]) -> Iterator[str]:
+    yield "  <h2>Assumptions & Limitations</h2>"
     if not assumptions:
-        lines.append("  <p><strong>No assumptions declared in this report.</strong></p>")
+        yield "  <p><strong>No assumptions declared in this report.</strong></p>"
     else:
-        lines.append("  <table>")
-        lines.append("    <tr><th>Assumption</th><th>Testable</th><th>Affected results</th></tr>")
-        result_ids = {anchor_id("result", r.get("result_id")) for r in results or [] if isinstance(r, dict) and r.get("result_id") is not None}
-
-        def result_link_or_error(result_id: Any) -> str:
-            if result_id is None:
-                return "<strong>missing</strong>"
-            anchor = anchor_id("result", result_id)
-            if anchor in result_ids:
-                return f"<a href=\"#{html.escape(anchor)}\">{html.escape(str(result_id))}</a>"
-            return f"<strong>missing-link</strong> {html.escape(str(result_id))}"
-
+        yield "  <table>"
+        yield "    <tr><th>Assumption</th><th>Testable</th><th>Affected results</th></tr>"
         if isinstance(assumptions, list):
             for entry in assumptions:
                 if isinstance(entry, dict):
                     text = entry.get("text") or entry.get("assumption") or entry.get("statement")
                     testable = entry.get("testable")
                     affected = entry.get("affected_results") or entry.get("results") or []
-                    assumption_text = json.dumps(text, sort_keys=True, ensure_ascii=False) if text is not None else json.dumps(entry, sort_keys=True, ensure_ascii=False)
+                    assumption_text = _json_code(text if text is not None else entry)
                     testable_text = "" if testable is None else str(testable)
                     if testable is False:
                         testable_text = f"{testable_text} (not testable)"
                     if isinstance(affected, list):
-                        affected_links = ", ".join(result_link_or_error(rid) for rid in affected) if affected else "<strong>missing</strong>"
+                        affected_links = (
+                            ", ".join(_link_or_error("result", rid, result_ids) for rid in affected)
+                            if affected
+                            else "<strong>missing</strong>"
+                        )
                     else:
-                        affected_links = result_link_or_error(affected)
-                    lines.append(
+                        affected_links = _link_or_error("result", affected, result_ids)
+                    yield (
                         "    <tr>"
-                        f"<td><code>{html.escape(assumption_text)}</code></td>"
+                        f"<td><code>{assumption_text}</code></td>"
                         f"<td>{html.escape(testable_text)}</td>"
                         f"<td>{affected_links}</td>"
                         "</tr>"
                     )
                 else:
-                    value = json.dumps(entry, sort_keys=True, ensure_ascii=False)
-                    lines.append(
+                    yield (
                         "    <tr>"
-                        f"<td><code>{html.escape(value)}</code></td>"
+                        f"<td><code>{_json_code(entry)}</code></td>"
                         "<td></td>"
                         "<td><strong>missing</strong></td>"
                         "</tr>"
                     )
         else:
-            value = json.dumps(assumptions, sort_keys=True, ensure_ascii=False)
-            lines.append(
+            yield (
                 "    <tr>"
-                f"<td><code>{html.escape(value)}</code></td>"
+                f"<td><code>{_json_code(assumptions)}</code></td>"
                 "<td></td>"
                 "<td><strong>missing</strong></td>"
                 "</tr>"
             )
-        lines.append("  </table>")
-    lines.append("  <div style=\"height:12px;\"></div>")
+        yield "  </table>"
+    yield "  <div style=\"height:12px;\"></div>"
+
 
-    lines.append("  <h2>Results</h2>")
+def _results_lines(results: Any) -> Iterator[str]:
+    yield "  <h2>Results</h2>"
     if not results:
-        lines.append("  <p><em>No results declared.</em></p>")
+        yield "  <p><em>No results declared.</em></p>"
     else:
-        lines.append("  <table>")
-        lines.append("    <tr><th>Result</th><th>Status</th><th>Criteria</th></tr>")
+        yield "  <table>"
+        yield "    <tr><th>Result</th><th>Status</th><th>Criteria</th></tr>"
         if isinstance(results, list):
             for entry in results:
                 if not isinstance(entry, dict):
-                    value = json.dumps(entry, sort_keys=True, ensure_ascii=False)
-                    lines.append(
+                    yield (
                         "    <tr>"
-                        f"<td colspan=\"3\"><code>{html.escape(value)}</code></td>"
+                        f"<td colspan=\"3\"><code>{_json_code(entry)}</code></td>"
                         "</tr>"
                     )
                     continue
                 result_id = entry.get("result_id")
                 status = entry.get("status")
-                criteria_ids = entry.get("criteria_ids") or []
-                result_anchor = anchor_id("result", result_id)
-                criteria_links = []
-                for cid in criteria_ids:
-                    criteria_links.append(f"<a href=\"#{html.escape(anchor_id('criteria', cid))}\">{html.escape(str(cid))}</a>")
-                criteria_html = ", ".join(criteria_links) if criteria_links else ""
-                lines.append(
+                criteria_html = ", ".join(
+                    f"<a href=\"#{html.escape(_anchor_id('criteria', cid))}\">{html.escape(str(cid))}</a>"
+                    for cid in entry.get("criteria_ids") or []
+                )
+                yield (
                     "    <tr>"
-                    f"<td id=\"{html.escape(result_anchor)}\">{html.escape(str(result_id))}</td>"
+                    f"<td id=\"{html.escape(_anchor_id('result', result_id))}\">{html.escape(str(result_id))}</td>"
                     f"<td>{html.escape(str(status)) if status is not None else ''}</td>"
                     f"<td>{criteria_html}</td>"
                     "</tr>"
                 )
         else:
-            value = json.dumps(results, sort_keys=True, ensure_ascii=False)
-            lines.append(
+            yield (
                 "    <tr>"
-                f"<td colspan=\"3\"><code>{html.escape(value)}</code></td>"
+                f"<td colspan=\"3\"><code>{_json_code(results)}</code></td>"
                 "</tr>"
             )
-        lines.append("  </table>")
-    lines.append("  <div style=\"height:12px;\"></div>")
+        yield "  </table>"
+    yield "  <div style=\"height:12px;\"></div>"
+
 
-    lines.append("  <h2>Evidence Artifacts</h2>")
-    lines.append("  <ul>")
+def _evidence_list_lines(evidence_sorted: list[dict[str, Any]], run_dir: Path, html_path: Path) -> Iterator[str]:
+    yield "  <h2>Evidence Artifacts</h2>"
+    yield "  <ul>"
     for entry in evidence_sorted:
         relpath = str(entry.get("relpath", ""))
         if not relpath:
             continue
-        href = html.escape(relpath_from_html(run_dir, html_path, relpath))
-        label = html.escape(relpath)
-        lines.append(f"    <li><a href=\"{href}\">{label}</a></li>")
-    lines.append("  </ul>")
+        yield SUMMARY_EVIDENCE_ITEM.render(relpath_from_html(run_dir, html_path, relpath), relpath)
+    yield "  </ul>"
 
-    lines.append("</body>")
-    lines.append("</html>")
-    return "\n".join(lines) + "\n"
 
+def iter_report_html(
+    report: dict[str, Any], run_dir: Path, html_relpath: str, view: AoiReportView | None = None
+) -> Iterator[str]:
+    """Yield the lines of the per-AOI summary page (<aoi_id>.html), section by section."""
 
-def render_run_report_html(report: dict[str, Any], run_dir: Path, report_json_name: str = "aoi_report.json") -> str:
-    aoi_id = str(report.get("aoi_id", ""))
-    bundle_id = str(report.get("bundle_id", ""))
-    generated = str(report.get("generated_at_utc", ""))
-    html_path = run_dir / "report.html"
-    map_assets = report.get("map_assets") if isinstance(report.get("map_assets"), dict) else None
+    view = view or AoiReportView(report)
+    html_path = run_dir / html_relpath
+    report_metadata = view.report_metadata
 
-    report_metadata = report.get("report_metadata") or {}
-    regulatory_context = {}
-    if isinstance(report_metadata, dict):
-        regulatory_context = report_metadata.get("regulatory_context") or {}
+    yield from _summary_head_lines(view.aoi_id, view.map_config_relpath is not None)
+    if not report_metadata:
+        yield ALERT_BOX.render("INVALID FOR INSPECTION:", " report_metadata is missing.")
+    else:
+        yield from _report_intent_lines(report_metadata)
+        yield from _traceability_lines(report.get("regulatory_traceability"), view)
+        yield "  <div style=\"height:12px;\"></div>"
+    yield from _evidence_registry_lines(view.evidence_registry, view.evidence_classes)
+    yield from _acceptance_criteria_lines(view.acceptance_criteria)
+    yield from _summary_table_lines(report)
+    yield from _inputs_lines(report)
+    yield from _metrics_lines(view)
+    yield from _validation_lines(report, run_dir, html_path)
+    if view.map_config_relpath is not None:
+        yield from _summary_map_lines(*_map_section(run_dir, html_path, view, view.map_config_relpath))
+    yield from _assumptions_lines(view.assumptions, view.result_anchor_ids)
+    yield from _results_lines(view.results)
+    yield from _evidence_list_lines(view.evidence_sorted, run_dir, html_path)
+    yield "</body>"
+    yield "</html>"
+
+
+def render_report_html_to(
+    fp: TextIO, report: dict[str, Any], run_dir: Path, html_relpath: str, view: AoiReportView | None = None
+) -> None:
+    write_lines(fp, iter_report_html(report, run_dir, html_relpath, view))
+
+
+def render_report_html(
+    report: dict[str, Any], run_dir: Path, html_relpath: str, view: AoiReportView | None = None
+) -> str:
+    buffer = StringIO()
+    render_report_html_to(buffer, report, run_dir, html_relpath, view)
+    return buffer.getvalue()
 
-    results = report.get("results") or []
-    evidence = report.get("evidence_artifacts") or []
 
-    def _find_relpath(suffix: str) -> str | None:
-        for entry in evidence:
-            relpath = entry.get("relpath", "") if isinstance(entry, dict) else ""
-            if relpath.endswith(suffix):
-                return relpath
-        return None
+def _run_head_lines(aoi_id: str, with_map: bool) -> Iterator[str]:
+    yield from DOCUMENT_START_LINES
+    yield f"  <title>AOI Report — {html.escape(aoi_id)}</title>"
+    yield from RUN_STYLE_LINES
+    if with_map:
+        yield from LEAFLET_HEAD_LINES
+    yield "</head>"
+    yield "<body>"
 
-    html_relpath = find_html_relpath(report)
-    report_json_relpath = _find_relpath(f"{aoi_id}.json") or _find_relpath(".json") or ""
-    metrics_relpath = _find_relpath(f"{aoi_id}/metrics.csv") or _find_relpath("metrics.csv") or ""
+
+def _run_core_links(report: dict[str, Any], report_json_name: str, index: EvidenceIndex) -> list[tuple[str, str]]:
+    aoi_id = str(report.get("aoi_id", ""))
+    html_relpath = find_html_relpath(report, index)
+    report_json_relpath = index.find_suffix(f"{aoi_id}.json") or index.find_suffix(".json") or ""
+    metrics_relpath = index.find_suffix(f"{aoi_id}/metrics.csv") or index.find_suffix("metrics.csv") or ""
     aoi_geojson_relpath = report.get("aoi_geometry_ref", {}).get("value", "")
+    report_version = report.get("report_version", "aoi_report_v1")
 
     core_links: list[tuple[str, str]] = [
         (report_json_name, report_json_name),
-        (f"reports/{report.get('report_version', 'aoi_report_v1')}/{aoi_id}.html", html_relpath),
-        (f"reports/{report.get('report_version', 'aoi_report_v1')}/{aoi_id}.json", report_json_relpath),
-        (f"reports/{report.get('report_version', 'aoi_report_v1')}/{aoi_id}/metrics.csv", metrics_relpath),
+        (f"reports/{report_version}/{aoi_id}.html", html_relpath),
+        (f"reports/{report_version}/{aoi_id}.json", report_json_relpath),
+        (f"reports/{report_version}/{aoi_id}/metrics.csv", metrics_relpath),
         ("inputs/aoi.geojson", aoi_geojson_relpath),
     ]
     deduped_links: list[tuple[str, str]] = []
@@ -686,12 +877,10 @@ def render_run_report_html(report: dict[str, Any], run_dir: Path, report_json_na
             continue
         seen.add(relpath)
         deduped_links.append((label, relpath))
+    return deduped_links
 
-    evidence_sorted = sorted(
-        [entry for entry in evidence if isinstance(entry, dict)],
-        key=lambda item: str(item.get("relpath", "")),
-    )
 
+def _run_status_map(results: list[Any]) -> dict[str, list[str]]:
     status_map: dict[str, list[str]] = {}
     for entry in results:
         if not isinstance(entry, dict):
@@ -701,16 +890,14 @@ def render_run_report_html(report: dict[str, Any], run_dir: Path, report_json_na
         if not status:
             status = "unknown"
         status_map.setdefault(status, []).append(result_id)
+    return status_map
 
-    computed_results = sorted(status_map.get("computed", []))
-    placeholder_results = sorted(status_map.get("placeholder", []))
-    other_statuses = sorted(
-        [
-            f"{status}: {', '.join(sorted(ids)) or '(none)'}"
-            for status, ids in status_map.items()
-            if status not in {"computed", "placeholder"}
-        ]
-    )
+
+def _run_evidence_gaps(report: dict[str, Any]) -> list[str]:
+    report_metadata = report.get("report_metadata") or {}
+    regulatory_context = {}
+    if isinstance(report_metadata, dict):
+        regulatory_context = report_metadata.get("regulatory_context") or {}
 
     gaps: list[str] = []
     for dep in report.get("external_dependencies", []) or []:
@@ -751,231 +938,357 @@ def render_run_report_html(report: dict[str, Any], run_dir: Path, report_json_na
     if not policy_refs:
         gaps.append("policy_mapping_refs is empty")
 
-    gaps = sorted(dict.fromkeys(gaps))
-
-    lines: list[str] = []
-    lines.append("<!doctype html>")
-    lines.append('<html lang="en">')
-    lines.append("<head>")
-    lines.append("  <meta charset=\"utf-8\" />")
-    lines.append("  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />")
-    lines.append(f"  <title>AOI Report — {html.escape(aoi_id)}</title>")
-    lines.append("  <style>")
-    lines.append("    :root { --fg:#111; --bg:#fff; --muted:#666; --card:#f6f7f9; --link:#0b5fff; }")
-    lines.append("    body { font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, sans-serif;")
-    lines.append("           color: var(--fg); background: var(--bg); margin: 0; }")
-    lines.append("    header { border-bottom: 1px solid #e7e7e7; background: #fff; position: sticky; top: 0; }")
-    lines.append("    .wrap { max-width: 980px; margin: 0 auto; padding: 16px 20px; }")
-    lines.append("    nav a { margin-right: 14px; text-decoration: none; color: var(--link); font-weight: 600; }")
-    lines.append("    nav a.active { color: var(--fg); }")
-    lines.append("    main { padding: 18px 20px 40px; }")
-    lines.append("    h1 { margin: 0 0 6px; font-size: 22px; }")
-    lines.append("    p { line-height: 1.5; }")
-    lines.append("    .muted { color: var(--muted); }")
-    lines.append("    .card { background: var(--card); border: 1px solid #e8eaee; border-radius: 12px; padding: 14px 14px; }")
-    lines.append("    ul { padding-left: 18px; }")
-    lines.append("    code { background: #f1f1f1; padding: 1px 4px; border-radius: 6px; }")
-    lines.append("    #map { height: 420px; border: 1px solid #ddd; border-radius: 8px; margin: 12px 0 16px; background: #fafafa; }")
-    lines.append("  </style>")
-    if map_assets and map_assets.get("config_relpath"):
-        lines.append(
-            "  <link rel=\"stylesheet\" href=\"https://unpkg.com/leaflet@1.9.4/dist/leaflet.css\" "
-            "integrity=\"sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY=\" crossorigin=\"\" />"
-        )
-        lines.append(
-            "  <script src=\"https://unpkg.com/leaflet@1.9.4/dist/leaflet.js\" "
-            "integrity=\"sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo=\" crossorigin=\"\"></script>"
-        )
-    lines.append("</head>")
-    lines.append("<body>")
-    lines.append("  <header>")
-    lines.append("    <div class=\"wrap\">")
-    lines.append("      <nav>")
-    lines.append("        <a href=\"../../../index.html\">Home</a>")
-    lines.append("        <a href=\"../../../articles/index.html\">Articles</a>")
-    lines.append("        <a href=\"../../../dependencies/index.html\">Dependencies</a>")
-    lines.append("        <a href=\"../../../regulation/links.html\">Regulation</a>")
-    lines.append("        <a href=\"../../../regulation/sources.html\">Sources</a>")
-    lines.append("        <a href=\"../../../regulation/policy_to_evidence_spine.html\">Spine</a>")
-    lines.append("        <a href=\"../../../views/index.html\">Views</a>")
-    lines.append("        <a href=\"../../index.html\" class=\"active\">AOI Reports</a>")
-    lines.append("        <a href=\"../../../dao_stakeholders/index.html\">DAO (Stakeholders)</a>")
-    lines.append("        <a href=\"../../../dao_dev/index.html\">DAO (Developers)</a>")
-    lines.append("      </nav>")
-    lines.append("    </div>")
-    lines.append("  </header>")
-    lines.append("  <main>")
-    lines.append("    <div class=\"wrap\">")
-    lines.append("      <p class=\"muted\"><a href=\"../../index.html\">Back to AOI runs</a></p>")
-    lines.append("      <h1>AOI Report</h1>")
-    lines.append(
+    return sorted(dict.fromkeys(gaps))
+
+
+def _run_intro_lines(report: dict[str, Any]) -> Iterator[str]:
+    yield "  <main>"
+    yield "    <div class=\"wrap\">"
+    yield "      <p class=\"muted\"><a href=\"../../index.html\">Back to AOI runs</a></p>"
+    yield "      <h1>AOI Report</h1>"
+    yield (
         "      <p><b>AOI</b>: <code>"
-        + html.escape(aoi_id)
+        + html.escape(str(report.get("aoi_id", "")))
         + "</code><br />\n"
         + "         <b>Bundle</b>: <code>"
-        + html.escape(bundle_id)
+        + html.escape(str(report.get("bundle_id", "")))
         + "</code><br />\n"
         + "         <b>Generated (UTC)</b>: <code>"
-        + html.escape(generated)
+        + html.escape(str(report.get("generated_at_utc", "")))
         + "</code></p>"
     )
 
-    lines.append("      <div class=\"card\">")
-    lines.append("        <h2>Core inspection artifacts</h2>")
-    lines.append("        <ul>")
-    for label, relpath in deduped_links:
-        href = html.escape(relpath_from_html(run_dir, html_path, relpath))
-        lines.append(f"          <li><a href=\"{href}\">{html.escape(relpath)}</a> ({html.escape(label)})</li>")
-    lines.append("        </ul>")
-    lines.append("        <p class=\"muted\">If a manifest is present in this bundle, it should also be linked from this page.</p>")
-    lines.append("      </div>")
-
-    if map_assets and map_assets.get("config_relpath"):
-        map_config_relpath = str(map_assets.get("config_relpath"))
-        map_href = html.escape(relpath_from_html(run_dir, html_path, map_config_relpath))
-        lines.append("      <div class=\"card\">")
-        lines.append("        <h2>Map (interactive)</h2>")
-        lines.append(f"        <p><a href=\"{map_href}\">map_config.json</a></p>")
-        lines.append("        <div id=\"map\"></div>")
-        lines.append("        <script>")
-        lines.append("          (function () {")
-        lines.append("            const map = L.map('map', { zoomControl: true });")
-        lines.append("            const satellite = L.tileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}', {")
-        lines.append("              attribution: 'Tiles © Esri — Source: Esri, Maxar, Earthstar Geographics, and the GIS User Community',")
-        lines.append("            }).addTo(map);")
-        lines.append(f"            const configUrl = '{map_href}';")
-        lines.append("            fetch(configUrl)")
-        lines.append("              .then((resp) => resp.json())")
-        lines.append("              .then((config) => {")
-        lines.append("                const bbox = config.aoi_bbox;")
-        lines.append("                const bounds = L.latLngBounds([")
-        lines.append("                  [bbox.min_lat, bbox.min_lon],")
-        lines.append("                  [bbox.max_lat, bbox.max_lon],")
-        lines.append("                ]);")
-        lines.append("                map.fitBounds(bounds);")
-        lines.append("                const overlays = {};")
-        lines.append("                const baseLayers = { Satellite: satellite };")
-        lines.append("                const addGeoJson = (label, url, options) => {")
-        lines.append("                  if (!url) return;")
-        lines.append("                  fetch(url)")
-        lines.append("                    .then((r) => r.json())")
-        lines.append("                    .then((data) => {")
-        lines.append("                      const layer = L.geoJSON(data, options).addTo(map);")
-        lines.append("                      overlays[label] = layer;")
-        lines.append("                    });")
-        lines.append("                };")
-        lines.append("                addGeoJson('Forest cover 2000', config.layers.forest_2000, { style: { color: '#2e7d32', weight: 1, fillOpacity: 0.3 } });")
-        lines.append("                addGeoJson(`Forest cover ${config.latest_year}`, config.layers.forest_end_year, { style: { color: '#1b5e20', weight: 1, fillOpacity: 0.3 } });")
-        lines.append("                addGeoJson('Forest loss since 2020', config.layers.forest_loss_post_2020, { style: { color: '#c62828', weight: 1, fillOpacity: 0.4 } });")
-        lines.append("                addGeoJson('AOI boundary', config.layers.aoi_boundary, { style: { color: '#1976d2', weight: 2, fillOpacity: 0 } });")
-        lines.append("                addGeoJson('Maa-amet parcels', config.layers.parcels, {")
-        lines.append("                  style: { color: '#6a1b9a', weight: 1, fillOpacity: 0.05 },")
-        lines.append("                  onEachFeature: (feature, layer) => {")
-        lines.append("                    const props = feature.properties || {};")
-        lines.append("                    const label = `${props.parcel_id || ''} | forest_ha=${props.hansen_forest_area_ha ?? ''} | loss_ha=${props.hansen_forest_loss_ha ?? ''}`;")
-        lines.append("                    layer.bindTooltip(label, { sticky: true });")
-        lines.append("                  },")
-        lines.append("                });")
-        lines.append("                L.control.layers(baseLayers, overlays, { collapsed: false }).addTo(map);")
-        lines.append("              });")
-        lines.append("          })();")
-        lines.append("        </script>")
-        lines.append("      </div>")
-
-    lines.append("      <div class=\"card\">")
-    lines.append("        <h2>What this example demonstrates</h2>")
-    lines.append("        <ul>")
-    lines.append(
+
+def _run_core_links_lines(core_links: list[tuple[str, str]], run_dir: Path, html_path: Path) -> Iterator[str]:
+    yield "      <div class=\"card\">"
+    yield "        <h2>Core inspection artifacts</h2>"
+    yield "        <ul>"
+    for label, relpath in core_links:
+        yield RUN_CORE_LINK_ITEM.render(relpath_from_html(run_dir, html_path, relpath), relpath, label)
+    yield "        </ul>"
+    yield "        <p class=\"muted\">If a manifest is present in this bundle, it should also be linked from this page.</p>"
+    yield "      </div>"
+
+
+def _run_map_lines(map_href: str, script_href: str, inputs: MapInputs) -> Iterator[str]:
+    yield "      <div class=\"card\">"
+    yield "        <h2>Map (interactive)</h2>"
+    yield f"        <p><a href=\"{map_href}\">map_config.json</a></p>"
+    yield "        <div id=\"map\"></div>"
+    yield from map_script_lines("        ", script_href, inputs.config_json, inputs.boundary_json)
+    yield "      </div>"
+
+
+def _run_demonstrates_lines(evidence_count: int, report_json_name: str, status_map: dict[str, list[str]]) -> Iterator[str]:
+    computed_results = sorted(status_map.get("computed", []))
+    placeholder_results = sorted(status_map.get("placeholder", []))
+    other_statuses = sorted(
+        [
+            f"{status}: {', '.join(sorted(ids)) or '(none)'}"
+            for status, ids in status_map.items()
+            if status not in {"computed", "placeholder"}
+        ]
+    )
+    yield "      <div class=\"card\">"
+    yield "        <h2>What this example demonstrates</h2>"
+    yield "        <ul>"
+    yield (
         "          <li>Inspectable artifacts with links + hashes ("
-        + str(len(evidence_sorted))
+        + str(evidence_count)
         + f" declared in <code>{html.escape(report_json_name)}</code>).</li>"
     )
-    lines.append("          <li>Computed vs placeholder results are declared in <code>results[].status</code>.</li>")
+    yield "          <li>Computed vs placeholder results are declared in <code>results[].status</code>.</li>"
     if computed_results:
-        lines.append(
-            "          <li>Computed results: <code>"
-            + html.escape(", ".join(computed_results))
-            + "</code>.</li>"
-        )
+        yield "          <li>Computed results: <code>" + html.escape(", ".join(computed_results)) + "</code>.</li>"
     if placeholder_results:
-        lines.append(
-            "          <li>Placeholder results: <code>"
-            + html.escape(", ".join(placeholder_results))
-            + "</code>.</li>"
-        )
+        yield "          <li>Placeholder results: <code>" + html.escape(", ".join(placeholder_results)) + "</code>.</li>"
     if other_statuses:
-        lines.append(
-            "          <li>Other status values: <code>"
-            + html.escape("; ".join(other_statuses))
-            + "</code>.</li>"
-        )
-    lines.append("          <li>Inspection shows declared evidence, not certification or compliance.</li>")
-    lines.append("        </ul>")
-    lines.append("      </div>")
+        yield "          <li>Other status values: <code>" + html.escape("; ".join(other_statuses)) + "</code>.</li>"
+    yield "          <li>Inspection shows declared evidence, not certification or compliance.</li>"
+    yield "        </ul>"
+    yield "      </div>"
+
 
-    lines.append("      <div class=\"card\">")
-    lines.append("        <h2>Known evidence gaps (for DAO)</h2>")
+def _run_gaps_lines(gaps: list[str], report_json_name: str) -> Iterator[str]:
+    yield "      <div class=\"card\">"
+    yield "        <h2>Known evidence gaps (for DAO)</h2>"
     if gaps:
-        lines.append("        <ul>")
+        yield "        <ul>"
         for gap in gaps:
-            lines.append(f"          <li>{html.escape(gap)}</li>")
-        lines.append("        </ul>")
+            yield f"          <li>{html.escape(gap)}</li>"
+        yield "        </ul>"
     else:
-        lines.append(
+        yield (
             "        <p class=\"muted\">No gaps detected from <code>"
             + html.escape(report_json_name)
             + "</code>.</p>"
         )
-    lines.append("      </div>")
+    yield "      </div>"
+
 
-    lines.append("      <div class=\"card\">")
-    lines.append("        <h2>Declared evidence artifacts</h2>")
-    lines.append("        <ul>")
+def _run_evidence_lines(evidence_sorted: list[dict[str, Any]], run_dir: Path, html_path: Path) -> Iterator[str]:
+    yield "      <div class=\"card\">"
+    yield "        <h2>Declared evidence artifacts</h2>"
+    yield "        <ul>"
     for entry in evidence_sorted:
         relpath = str(entry.get("relpath", ""))
         if not relpath:
             continue
-        href = html.escape(relpath_from_html(run_dir, run_dir / "report.html", relpath))
-        lines.append(f"          <li><a href=\"{href}\">{html.escape(relpath)}</a></li>")
-    lines.append("        </ul>")
-    lines.append("      </div>")
+        yield RUN_EVIDENCE_ITEM.render(relpath_from_html(run_dir, html_path, relpath), relpath)
+    yield "        </ul>"
+    yield "      </div>"
+
+
+def iter_run_report_html(
+    report: dict[str, Any],
+    run_dir: Path,
+    report_json_name: str = "aoi_report.json",
+    view: AoiReportView | None = None,
+) -> Iterator[str]:
+    """Yield the lines of the run-level report.html, section by section."""
+
+    view = view or AoiReportView(report)
+    html_path = run_dir / RUN_REPORT_HTML
+    evidence_sorted = view.evidence_sorted
+    core_links = _run_core_links(report, report_json_name, view.index)
+
+    yield from _run_head_lines(view.aoi_id, view.map_config_relpath is not None)
+    yield from RUN_HEADER_LINES
+    yield from _run_intro_lines(report)
+    yield from _run_core_links_lines(core_links, run_dir, html_path)
+    if view.map_config_relpath is not None:
+        yield from _run_map_lines(*_map_section(run_dir, html_path, view, view.map_config_relpath))
+    yield from _run_demonstrates_lines(len(evidence_sorted), report_json_name, view.status_map)
+    yield from _run_gaps_lines(view.evidence_gaps, report_json_name)
+    yield from _run_evidence_lines(evidence_sorted, run_dir, html_path)
+    yield "    </div>"
+    yield "  </main>"
+    yield "</body>"
+    yield "</html>"
+
+
+def render_run_report_html_to(
+    fp: TextIO,
+    report: dict[str, Any],
+    run_dir: Path,
+    report_json_name: str = "aoi_report.json",
+    view: AoiReportView | None = None,
+) -> None:
+    write_lines(fp, iter_run_report_html(report, run_dir, report_json_name, view))
+
+
+def render_run_report_html(
+    report: dict[str, Any],
+    run_dir: Path,
+    report_json_name: str = "aoi_report.json",
+    view: AoiReportView | None = None,
+) -> str:
+    buffer = StringIO()
+    render_run_report_html_to(buffer, report, run_dir, report_json_name, view)
+    return buffer.getvalue()
+
+
+def unlink_if_shared(path: Path) -> None:
+    """Drop a hardlinked file before rewriting it in place.
 
-    lines.append("    </div>")
-    lines.append("  </main>")
-    lines.append("</body>")
-    lines.append("</html>")
-    return "\n".join(lines) + "\n"
+    Deduplicated artefacts share an inode with the site object store
+    (dedup_evidence_objects.py); writing through the link would change every copy.
+    """
+
+    try:
+        if path.stat().st_nlink > 1:
+            path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def open_text_for_write(path: Path) -> TextIO:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    unlink_if_shared(path)
+    return path.open("w", encoding="utf-8")
 
 
 def write_text(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    unlink_if_shared(path)
     path.write_text(content, encoding="utf-8")
+    profiling.add_written_file(path)
 
 
 def sha256_hex(path: Path) -> str:
-    hasher = sha256()
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(65536), b""):
+        if os.fstat(handle.fileno()).st_size >= MMAP_HASH_THRESHOLD:
+            try:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return sha256(mapped).hexdigest()
+            except (OSError, ValueError):
+                handle.seek(0)
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        hasher = sha256()
+        for chunk in iter(lambda: handle.read(HASH_BUFFER_SIZE), b""):
             hasher.update(chunk)
     return hasher.hexdigest()
 
 
-def render_aoi_run(run_dir: Path, report_json_name: str = "aoi_report.json") -> RenderedArtifacts:
+def sha256_hex_many(paths: list[Path], workers: int = DEFAULT_HASH_WORKERS) -> list[str]:
+    """Hash files concurrently; hashlib releases the GIL, so threads overlap I/O and hashing.
+
+    Digests are returned in the order of paths.
+    """
+
+    if workers <= 1 or len(paths) <= 1:
+        return [sha256_hex(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        return list(executor.map(sha256_hex, paths))
+
+
+def render_cache_key(
+    report: dict[str, Any], inputs: dict[str, Any] | None = None, output_relpaths: Iterable[str] = ()
+) -> str:
+    """SHA-256 of the report without its outputs' digests, plus any extra render inputs.
+
+    update_evidence_hashes writes the sha256/size_bytes of the renderer's own outputs
+    back into the report, so those entries are excluded from the key; otherwise every
+    --update-json publish would invalidate the cache it just produced. Every other
+    evidence digest is rendered into <aoi_id>.json and stays part of the key.
+    """
+
+    canonical = dict(report)
+    evidence = report.get("evidence_artifacts")
+    outputs = set(output_relpaths)
+    if isinstance(evidence, list) and outputs:
+        canonical["evidence_artifacts"] = [
+            {k: v for k, v in entry.items() if k not in {"sha256", "size_bytes"}}
+            if isinstance(entry, dict) and entry.get("relpath") in outputs
+            else entry
+            for entry in evidence
+        ]
+    if inputs:
+        canonical = {"inputs": inputs, "report": canonical}
+    payload = json_codec.dumps_compact(canonical, sort_keys=True)
+    return sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_render_cache(run_dir: Path) -> dict[str, Any] | None:
+    cache_path = run_dir / RENDER_CACHE_NAME
+    if not cache_path.is_file():
+        return None
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return cache if isinstance(cache, dict) else None
+
+
+def render_cache_is_fresh(
+    run_dir: Path,
+    cache: dict[str, Any] | None,
+    *,
+    input_sha256: str,
+    report_json_name: str,
+    output_relpaths: list[str],
+) -> bool:
+    if not cache:
+        return False
+    if cache.get("renderer_version") != RENDERER_VERSION:
+        return False
+    if cache.get("report_json_name") != report_json_name or cache.get("input_sha256") != input_sha256:
+        return False
+    outputs = cache.get("outputs")
+    if not isinstance(outputs, dict) or sorted(outputs) != sorted(output_relpaths):
+        return False
+    # Output digests come from .digest_cache.json while size, mtime_ns and inode are
+    # unchanged, so a warm no-op check does not re-read the outputs.
+    digests = DigestCache.for_run(run_dir)
+    try:
+        for relpath in output_relpaths:
+            output_path = run_dir / relpath
+            if not output_path.is_file():
+                return False
+            stat = output_path.stat()
+            digest = digests.lookup(relpath, stat)
+            if digest is None:
+                digest = sha256_hex(output_path)
+                digests.store(relpath, stat, digest)
+            if digest != outputs[relpath]:
+                return False
+        return True
+    finally:
+        digests.save()
+
+
+def write_render_cache(run_dir: Path, *, input_sha256: str, report_json_name: str, output_relpaths: list[str]) -> None:
+    if profiling.enabled():
+        profiling.add_read(sum((run_dir / relpath).stat().st_size for relpath in output_relpaths))
+    cache = {
+        "input_sha256": input_sha256,
+        "outputs": {relpath: sha256_hex(run_dir / relpath) for relpath in sorted(output_relpaths)},
+        "renderer_version": RENDERER_VERSION,
+        "report_json_name": report_json_name,
+    }
+    write_text(run_dir / RENDER_CACHE_NAME, json.dumps(cache, sort_keys=True, indent=2) + "\n")
+
+
+def render_aoi_run(run_dir: Path, report_json_name: str = "aoi_report.json", force: bool = False) -> RenderedArtifacts:
+    """Render the run's HTML/JSON/CSV outputs and report.html.
+
+    Rendering and writing are skipped when .render_cache.json shows the same report
+    content, renderer version and unchanged outputs; pass force=True to re-render.
+    """
+
+    with profiling.span("render_aoi_run"):
+        return _render_aoi_run(run_dir, report_json_name, force)
+
+
+def _render_aoi_run(run_dir: Path, report_json_name: str, force: bool) -> RenderedArtifacts:
     report_path = run_dir / report_json_name
     report = load_report(report_path)
 
-    html_relpath = find_html_relpath(report)
-    json_relpath = find_artifact_relpath(report, ".json")
-    metrics_relpath = find_artifact_relpath(report, "metrics.csv")
-
-    html_content = render_report_html(report, run_dir, html_relpath)
-    report_json_content = render_report_json(report)
-    metrics_csv_content = render_metrics_csv(report)
+    view = AoiReportView(report)
+    html_relpath = find_html_relpath(report, view.index)
+    json_relpath = find_artifact_relpath(report, ".json", view.index)
+    metrics_relpath = find_artifact_relpath(report, "metrics.csv", view.index)
+    output_relpaths = list(dict.fromkeys([html_relpath, json_relpath, metrics_relpath, RUN_REPORT_HTML]))
+
+    # The map config and AOI boundary are inlined into both pages.
+    with profiling.span("render_cache_check"):
+        render_inputs = view.map_inputs(run_dir).cache_inputs() if view.map_config_relpath is not None else {}
+        input_sha256 = render_cache_key(report, render_inputs, output_relpaths)
+        fresh = not force and render_cache_is_fresh(
+            run_dir,
+            load_render_cache(run_dir),
+            input_sha256=input_sha256,
+            report_json_name=report_json_name,
+            output_relpaths=output_relpaths,
+        )
+    if fresh:
+        return RenderedArtifacts(
+            html_relpath=html_relpath,
+            json_relpath=json_relpath,
+            metrics_relpath=metrics_relpath,
+            cached=True,
+        )
 
-    write_text(run_dir / html_relpath, html_content)
-    write_text(run_dir / json_relpath, report_json_content)
-    write_text(run_dir / metrics_relpath, metrics_csv_content)
-    write_text(run_dir / "report.html", render_run_report_html(report, run_dir, report_json_name=report_json_name))
+    with profiling.span("render_report_html"):
+        with open_text_for_write(run_dir / html_relpath) as fp:
+            render_report_html_to(fp, report, run_dir, html_relpath, view)
+        profiling.add_written_file(run_dir / html_relpath)
+    with profiling.span("render_report_json"):
+        write_text(run_dir / json_relpath, render_report_json(report))
+    with profiling.span("render_metrics_csv"):
+        write_text(run_dir / metrics_relpath, render_metrics_csv(report, view))
+    with profiling.span("render_run_report_html"):
+        with open_text_for_write(run_dir / RUN_REPORT_HTML) as fp:
+            render_run_report_html_to(fp, report, run_dir, report_json_name=report_json_name, view=view)
+        profiling.add_written_file(run_dir / RUN_REPORT_HTML)
+    with profiling.span("write_render_cache"):
+        write_render_cache(
+            run_dir,
+            input_sha256=input_sha256,
+            report_json_name=report_json_name,
+            output_relpaths=output_relpaths,
+        )
 
     return RenderedArtifacts(
         html_relpath=html_relpath,
@@ -984,23 +1297,120 @@ def render_aoi_run(run_dir: Path, report_json_name: str = "aoi_report.json") ->
     )
 
 
-def update_evidence_hashes(run_dir: Path, report: dict[str, Any]) -> dict[str, Any]:
-    updates = {}
-    for entry in report.get("evidence_artifacts", []):
+class DigestCache:
+    """Persistent relpath -> SHA-256 cache for artefacts in one run directory.
+
+    A stored digest is trusted only while the file's size, mtime_ns and inode are
+    unchanged.
+    """
+
+    def __init__(self, path: Path, entries: dict[str, dict[str, Any]] | None = None) -> None:
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = entries or {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> "DigestCache":
+        if not path.is_file():
+            return cls(path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path)
+        entries = data.get("entries") if isinstance(data, dict) else None
+        return cls(path, entries if isinstance(entries, dict) else None)
+
+    @classmethod
+    def for_run(cls, run_dir: Path) -> "DigestCache":
+        return cls.load(run_dir / DIGEST_CACHE_NAME)
+
+    def lookup(self, key: str, stat: os.stat_result) -> str | None:
+        entry = self.entries.get(key)
+        if not isinstance(entry, dict):
+            return None
+        if (
+            entry.get("size") != stat.st_size
+            or entry.get("mtime_ns") != stat.st_mtime_ns
+            or entry.get("inode") != stat.st_ino
+        ):
+            return None
+        digest = entry.get("sha256")
+        return digest if isinstance(digest, str) else None
+
+    def store(self, key: str, stat: os.stat_result, digest: str) -> None:
+        if time.time_ns() - stat.st_mtime_ns < DIGEST_CACHE_RACY_WINDOW_NS:
+            if self.entries.pop(key, None) is not None:
+                self.dirty = True
+            return
+        entry = {"inode": stat.st_ino, "mtime_ns": stat.st_mtime_ns, "sha256": digest, "size": stat.st_size}
+        if self.entries.get(key) != entry:
+            self.entries[key] = entry
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        write_text(self.path, json.dumps({"entries": self.entries}, sort_keys=True, indent=2) + "\n")
+        self.dirty = False
+
+
+def update_evidence_hashes(
+    run_dir: Path,
+    report: dict[str, Any],
+    verify: bool = False,
+    workers: int = DEFAULT_HASH_WORKERS,
+    index: EvidenceIndex | None = None,
+) -> dict[str, Any]:
+    """Fill evidence_artifacts[].sha256/size_bytes from the files on disk.
+
+    Unchanged files reuse digests from .digest_cache.json; verify=True rehashes
+    every artefact and refreshes the cache. Cache misses are hashed concurrently.
+    """
+
+    with profiling.span("hash_evidence"):
+        return _update_evidence_hashes(run_dir, report, verify, workers, index)
+
+
+def _update_evidence_hashes(
+    run_dir: Path, report: dict[str, Any], verify: bool, workers: int, index: EvidenceIndex | None
+) -> dict[str, Any]:
+    cache = DigestCache.for_run(run_dir)
+    pending: list[tuple[dict[str, Any], str, Path, os.stat_result, str | None]] = []
+    for entry in (index or EvidenceIndex.from_report(report)).entries:
         relpath = entry.get("relpath")
         if not relpath:
             continue
         artifact_path = run_dir / relpath
         if not artifact_path.is_file():
             raise FileNotFoundError(f"Missing declared artefact: {artifact_path}")
-        entry["sha256"] = sha256_hex(artifact_path)
-        entry["size_bytes"] = artifact_path.stat().st_size
-        updates[relpath] = entry
+        stat = artifact_path.stat()
+        pending.append((entry, relpath, artifact_path, stat, None if verify else cache.lookup(relpath, stat)))
+
+    misses = [artifact_path for _entry, _relpath, artifact_path, _stat, digest in pending if digest is None]
+    profiling.add_read(sum(stat.st_size for _entry, _relpath, _path, stat, digest in pending if digest is None))
+    computed = iter(sha256_hex_many(misses, workers=workers))
+
+    for entry, relpath, _artifact_path, stat, digest in pending:
+        if digest is None:
+            digest = next(computed)
+            cache.store(relpath, stat, digest)
+        entry["sha256"] = digest
+        entry["size_bytes"] = stat.st_size
+    cache.save()
     return report
 
 
 def write_report(path: Path, report: dict[str, Any]) -> None:
-    path.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    with profiling.span("write_report"):
+        content = (json_codec.dumps_pretty(report) + "\n").encode("utf-8")
+        # Leave unchanged reports untouched so mtimes stay stable for rsync / s3 sync.
+        if path.is_file():
+            profiling.add_read_file(path)
+            if path.read_bytes() == content:
+                return
+        unlink_if_shared(path)
+        path.write_bytes(content)
+        profiling.add_written(len(content))
 
 
 def iter_runs(runs_dir: Path) -> Iterable[Path]:
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import html
+from typing import Any
+
+from site_nav import render_header_nav
+
+
+class RowTemplate:
+    """A line template with positional `{}` slots, split once at import time.
+
+    render() HTML-escapes every value and joins it with the precomputed literal
+    parts, avoiding per-call format-string parsing.
+    """
+
+    __slots__ = ("_literals",)
+
+    def __init__(self, template: str) -> None:
+        self._literals = tuple(template.split("{}"))
+
+    @property
+    def slots(self) -> int:
+        return len(self._literals) - 1
+
+    def render(self, *values: Any) -> str:
+        if len(values) != self.slots:
+            raise ValueError(f"Template expects {self.slots} values, got {len(values)}")
+        parts = [self._literals[0]]
+        for value, literal in zip(values, self._literals[1:]):
+            parts.append(html.escape(str(value)))
+            parts.append(literal)
+        return "".join(parts)
+
+
+def indent_lines(lines: tuple[str, ...], indent: str) -> tuple[str, ...]:
+    return tuple(f"{indent}{line}" if line else line for line in lines)
+
+
+LEAFLET_HEAD_LINES: tuple[str, ...] = (
+    "  <link rel=\"stylesheet\" href=\"https://unpkg.com/leaflet@1.9.4/dist/leaflet.css\" "
+    "integrity=\"sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY=\" crossorigin=\"\" />",
+    "  <script src=\"https://unpkg.com/leaflet@1.9.4/dist/leaflet.js\" "
+    "integrity=\"sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo=\" crossorigin=\"\"></script>",
+)
+
+DOCUMENT_START_LINES: tuple[str, ...] = (
+    "<!doctype html>",
+    '<html lang="en">',
+    "<head>",
+    "  <meta charset=\"utf-8\" />",
+    "  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />",
+)
+
+SUMMARY_STYLE_LINES: tuple[str, ...] = (
+    "  <style>",
+    "    body { font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial; margin: 24px; }",
+    "    table { border-collapse: collapse; width: 100%; }",
+    "    th, td { border: 1px solid #ddd; padding: 8px; vertical-align: top; }",
+    "    th { background: #f6f6f6; text-align: left; width: 240px; }",
+    "    h2 { margin-top: 28px; }",
+    "    code { background: #f6f6f6; padding: 1px 4px; border-radius: 4px; }",
+    "    #map { height: 420px; border: 1px solid #ddd; border-radius: 8px; margin: 12px 0 16px; background: #fafafa; }",
+    "  </style>",
+)
+
+RUN_STYLE_LINES: tuple[str, ...] = (
+    "  <style>",
+    "    :root { --fg:#111; --bg:#fff; --muted:#666; --card:#f6f7f9; --link:#0b5fff; }",
+    "    body { font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, sans-serif;",
+    "           color: var(--fg); background: var(--bg); margin: 0; }",
+    "    header { border-bottom: 1px solid #e7e7e7; background: #fff; position: sticky; top: 0; }",
+    "    .wrap { max-width: 980px; margin: 0 auto; padding: 16px 20px; }",
+    "    nav a { margin-right: 14px; text-decoration: none; color: var(--link); font-weight: 600; }",
+    "    nav a.active { color: var(--fg); }",
+    "    main { padding: 18px 20px 40px; }",
+    "    h1 { margin: 0 0 6px; font-size: 22px; }",
+    "    p { line-height: 1.5; }",
+    "    .muted { color: var(--muted); }",
+    "    .card { background: var(--card); border: 1px solid #e8eaee; border-radius: 12px; padding: 14px 14px; }",
+    "    ul { padding-left: 18px; }",
+    "    code { background: #f1f1f1; padding: 1px 4px; border-radius: 6px; }",
+    "    #map { height: 420px; border: 1px solid #ddd; border-radius: 8px; margin: 12px 0 16px; background: #fafafa; }",
+    "  </style>",
+)
+
+# runs/<run_id>/report.html sits three levels below docs/site/.
+RUN_HEADER_LINES: tuple[str, ...] = indent_lines(
+    tuple(render_header_nav(rel_prefix="../../../", active_label="AOI Reports").split("\n")),
+    "  ",
+)
+
+# The interactive map body shared by both pages; callers indent it to their nesting depth.
+# The config and AOI boundary are inlined when readable at render time (null otherwise,
+# in which case they are fetched); overlays are fetched only once toggled on.
+MAP_SCRIPT_LINES: tuple[str, ...] = (
+    "<script>",
+    "  (function () {",
+    "    const map = L.map('map', { zoomControl: true });",
+    "    const satellite = L.tileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}', {",
+    "      attribution: 'Tiles © Esri — Source: Esri, Maxar, Earthstar Geographics, and the GIS User Community',",
+    "    }).addTo(map);",
+    "    const configUrl = CONFIG_URL;",
+    "    const inlineConfig = INLINE_CONFIG;",
+    "    const inlineBoundary = INLINE_BOUNDARY;",
+    "    const status = L.control({ position: 'bottomleft' });",
+    "    status.onAdd = () => {",
+    "      const div = L.DomUtil.create('div', 'map-status');",
+    "      div.style.cssText = 'display:none; background:#fff; padding:2px 8px; border-radius:4px; font-size:12px;';",
+    "      return div;",
+    "    };",
+    "    status.addTo(map);",
+    "    const pending = new Map();",
+    "    const setLoading = (label, delta) => {",
+    "      const count = (pending.get(label) || 0) + delta;",
+    "      if (count > 0) pending.set(label, count);",
+    "      else pending.delete(label);",
+    "      const div = status.getContainer();",
+    "      div.textContent = pending.size ? `Loading ${Array.from(pending.keys()).join(', ')}…` : '';",
+    "      div.style.display = pending.size ? 'block' : 'none';",
+    "    };",
+    "    const configReady = inlineConfig ? Promise.resolve(inlineConfig) : fetch(configUrl).then((resp) => resp.json());",
+    "    configReady.then((config) => {",
+    "        const base = new URL(configUrl, window.location.href);",
+    "        const bbox = config.aoi_bbox;",
+    "        const bounds = L.latLngBounds([",
+    "          [bbox.min_lat, bbox.min_lon],",
+    "          [bbox.max_lat, bbox.max_lon],",
+    "        ]);",
+    "        map.fitBounds(bounds);",
+    "        const overlays = {};",
+    "        const baseLayers = { Satellite: satellite };",
+    "        const cache = new Map();",
+    "        const loadJson = (label, path) => {",
+    "          const url = new URL(path, base).href;",
+    "          if (!cache.has(url)) {",
+    "            setLoading(label, 1);",
+    "            const request = fetch(url)",
+    "              .then((r) => {",
+    "                if (!r.ok) throw new Error(`${r.status} ${url}`);",
+    "                return r.json();",
+    "              })",
+    "              .catch((err) => {",
+    "                cache.delete(url);",
+    "                throw err;",
+    "              })",
+    "              .finally(() => setLoading(label, -1));",
+    "            cache.set(url, request);",
+    "          }",
+    "          return cache.get(url);",
+    "        };",
+    "        const addGeoJson = (label, path, options, data) => {",
+    "          if (!path && !data) return null;",
+    "          const group = L.layerGroup();",
+    "          let loaded = false;",
+    "          group.on('add', () => {",
+    "            if (loaded) return;",
+    "            loaded = true;",
+    "            (data ? Promise.resolve(data) : loadJson(label, path))",
+    "              .then((json) => group.addLayer(L.geoJSON(json, options)))",
+    "              .catch(() => { loaded = false; });",
+    "          });",
+    "          overlays[label] = group;",
+    "          return group;",
+    "        };",
+    "        const tiles = config.tiles;",
+    "        const addTiled = (label, key, options) => {",
+    "          const index = tiles.layers[key];",
+    "          const group = L.layerGroup();",
+    "          const built = new Map();",
+    "          const shown = new Map();",
+    "          let wanted = new Set();",
+    "          const refresh = () => {",
+    "            if (!map.hasLayer(group)) return;",
+    "            const z = Math.max(tiles.min_zoom, Math.min(tiles.max_zoom, map.getZoom()));",
+    "            const view = map.getBounds();",
+    "            wanted = new Set();",
+    "            (index[z] || []).forEach(([x, y, minLon, minLat, maxLon, maxLat]) => {",
+    "              if (view.intersects(L.latLngBounds([minLat, minLon], [maxLat, maxLon]))) {",
+    "                wanted.add(tiles.template.replace('{layer}', key).replace('{z}', z).replace('{x}', x).replace('{y}', y));",
+    "              }",
+    "            });",
+    "            shown.forEach((layer, path) => {",
+    "              if (!wanted.has(path)) {",
+    "                group.removeLayer(layer);",
+    "                shown.delete(path);",
+    "              }",
+    "            });",
+    "            wanted.forEach((path) => {",
+    "              if (!built.has(path)) {",
+    "                built.set(path, loadJson(label, path).then((data) => L.geoJSON(data, options)));",
+    "                built.get(path).catch(() => built.delete(path));",
+    "              }",
+    "              built.get(path).then((layer) => {",
+    "                if (wanted.has(path) && !shown.has(path)) {",
+    "                  shown.set(path, layer);",
+    "                  group.addLayer(layer);",
+    "                }",
+    "              }, () => {});",
+    "            });",
+    "          };",
+    "          map.on('moveend', refresh);",
+    "          group.on('add', refresh);",
+    "          overlays[label] = group;",
+    "        };",
+    "        const addLayer = (label, key, options) => {",
+    "          if (tiles && tiles.layers[key]) addTiled(label, key, options);",
+    "          else addGeoJson(label, config.layers[key], options);",
+    "        };",
+    "        addLayer('Forest cover 2000', 'forest_2000', { style: { color: '#2e7d32', weight: 1, fillOpacity: 0.3 } });",
+    "        addLayer(`Forest cover ${config.latest_year}`, 'forest_end_year', { style: { color: '#1b5e20', weight: 1, fillOpacity: 0.3 } });",
+    "        addLayer('Forest loss since 2020', 'forest_loss_post_2020', { style: { color: '#c62828', weight: 1, fillOpacity: 0.4 } });",
+    "        const boundary = addGeoJson('AOI boundary', config.layers.aoi_boundary, { style: { color: '#1976d2', weight: 2, fillOpacity: 0 } }, inlineBoundary);",
+    "        if (boundary) boundary.addTo(map);",
+    "        addLayer('Maa-amet parcels', 'parcels', {",
+    "          style: { color: '#6a1b9a', weight: 1, fillOpacity: 0.05 },",
+    "          onEachFeature: (feature, layer) => {",
+    "            const props = feature.properties || {};",
+    "            const label = `${props.parcel_id || ''} | forest_ha=${props.hansen_forest_area_ha ?? ''} | loss_ha=${props.hansen_forest_loss_ha ?? ''}`;",
+    "            layer.bindTooltip(label, { sticky: true });",
+    "          },",
+    "        });",
+    "        L.control.layers(baseLayers, overlays, { collapsed: false }).addTo(map);",
+    "      });",
+    "  })();",
+    "</script>",
+)
+_MAP_CONFIG_URL_INDEX = MAP_SCRIPT_LINES.index("    const configUrl = CONFIG_URL;")
+_MAP_INLINE_CONFIG_INDEX = MAP_SCRIPT_LINES.index("    const inlineConfig = INLINE_CONFIG;")
+_MAP_INLINE_BOUNDARY_INDEX = MAP_SCRIPT_LINES.index("    const inlineBoundary = INLINE_BOUNDARY;")
+
+
+def map_script_lines(
+    indent: str,
+    config_href: str,
+    config_json: str | None = None,
+    boundary_json: str | None = None,
+) -> list[str]:
+    """MAP_SCRIPT_LINES indented, with the (already escaped) config href and any inlined JSON filled in.
+
+    The JSON must already be safe inside <script>, see aoi_report_renderer.script_json.
+    """
+
+    lines = [f"{indent}{line}" for line in MAP_SCRIPT_LINES]
+    lines[_MAP_CONFIG_URL_INDEX] = f"{indent}    const configUrl = '{config_href}';"
+    lines[_MAP_INLINE_CONFIG_INDEX] = f"{indent}    const inlineConfig = {config_json or 'null'};"
+    lines[_MAP_INLINE_BOUNDARY_INDEX] = f"{indent}    const inlineBoundary = {boundary_json or 'null'};"
+    return lines
+
+
+ALERT_BOX = RowTemplate(
+    "  <div style=\"border:2px solid #b00020; background:#fff5f5; padding:12px; margin-bottom:16px;\">"
+    "<strong>{}</strong>{}"
+    "</div>"
+)
+INPUT_ROW = RowTemplate("    <tr><td>{}</td><td>{}</td><td><code>{}</code></td><td>{}</td></tr>")
+METRIC_ROW = RowTemplate("    <tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>")
+FIELD_ROW = RowTemplate("    <tr><td>{}</td><td><code>{}</code></td></tr>")
+PARCEL_ROW = RowTemplate("    <tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>")
+SUMMARY_EVIDENCE_ITEM = RowTemplate("    <li><a href=\"{}\">{}</a></li>")
+RUN_EVIDENCE_ITEM = RowTemplate("          <li><a href=\"{}\">{}</a></li>")
+RUN_CORE_LINK_ITEM = RowTemplate("          <li><a href=\"{}\">{}</a> ({})</li>")
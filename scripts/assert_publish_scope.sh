@@ -4,9 +4,20 @@ set -euo pipefail
 # Validate that only AOI report publish outputs are staged/modified.
 # Allowed paths:
 # - docs/site/aoi_reports/index.html
+# - docs/site/aoi_reports/page-<N>.html and runs_catalog.json (paginated index)
 # - docs/site/aoi_reports/runs/
+#
+# Optional env vars:
+#   EXPECTED_RUN_COUNT (default: 4; "any" accepts any number of run directories)
+#   REQUIRED_RUNS (default: "example latin_america se_asia west_africa"; space-separated
+#     run ids that must exist with their report JSON)
+
+script_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+expected_run_count="${EXPECTED_RUN_COUNT:-4}"
+read -r -a required_runs <<< "${REQUIRED_RUNS-example latin_america se_asia west_africa}"
 
 allowed_index="docs/site/aoi_reports/index.html"
+allowed_catalog="docs/site/aoi_reports/runs_catalog.json"
 allowed_runs_prefix="docs/site/aoi_reports/runs/"
 
 changes="$(git status --porcelain)"
@@ -21,7 +32,11 @@ while IFS= read -r line; do
   # Strip status (first two columns) and space to get the path
   path="${line:3}"
 
-  if [[ "$path" == "$allowed_index" ]]; then
+  if [[ "$path" == "$allowed_index" || "$path" == "$allowed_catalog" ]]; then
+    continue
+  fi
+
+  if [[ "$path" == docs/site/aoi_reports/page-*.html ]]; then
     continue
   fi
 
@@ -52,8 +67,8 @@ while IFS= read -r d; do
   [[ -z "$d" ]] && continue
   run_dirs+=("$d")
 done < <(find "$runs_dir" -mindepth 1 -maxdepth 1 -type d -print)
-if (( ${#run_dirs[@]} != 4 )); then
-  echo "ERROR: expected exactly four AOI run directories under $runs_dir" >&2
+if [[ "$expected_run_count" != "any" ]] && (( ${#run_dirs[@]} != expected_run_count )); then
+  echo "ERROR: expected exactly $expected_run_count AOI run directories under $runs_dir, found ${#run_dirs[@]}" >&2
   for d in "${run_dirs[@]}"; do
     echo "  - $d" >&2
   done
@@ -73,9 +88,16 @@ if [[ ! -f "$index_path" ]]; then
   exit 1
 fi
 
-for run_id in example latin_america se_asia west_africa; do
+# A paginated index spreads run links across index.html and page-<N>.html.
+index_pages=("$index_path")
+while IFS= read -r page; do
+  [[ -z "$page" ]] && continue
+  index_pages+=("$page")
+done < <(find docs/site/aoi_reports -mindepth 1 -maxdepth 1 -type f -name 'page-*.html' -print | sort)
+
+for run_id in "${required_runs[@]}"; do
   report_path="$runs_dir/$run_id/report.html"
-  json_path="$runs_dir/$run_id/${expected_json[$run_id]}"
+  json_path="$runs_dir/$run_id/${expected_json[$run_id]:-aoi_report.json}"
 
   if [[ ! -d "$runs_dir/$run_id" ]]; then
     echo "ERROR: missing required run directory: $runs_dir/$run_id" >&2
@@ -91,12 +113,28 @@ for run_id in example latin_america se_asia west_africa; do
     echo "ERROR: missing AOI JSON artefact: $json_path" >&2
     exit 1
   fi
+done
 
-  if ! grep -q "runs/$run_id/report.html" "$index_path"; then
-    echo "ERROR: AOI index does not link to runs/$run_id/report.html" >&2
-    exit 1
-  fi
+# Every run must have a report.html linked from the index. Links are extracted once
+# and compared as sorted sets so the check stays linear in the number of runs.
+missing_reports=()
+for d in "${run_dirs[@]}"; do
+  [[ -f "$d/report.html" ]] || missing_reports+=("$d/report.html")
 done
+if (( ${#missing_reports[@]} > 0 )); then
+  echo "ERROR: missing AOI report(s):" >&2
+  printf '  - %s\n' "${missing_reports[@]}" >&2
+  exit 1
+fi
+
+unlinked="$(comm -23 \
+  <(for d in "${run_dirs[@]}"; do echo "runs/${d##*/}/report.html"; done | LC_ALL=C sort -u) \
+  <(grep -oh 'runs/[^"/]*/report\.html' "${index_pages[@]}" | LC_ALL=C sort -u))"
+if [[ -n "$unlinked" ]]; then
+  echo "ERROR: AOI index does not link to:" >&2
+  sed 's/^/  - /' <<< "$unlinked" >&2
+  exit 1
+fi
 
 # Validate declared AOI artefacts exist and are linked from report.html.
-python3 scripts/validate_aoi_run_artifacts.py --runs-dir "$runs_dir"
+python3 "$script_dir/validate_aoi_run_artifacts.py" --runs-dir "$runs_dir"
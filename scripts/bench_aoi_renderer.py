@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable
+
+from aoi_report_renderer import (
+    find_html_relpath,
+    load_report,
+    render_metrics_csv,
+    render_report_html,
+    render_run_report_html,
+    update_evidence_hashes,
+)
+from synthetic_aoi_bundle import SyntheticSpec, write_synthetic_run
+from validate_aoi_run_artifacts import validate_run
+
+
+BASELINE_VERSION = 1
+REPORT_JSON_NAME = "synthetic_aoi_report.json"
+# Timing differences below this are treated as noise whatever the relative threshold says.
+NOISE_FLOOR_SECONDS = 0.002
+DEFAULT_SPEC = SyntheticSpec(evidence=200, parcels=500, criteria=200, results=200, metrics=200, mask_vertices=2000)
+
+
+def best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def peak_bytes(fn: Callable[[], Any]) -> int:
+    # Measured in its own pass: tracemalloc slows allocation-heavy code several-fold.
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_cases(run_dir: Path) -> dict[str, Callable[[], Any]]:
+    report = load_report(run_dir / REPORT_JSON_NAME)
+    html_relpath = find_html_relpath(report)
+    return {
+        "render_report_html": lambda: render_report_html(report, run_dir, html_relpath),
+        "render_run_report_html": lambda: render_run_report_html(report, run_dir, REPORT_JSON_NAME),
+        "render_metrics_csv": lambda: render_metrics_csv(report),
+        # verify=True bypasses .digest_cache.json so every artefact is hashed cold.
+        "update_evidence_hashes": lambda: update_evidence_hashes(run_dir, report, verify=True),
+        "validate_run": lambda: validate_run(run_dir, verify_hashes=True),
+    }
+
+
+def run_benchmarks(spec: SyntheticSpec, repeat: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp) / "runs" / spec.aoi_id
+        write_synthetic_run(run_dir, spec, REPORT_JSON_NAME)
+        benchmarks = {
+            name: {"seconds": round(best_of(repeat, fn), 6), "peak_bytes": peak_bytes(fn)}
+            for name, fn in benchmark_cases(run_dir).items()
+        }
+    return {"version": BASELINE_VERSION, "spec": asdict(spec), "repeat": repeat, "benchmarks": benchmarks}
+
+
+def compare_to_baseline(
+    current: dict[str, Any], baseline: dict[str, Any], time_threshold: float, memory_threshold: float
+) -> list[str]:
+    """Regressions beyond the allowed fractional increase (0.25 = 25% slower / larger)."""
+
+    if baseline.get("spec") != current["spec"]:
+        raise SystemExit("Baseline was recorded with a different synthetic spec; rerun with the same options.")
+    regressions = []
+    for name, result in current["benchmarks"].items():
+        reference = baseline.get("benchmarks", {}).get(name)
+        if reference is None:
+            continue
+        for key, threshold in (("seconds", time_threshold), ("peak_bytes", memory_threshold)):
+            if key == "seconds" and result[key] - reference[key] < NOISE_FLOOR_SECONDS:
+                continue
+            if reference[key] > 0 and result[key] > reference[key] * (1 + threshold):
+                regressions.append(
+                    f"{name} {key}: {result[key]} vs baseline {reference[key]} "
+                    f"(+{(result[key] / reference[key] - 1) * 100:.1f}%, limit +{threshold * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark AOI rendering, hashing and validation on a synthetic run.")
+    for name, value in asdict(DEFAULT_SPEC).items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(value), default=value, help=f"(default: {value})")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per benchmark (best time is reported)")
+    parser.add_argument("--output", default=None, help="Write this run's results as JSON (usable as a baseline)")
+    parser.add_argument("--baseline", default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown vs baseline (default: 0.25)")
+    parser.add_argument(
+        "--memory-threshold", type=float, default=0.10, help="Allowed peak memory growth vs baseline (default: 0.10)"
+    )
+    args = parser.parse_args()
+
+    spec = SyntheticSpec(**{name: getattr(args, name) for name in asdict(DEFAULT_SPEC)})
+    current = run_benchmarks(spec, args.repeat)
+
+    print(f"{'benchmark':<24} {'ms':>10} {'peak_kb':>10}")
+    for name, result in current["benchmarks"].items():
+        print(f"{name:<24} {result['seconds'] * 1000:10.2f} {result['peak_bytes'] / 1024:10.1f}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(current, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(current, baseline, args.threshold, args.memory_threshold)
+        if regressions:
+            print("FAIL: regressions against baseline")
+            for line in regressions:
+                print(f"- {line}")
+            return 1
+        print("PASS: within baseline thresholds")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import time
+from hashlib import sha256
+from pathlib import Path
+
+from aoi_report_renderer import DEFAULT_HASH_WORKERS, load_report, sha256_hex, sha256_hex_many
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_RUN_DIR = ROOT_DIR / "docs/site/aoi_reports/runs/west_africa"
+DEFAULT_REPORT_JSON_NAME = "west_africa_aoi_report.json"
+
+
+def legacy_sha256_hex(path: Path) -> str:
+    # The original 64 KiB single-threaded loop, kept as the benchmark baseline.
+    hasher = sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(65536), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def declared_artifact_paths(run_dir: Path, report_json_name: str) -> list[Path]:
+    report = load_report(run_dir / report_json_name)
+    paths = []
+    for entry in report.get("evidence_artifacts", []):
+        relpath = entry.get("relpath")
+        if relpath and (run_dir / relpath).is_file():
+            paths.append(run_dir / relpath)
+    return paths
+
+
+def best_of(repeat: int, fn) -> tuple[float, list[str]]:
+    best = float("inf")
+    digests: list[str] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        digests = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, digests
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark evidence artefact hashing on a published AOI run.")
+    parser.add_argument("--run-dir", default=str(DEFAULT_RUN_DIR), help="Run directory to hash")
+    parser.add_argument("--report-json-name", default=DEFAULT_REPORT_JSON_NAME, help="Run report JSON filename")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per backend (best time is reported)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_HASH_WORKERS, help="Thread pool size")
+    args = parser.parse_args()
+
+    run_dir = Path(args.run_dir)
+    paths = declared_artifact_paths(run_dir, args.report_json_name)
+    if not paths:
+        raise SystemExit(f"No declared artefacts found in {run_dir}")
+    total_bytes = sum(path.stat().st_size for path in paths)
+
+    backends = [
+        ("legacy 64KiB serial", lambda: [legacy_sha256_hex(path) for path in paths]),
+        ("sha256_hex serial", lambda: [sha256_hex(path) for path in paths]),
+        (f"sha256_hex_many x{args.workers}", lambda: sha256_hex_many(paths, workers=args.workers)),
+    ]
+
+    print(f"{len(paths)} artefacts, {total_bytes / 1e6:.2f} MB in {run_dir}")
+    baseline_seconds = None
+    baseline_digests = None
+    for label, fn in backends:
+        seconds, digests = best_of(args.repeat, fn)
+        if baseline_digests is None:
+            baseline_seconds, baseline_digests = seconds, digests
+        elif digests != baseline_digests:
+            raise SystemExit(f"{label} produced different digests than the baseline")
+        throughput = total_bytes / seconds / 1e6 if seconds else float("inf")
+        speedup = baseline_seconds / seconds if seconds else float("inf")
+        print(f"{label:<28} {seconds * 1000:9.2f} ms {throughput:9.1f} MB/s {speedup:6.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
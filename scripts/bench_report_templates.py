@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import copy
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from aoi_report_renderer import load_report, render_report_html, render_run_report_html
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+FIXTURE_REPORT = ROOT_DIR / "docs/site/aoi_reports/runs/example/estonia_aoi_report.json"
+
+
+def expand_report(base: dict[str, Any], rows: int) -> dict[str, Any]:
+    """Return a copy of base with `rows` evidence, criteria, result and metric rows."""
+
+    report = copy.deepcopy(base)
+    aoi_id = str(report.get("aoi_id", "aoi"))
+    version = str(report.get("report_version", "aoi_report_v2"))
+    evidence = [
+        entry
+        for entry in report.get("evidence_artifacts", [])
+        if str(entry.get("relpath", "")).endswith((".html", ".json", "metrics.csv"))
+    ]
+    for index in range(max(rows - len(evidence), 0)):
+        evidence.append(
+            {
+                "content_type": "application/geo+json",
+                "meta": {"role": "parcel_mask"},
+                "relpath": f"reports/{version}/{aoi_id}/parcels/parcel_{index:06d}.geojson",
+                "sha256": f"{index:064x}",
+                "size_bytes": index,
+            }
+        )
+    report["evidence_artifacts"] = evidence
+    report["acceptance_criteria"] = [
+        {"criteria_id": f"AC-{index:06d}", "status": "met" if index % 7 else "unmet", "threshold": index}
+        for index in range(rows)
+    ]
+    report["results"] = [
+        {"result_id": f"R-{index:06d}", "status": "computed" if index % 3 else "placeholder", "criteria_ids": [f"AC-{index:06d}"]}
+        for index in range(rows)
+    ]
+    report["metrics"] = {
+        f"metric_{index:06d}": {"value": index * 0.5, "unit": "ha", "notes": "synthetic"} for index in range(rows)
+    }
+    return report
+
+
+def time_render(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Microbenchmark AOI report page rendering by row count.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1, 100, 10000], help="Row counts to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per size (best time is reported)")
+    args = parser.parse_args()
+
+    base = load_report(FIXTURE_REPORT)
+    print(f"{'rows':>7} {'summary_ms':>11} {'run_ms':>9} {'summary_kb':>11} {'run_kb':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp)
+        for rows in args.rows:
+            report = expand_report(base, rows)
+            html_relpath = next(
+                entry["relpath"] for entry in report["evidence_artifacts"] if entry["relpath"].endswith(".html")
+            )
+            summary_seconds = time_render(lambda: render_report_html(report, run_dir, html_relpath), args.repeat)
+            run_seconds = time_render(lambda: render_run_report_html(report, run_dir), args.repeat)
+            summary_kb = len(render_report_html(report, run_dir, html_relpath).encode("utf-8")) / 1024
+            run_kb = len(render_run_report_html(report, run_dir).encode("utf-8")) / 1024
+            print(
+                f"{rows:>7} {summary_seconds * 1000:11.2f} {run_seconds * 1000:9.2f} "
+                f"{summary_kb:11.1f} {run_kb:8.1f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
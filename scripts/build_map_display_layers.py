@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable
+
+from aoi_report_renderer import display_relpath, iter_runs, load_report, unlink_if_shared
+from geojson_simplify import count_vertices, simplify_feature_collection
+from geojson_tiles import DEFAULT_MAX_ZOOM, build_tile_pyramid, default_min_zoom, geometry_bounds, union_bounds
+from validate_aoi_run_artifacts import resolve_report_json_path
+
+
+# map_config.json layers that point at Hansen mask GeoJSONs.
+DISPLAY_LAYER_KEYS = ("forest_2000", "forest_end_year", "forest_loss_post_2020")
+# ~22 m at the equator: smooths pixel staircases without moving edges by a full
+# 30 m Hansen pixel.
+DEFAULT_TOLERANCE_DEG = 0.0002
+# 5 decimals ~ 1.1 m.
+DEFAULT_PRECISION = 5
+MAP_DISPLAY_DEBUG_NAME = "map_display_debug.json"
+# Layers cut into a z/x/y tile pyramid; the map script loads only the tiles in view.
+TILED_LAYER_KEYS = (*DISPLAY_LAYER_KEYS, "parcels")
+TILES_DIR_NAME = "tiles"
+# Relative to the map config; {layer} is the map_config.json layers key.
+TILE_TEMPLATE = f"{TILES_DIR_NAME}/{{layer}}/{{z}}/{{x}}/{{y}}.geojson"
+
+
+def write_if_changed(path: Path, content: str) -> None:
+    data = content.encode("utf-8")
+    if path.is_file() and path.read_bytes() == data:
+        return
+    unlink_if_shared(path)
+    path.write_bytes(data)
+
+
+def build_display_layer(source: Path, tolerance: float, precision: int) -> tuple[Path, dict[str, Any]]:
+    target = source.with_name(display_relpath(source.name))
+    data = json.loads(source.read_text(encoding="utf-8"))
+    simplified = simplify_feature_collection(data, tolerance, precision)
+    write_if_changed(target, json.dumps(simplified, ensure_ascii=False, separators=(",", ":")) + "\n")
+    source_bytes = source.stat().st_size
+    display_bytes = target.stat().st_size
+    return target, {
+        "source_bytes": source_bytes,
+        "display_bytes": display_bytes,
+        "reduction_pct": round(100.0 * (1 - display_bytes / source_bytes), 2) if source_bytes else 0.0,
+        "source_vertices": count_vertices(data),
+        "display_vertices": count_vertices(simplified),
+        "source_features": len(data.get("features", [])),
+        "display_features": len(simplified["features"]),
+    }
+
+
+def _config_bounds(config: dict[str, Any]) -> tuple[float, float, float, float] | None:
+    bbox = config.get("aoi_bbox")
+    if not isinstance(bbox, dict):
+        return None
+    try:
+        return (float(bbox["min_lon"]), float(bbox["min_lat"]), float(bbox["max_lon"]), float(bbox["max_lat"]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _layer_bounds(sources: Iterable[Path]) -> tuple[float, float, float, float] | None:
+    features = (
+        feature
+        for source in sources
+        for feature in json.loads(source.read_text(encoding="utf-8")).get("features", [])
+        if isinstance(feature, dict)
+    )
+    return union_bounds(bounds for bounds in (geometry_bounds(feature.get("geometry")) for feature in features) if bounds)
+
+
+def build_tile_layers(
+    config_dir: Path,
+    sources: dict[str, Path],
+    min_zoom: int,
+    max_zoom: int,
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Write the tile pyramid of every source layer under config_dir/tiles/.
+
+    Returns the `tiles` block of the display config and per-layer debug stats.
+    Tiles left over from an earlier build are removed.
+    """
+
+    tiles_dir = config_dir / TILES_DIR_NAME
+    written: set[Path] = set()
+    index: dict[str, dict[str, list[list[float]]]] = {}
+    layer_stats = []
+    for key, source in sources.items():
+        data = json.loads(source.read_text(encoding="utf-8"))
+        pyramid = build_tile_pyramid(data, min_zoom, max_zoom)
+        zooms: dict[str, list[list[float]]] = {}
+        tile_bytes: list[int] = []
+        for (z, x, y), (collection, bounds) in pyramid.items():
+            path = config_dir / TILE_TEMPLATE.format(layer=key, z=z, x=x, y=y)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            content = json.dumps(collection, ensure_ascii=False, separators=(",", ":")) + "\n"
+            write_if_changed(path, content)
+            written.add(path)
+            tile_bytes.append(len(content.encode("utf-8")))
+            zooms.setdefault(str(z), []).append([x, y, *bounds])
+        index[key] = zooms
+        layer_stats.append(
+            {
+                "layer": key,
+                "tiles": len(pyramid),
+                "tile_bytes_total": sum(tile_bytes),
+                "tile_bytes_max": max(tile_bytes, default=0),
+            }
+        )
+
+    if tiles_dir.is_dir():
+        for path in sorted(tiles_dir.rglob("*"), reverse=True):
+            if path.is_file() and path not in written:
+                path.unlink()
+            elif path.is_dir() and not any(path.iterdir()):
+                path.rmdir()
+        if not any(tiles_dir.iterdir()):
+            tiles_dir.rmdir()
+    block = {"template": TILE_TEMPLATE, "min_zoom": min_zoom, "max_zoom": max_zoom, "layers": index}
+    return block, layer_stats
+
+
+def build_run_display_layers(
+    run_dir: Path,
+    report_json_name: str | None = None,
+    tolerance: float = DEFAULT_TOLERANCE_DEG,
+    precision: int = DEFAULT_PRECISION,
+    tiles: bool = True,
+    min_zoom: int | None = None,
+    max_zoom: int = DEFAULT_MAX_ZOOM,
+) -> dict[str, Any] | None:
+    """Write *.display.geojson copies, tile pyramids and map_config.display.json for one run.
+
+    The declared map_config.json and mask GeoJSONs are only read. Returns the
+    debug summary written next to the map config, or None when the run has no map.
+    """
+
+    report_path = run_dir / report_json_name if report_json_name else resolve_report_json_path(run_dir)
+    report = load_report(report_path)
+    map_assets = report.get("map_assets") if isinstance(report.get("map_assets"), dict) else {}
+    config_relpath = map_assets.get("config_relpath")
+    if not config_relpath or not (run_dir / config_relpath).is_file():
+        return None
+
+    config_path = run_dir / config_relpath
+    config = json.loads(config_path.read_text(encoding="utf-8"))
+    layers = config.get("layers") if isinstance(config.get("layers"), dict) else {}
+    display_layers = dict(layers)
+    built: dict[Path, tuple[Path, dict[str, Any]]] = {}
+    layer_stats = []
+    for key in DISPLAY_LAYER_KEYS:
+        href = layers.get(key)
+        if not href:
+            continue
+        source = Path(os.path.normpath(config_path.parent / href))
+        if not source.is_file():
+            continue
+        if source not in built:
+            built[source] = build_display_layer(source, tolerance, precision)
+        target, stats = built[source]
+        display_layers[key] = Path(os.path.relpath(target, config_path.parent)).as_posix()
+        layer_stats.append(
+            {
+                "layer": key,
+                "source_relpath": Path(os.path.relpath(source, run_dir)).as_posix(),
+                "display_relpath": Path(os.path.relpath(target, run_dir)).as_posix(),
+                **stats,
+            }
+        )
+
+    display_config = {**config, "layers": display_layers}
+    tile_stats: list[dict[str, Any]] = []
+    tile_sources: dict[str, Path] = {}
+    for key in TILED_LAYER_KEYS if tiles else ():
+        source = Path(os.path.normpath(config_path.parent / layers[key])) if layers.get(key) else None
+        if source is not None and source.is_file():
+            tile_sources[key] = source
+    if tile_sources:
+        if min_zoom is None:
+            bounds = _config_bounds(config) or _layer_bounds(tile_sources.values())
+            min_zoom = default_min_zoom(bounds, max_zoom) if bounds else max_zoom
+        display_config["tiles"], tile_stats = build_tile_layers(config_path.parent, tile_sources, min_zoom, max_zoom)
+    else:
+        # Still called so tiles from an earlier build do not linger.
+        build_tile_layers(config_path.parent, {}, 0, 0)
+
+    display_config_path = run_dir / display_relpath(config_relpath)
+    write_if_changed(
+        display_config_path,
+        json.dumps(display_config, sort_keys=True, separators=(",", ":")) + "\n",
+    )
+
+    unique_stats = [stats for _target, stats in built.values()]
+    debug = {
+        "map_config_relpath": config_relpath,
+        "display_config_relpath": display_relpath(config_relpath),
+        "tolerance_deg": tolerance,
+        "precision": precision,
+        "layers": layer_stats,
+        "tiles": tile_stats,
+        "total_source_bytes": sum(stats["source_bytes"] for stats in unique_stats),
+        "total_display_bytes": sum(stats["display_bytes"] for stats in unique_stats),
+    }
+    write_if_changed(config_path.parent / MAP_DISPLAY_DEBUG_NAME, json.dumps(debug, sort_keys=True, indent=2) + "\n")
+    return debug
+
+
+def print_debug(run_dir: Path, debug: dict[str, Any] | None) -> None:
+    if debug is None:
+        print(f"SKIP: no map config in {run_dir}")
+        return
+    for layer in debug["layers"]:
+        print(
+            f"{run_dir.name}: {layer['layer']}: {layer['source_bytes']} -> {layer['display_bytes']} bytes "
+            f"(-{layer['reduction_pct']}%), {layer['source_vertices']} -> {layer['display_vertices']} vertices"
+        )
+    for layer in debug["tiles"]:
+        print(
+            f"{run_dir.name}: {layer['layer']}: {layer['tiles']} tiles, "
+            f"{layer['tile_bytes_total']} bytes (largest {layer['tile_bytes_max']})"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Write simplified, coordinate-quantized display copies of the AOI map layers."
+    )
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--run-dir", help="Path to site/aoi_reports/runs/<run_id>")
+    target.add_argument("--runs-dir", help="Batch mode: every run under site/aoi_reports/runs/")
+    parser.add_argument("--report-json-name", default=None, help="Run report JSON filename (default: auto-detect)")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE_DEG,
+        help=f"Douglas-Peucker tolerance in degrees (default: {DEFAULT_TOLERANCE_DEG})",
+    )
+    parser.add_argument(
+        "--precision",
+        type=int,
+        default=DEFAULT_PRECISION,
+        help=f"Coordinate decimals kept (default: {DEFAULT_PRECISION})",
+    )
+    parser.add_argument("--no-tiles", action="store_true", help="Do not build the z/x/y tile pyramid")
+    parser.add_argument(
+        "--min-zoom",
+        type=int,
+        default=None,
+        help="Lowest tile zoom (default: the zoom at which the AOI spans about one tile)",
+    )
+    parser.add_argument(
+        "--max-zoom",
+        type=int,
+        default=DEFAULT_MAX_ZOOM,
+        help=f"Highest tile zoom; the map over-zooms past it (default: {DEFAULT_MAX_ZOOM})",
+    )
+    args = parser.parse_args()
+    if args.min_zoom is not None and not 0 <= args.min_zoom <= args.max_zoom:
+        parser.error("--min-zoom must be between 0 and --max-zoom")
+    options = {
+        "tolerance": args.tolerance,
+        "precision": args.precision,
+        "tiles": not args.no_tiles,
+        "min_zoom": args.min_zoom,
+        "max_zoom": args.max_zoom,
+    }
+
+    if args.runs_dir:
+        if args.report_json_name:
+            parser.error("--report-json-name cannot be combined with --runs-dir")
+        runs_dir = Path(args.runs_dir)
+        if not runs_dir.is_dir():
+            raise SystemExit(f"Runs dir not found: {runs_dir}")
+        for run_dir in iter_runs(runs_dir):
+            print_debug(run_dir, build_run_display_layers(run_dir, None, **options))
+        return 0
+
+    run_dir = Path(args.run_dir)
+    if not run_dir.is_dir():
+        raise SystemExit(f"Run dir not found: {run_dir}")
+    print_debug(run_dir, build_run_display_layers(run_dir, args.report_json_name, **options))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
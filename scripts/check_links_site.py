@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote
+
+import profiling
+
+
+IGNORED_SCHEMES = ("http://", "https://", "mailto:", "tel:", "data:", "javascript:")
+LINK_ATTRS = {"href", "src"}
+
+
+class PageParser(HTMLParser):
+    """Collects href/src values and fragment targets (id, <a name>) of one page."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.links: list[str] = []
+        self.ids: set[str] = set()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        for key, value in attrs:
+            if value is None:
+                continue
+            if key in LINK_ATTRS:
+                self.links.append(value)
+            elif key == "id" or (key == "name" and tag == "a"):
+                self.ids.add(value)
+
+
+@dataclass(frozen=True)
+class ParsedPage:
+    relpath: str
+    links: tuple[str, ...]
+    ids: frozenset[str]
+
+
+def parse_page(site_root: str, relpath: str) -> ParsedPage:
+    parser = PageParser()
+    path = Path(site_root) / relpath
+    parser.feed(path.read_text(encoding="utf-8", errors="replace"))
+    profiling.add_read_file(path)
+    parser.close()
+    return ParsedPage(relpath=relpath, links=tuple(parser.links), ids=frozenset(parser.ids))
+
+
+def _parse_chunk(site_root: str, relpaths: list[str]) -> list[ParsedPage]:
+    with profiling.span("parse_chunk"):
+        return [parse_page(site_root, relpath) for relpath in relpaths]
+
+
+def iter_site_pages(site_root: Path) -> list[str]:
+    """Every .html page under site_root, skipping hidden folders such as .objects/."""
+
+    pages = []
+    for dirpath, dirnames, filenames in os.walk(site_root):
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith("."))
+        for filename in filenames:
+            if filename.endswith(".html") and not filename.startswith("."):
+                pages.append((Path(dirpath) / filename).relative_to(site_root).as_posix())
+    return sorted(pages)
+
+
+def parse_pages(site_root: Path, relpaths: list[str], jobs: int) -> dict[str, ParsedPage]:
+    if jobs <= 1 or len(relpaths) <= 1:
+        return {relpath: parse_page(str(site_root), relpath) for relpath in relpaths}
+    # Pages are parsed in a few chunks per worker so process start-up and pickling stay cheap.
+    chunk_size = max(1, len(relpaths) // (jobs * 4))
+    chunks = [relpaths[start : start + chunk_size] for start in range(0, len(relpaths), chunk_size)]
+    parsed: dict[str, ParsedPage] = {}
+    parse_chunk = partial(profiling.call_in_worker, profiling.enabled(), _parse_chunk, str(site_root))
+    with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as executor:
+        for pages, spans in executor.map(parse_chunk, chunks):
+            profiling.merge(spans)
+            parsed.update((page.relpath, page) for page in pages)
+    return parsed
+
+
+class TargetIndex:
+    """Memoized existence checks and fragment ids, shared across every page."""
+
+    def __init__(self, site_root: Path, pages: dict[str, ParsedPage]) -> None:
+        self.site_root = site_root
+        self.pages = pages
+        self._kinds: dict[str, str | None] = {}
+        self._inside: dict[str, bool] = {}
+
+    def inside(self, relpath: str) -> bool:
+        """Whether relpath, with symlinks resolved, stays under the site root."""
+
+        if relpath not in self._inside:
+            self._inside[relpath] = (self.site_root / relpath).resolve().is_relative_to(self.site_root)
+        return self._inside[relpath]
+
+    def kind(self, relpath: str) -> str | None:
+        """'file', 'dir' or None for a site-relative path."""
+
+        if relpath not in self._kinds:
+            path = self.site_root / relpath
+            self._kinds[relpath] = "file" if path.is_file() else "dir" if path.is_dir() else None
+        return self._kinds[relpath]
+
+    def ids(self, relpath: str) -> frozenset[str] | None:
+        """Fragment ids of an HTML target (a directory means its index.html), None if unknown."""
+
+        if self.kind(relpath) == "dir":
+            relpath = f"{relpath}/index.html" if relpath else "index.html"
+        page = self.pages.get(relpath)
+        if page is None and relpath.endswith(".html") and self.kind(relpath) == "file":
+            page = self.pages[relpath] = parse_page(str(self.site_root), relpath)
+        return page.ids if page is not None else None
+
+
+def _site_relpath(page_relpath: str, target: str) -> str | None:
+    """Normalize target relative to the page; None when it lexically leaves the site root.
+
+    Symlinks are not followed here; TargetIndex.inside() checks the resolved path.
+    """
+
+    joined = os.path.normpath(os.path.join(os.path.dirname(page_relpath), unquote(target)))
+    if joined == ".":
+        return ""
+    if joined == ".." or joined.startswith("../") or os.path.isabs(joined):
+        return None
+    return joined.replace(os.sep, "/")
+
+
+def check_page(page: ParsedPage, targets: TargetIndex) -> tuple[list[dict[str, str]], int, int]:
+    """Problems on one page plus the number of links and fragments checked."""
+
+    problems: list[dict[str, str]] = []
+    links_checked = 0
+    fragments_checked = 0
+    for link in page.links:
+        url = link.strip()
+        if not url or url == "#" or url.lower().startswith(IGNORED_SCHEMES):
+            continue
+        links_checked += 1
+        if url.startswith("/"):
+            problems.append({"page": page.relpath, "link": link, "reason": "absolute_link"})
+            continue
+        path_part, _, fragment = url.partition("#")
+        path_part = path_part.split("?", 1)[0]
+        if path_part:
+            relpath = _site_relpath(page.relpath, path_part)
+            if relpath is None or not targets.inside(relpath):
+                problems.append({"page": page.relpath, "link": link, "reason": "escapes_site_root"})
+                continue
+            if targets.kind(relpath) is None:
+                problems.append({"page": page.relpath, "link": link, "reason": "missing_target"})
+                continue
+        else:
+            relpath = page.relpath
+        if fragment:
+            ids = page.ids if not path_part else targets.ids(relpath)
+            if ids is None:
+                continue
+            fragments_checked += 1
+            if unquote(fragment) not in ids:
+                problems.append({"page": page.relpath, "link": link, "reason": "missing_fragment"})
+    return problems, links_checked, fragments_checked
+
+
+def load_known_broken(path: Path) -> set[tuple[str, str]]:
+    """`<page relpath> <link>` pairs, one per line; blank lines and # comments are skipped."""
+
+    known: set[tuple[str, str]] = set()
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        page, _, link = line.partition(" ")
+        if not link.strip():
+            raise SystemExit(f"Malformed known-broken entry in {path}: {line}")
+        known.add((page, link.strip()))
+    return known
+
+
+def check_site(site_root: Path, jobs: int = 1, known_broken: set[tuple[str, str]] | None = None) -> dict[str, Any]:
+    """Check every local link and #fragment on every page; returns the link_check.json payload.
+
+    Missing targets listed in known_broken are reported separately and do not fail
+    the check; entries that no longer break are returned as stale_known_broken.
+    """
+
+    site_root = site_root.resolve()
+    with profiling.span("parse_pages"):
+        relpaths = iter_site_pages(site_root)
+        pages = parse_pages(site_root, relpaths, jobs)
+    targets = TargetIndex(site_root, pages)
+
+    known_broken = known_broken or set()
+    broken: list[dict[str, str]] = []
+    known: list[dict[str, str]] = []
+    disallowed: list[dict[str, str]] = []
+    md_links: list[dict[str, str]] = []
+    links_checked = 0
+    fragments_checked = 0
+    for relpath in relpaths:
+        page = pages[relpath]
+        with profiling.span("check_page"):
+            problems, links, fragments = check_page(page, targets)
+        links_checked += links
+        fragments_checked += fragments
+        # A link repeated on a page is one problem, not one per occurrence.
+        reported: set[str] = set()
+        for problem in problems:
+            if problem["link"] in reported:
+                continue
+            reported.add(problem["link"])
+            if problem["reason"] in {"absolute_link", "escapes_site_root"}:
+                disallowed.append(problem)
+            elif (problem["page"], problem["link"]) in known_broken:
+                known.append(problem)
+            else:
+                broken.append(problem)
+        md_links.extend(
+            {"page": relpath, "link": link}
+            for link in page.links
+            if link.split("#", 1)[0].split("?", 1)[0].endswith(".md") and not link.lower().startswith(IGNORED_SCHEMES)
+        )
+    return {
+        "status": "FAIL" if broken or disallowed else "PASS",
+        "scanned_files": len(relpaths),
+        "links_checked": links_checked,
+        "fragments_checked": fragments_checked,
+        "broken": broken,
+        "disallowed": disallowed,
+        "known_broken": known,
+        "stale_known_broken": [
+            {"page": page, "link": link}
+            for page, link in sorted(known_broken - {(item["page"], item["link"]) for item in known})
+        ],
+        "md_links": md_links,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check local links and #fragments on every page of the static site.")
+    parser.add_argument("--site-root", default="docs/site", help="Root folder containing site HTML")
+    parser.add_argument("--jobs", type=int, default=0, help="Parser processes (default: 0 = one per CPU)")
+    parser.add_argument("--output", default=None, help="Write the machine-readable result (e.g. docs/link_check.json)")
+    parser.add_argument(
+        "--known-broken",
+        default=None,
+        help="File of '<page> <link>' pairs that are reported but do not fail the check",
+    )
+    profiling.add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    site_root = Path(args.site_root)
+    if not site_root.is_dir():
+        raise SystemExit(f"Site root not found: {site_root}")
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    known_broken = load_known_broken(Path(args.known_broken)) if args.known_broken else set()
+    with profiling.session_from_args(args, "check_links_site"):
+        result = check_site(site_root, jobs, known_broken)
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    for item in result["known_broken"]:
+        print(f"WARN: known broken link in {item['page']}: {item['link']}")
+    for item in result["stale_known_broken"]:
+        print(f"WARN: known-broken entry no longer fails, remove it: {item['page']} {item['link']}")
+    problems = result["disallowed"] + result["broken"]
+    if problems:
+        print("FAIL: local link check failed")
+        for problem in problems:
+            print(f"- {problem['reason']} in {problem['page']}: {problem['link']}")
+        return 2
+    print(
+        f"PASS: local link check passed ({result['scanned_files']} pages scanned, "
+        f"{result['links_checked']} links, {result['fragments_checked']} fragments)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import errno
+import json
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from aoi_report_renderer import DigestCache, EvidenceIndex, iter_runs, load_report, sha256_hex
+from validate_aoi_run_artifacts import resolve_report_json_path
+
+
+OBJECTS_DIR_NAME = ".objects"
+# Linux FICLONE ioctl (btrfs, XFS, bcachefs); other filesystems fall back to hardlinks.
+FICLONE = 0x40049409
+LINK_MODES = ("auto", "hardlink", "reflink")
+
+
+class LinkUnsupported(OSError):
+    pass
+
+
+def reflink(source: Path, target: Path) -> None:
+    try:
+        import fcntl
+    except ImportError as exc:  # not available on Windows
+        raise LinkUnsupported(errno.EOPNOTSUPP, "reflink requires fcntl") from exc
+    with source.open("rb") as src, target.open("wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError as exc:
+            raise LinkUnsupported(exc.errno, f"reflink not supported: {exc.strerror}") from exc
+    shutil.copystat(source, target)
+
+
+def link_or_clone(source: Path, target: Path, mode: str) -> str:
+    """Atomically replace target with a hardlink or reflink of source; returns the method used."""
+
+    tmp = target.with_name(f".{target.name}.dedup-tmp")
+    tmp.unlink(missing_ok=True)
+    methods = {"auto": ("reflink", "hardlink"), "hardlink": ("hardlink",), "reflink": ("reflink",)}[mode]
+    for method in methods:
+        try:
+            if method == "reflink":
+                reflink(source, tmp)
+            else:
+                os.link(source, tmp)
+        except (LinkUnsupported, OSError) as exc:
+            tmp.unlink(missing_ok=True)
+            if isinstance(exc, LinkUnsupported) or exc.errno in {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EOPNOTSUPP}:
+                continue
+            raise
+        os.replace(tmp, target)
+        return method
+    raise LinkUnsupported(errno.EOPNOTSUPP, f"cannot {mode}-link {source} -> {target}")
+
+
+@dataclass
+class DedupReport:
+    files: int = 0
+    total_bytes: int = 0
+    stored: int = 0
+    linked: int = 0
+    already_linked: int = 0
+    skipped: list[dict[str, str]] = field(default_factory=list)
+    objects: dict[str, int] = field(default_factory=dict)
+    sharing: dict[str, int] = field(default_factory=dict)
+    runs: dict[str, dict[str, int]] = field(default_factory=dict)
+    # Declared digests whose files verified, including ones that could not be linked.
+    referenced: set[str] = field(default_factory=set)
+
+    @property
+    def unique_bytes(self) -> int:
+        return sum(self.objects.values())
+
+    @property
+    def bytes_saved(self) -> int:
+        # Every file sharing an object beyond the first is a copy that no longer takes space.
+        return sum((count - 1) * self.objects[digest] for digest, count in self.sharing.items())
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "files": self.files,
+            "unique_objects": len(self.objects),
+            "total_bytes": self.total_bytes,
+            "unique_bytes": self.unique_bytes,
+            "bytes_saved": self.bytes_saved,
+            "stored": self.stored,
+            "linked": self.linked,
+            "already_linked": self.already_linked,
+            "skipped": self.skipped,
+            "runs": self.runs,
+        }
+
+
+class ObjectStore:
+    """Content-addressed blobs under <site-root>/.objects/sha256/<aa>/<rest>."""
+
+    def __init__(self, root: Path, mode: str = "auto", dry_run: bool = False) -> None:
+        self.root = root
+        self.mode = mode
+        self.dry_run = dry_run
+        self._seen: set[str] = set()
+
+    def object_path(self, digest: str) -> Path:
+        return self.root / "sha256" / digest[:2] / digest[2:]
+
+    def put(self, path: Path, digest: str) -> str:
+        """Store path's content under digest and make path share it.
+
+        path must already be verified to hash to digest. Returns "stored" (first copy),
+        "linked" or "already_linked".
+        """
+
+        obj = self.object_path(digest)
+        if self.dry_run and digest in self._seen:
+            return "linked"
+        self._seen.add(digest)
+        if not obj.is_file():
+            if not self.dry_run:
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    link_or_clone(path, obj, self.mode)
+                except LinkUnsupported:
+                    shutil.copy2(path, obj)
+            return "stored"
+        if os.path.samefile(obj, path):
+            return "already_linked"
+        obj_stat, path_stat = obj.stat(), path.stat()
+        if obj_stat.st_size != path_stat.st_size:
+            raise ValueError(f"Object store entry {obj} has the wrong size for {digest}")
+        # A reflink clone has its own inode, so samefile never matches it. The caller has
+        # verified path's digest; a clone also carries the object's mtime (copystat), which
+        # a plain copy usually does not. Re-cloning would only churn the inode and with it
+        # the run's .digest_cache.json entry.
+        if self.mode != "hardlink" and path_stat.st_mtime_ns == obj_stat.st_mtime_ns:
+            return "already_linked"
+        if not self.dry_run:
+            link_or_clone(obj, path, self.mode)
+        return "linked"
+
+    def prune(self, referenced: set[str]) -> int:
+        """Remove objects whose digest no declared artefact refers to any more.
+
+        Reflink clones never raise st_nlink, so the link count cannot tell a live
+        object from an orphan; referenced is collected by dedup_run instead.
+        """
+
+        removed = 0
+        for obj in sorted(self.root.glob("sha256/*/*")):
+            if obj.is_file() and obj.parent.name + obj.name not in referenced:
+                if not self.dry_run:
+                    obj.unlink()
+                removed += 1
+        return removed
+
+
+def verified_digest(run_dir: Path, relpath: str, declared: str, cache: DigestCache) -> str | None:
+    """The declared digest if it matches the file on disk (via .digest_cache.json when fresh)."""
+
+    path = run_dir / relpath
+    stat = path.stat()
+    digest = cache.lookup(relpath, stat)
+    if digest is None:
+        digest = sha256_hex(path)
+        cache.store(relpath, stat, digest)
+    return digest if digest == declared else None
+
+
+def dedup_run(run_dir: Path, store: ObjectStore, report: DedupReport) -> None:
+    evidence = EvidenceIndex.from_report(load_report(resolve_report_json_path(run_dir)))
+    cache = DigestCache.for_run(run_dir)
+    run_stats = report.runs.setdefault(run_dir.name, {"files": 0, "bytes": 0, "duplicate_bytes": 0})
+    for entry in evidence.entries:
+        relpath = entry.get("relpath")
+        declared = entry.get("sha256")
+        if not relpath or not isinstance(declared, str) or not (run_dir / relpath).is_file():
+            continue
+        path = run_dir / relpath
+        if path.is_symlink():
+            report.skipped.append({"path": f"{run_dir.name}/{relpath}", "reason": "symlink"})
+            continue
+        digest = verified_digest(run_dir, relpath, declared, cache)
+        if digest is None:
+            report.skipped.append({"path": f"{run_dir.name}/{relpath}", "reason": "declared sha256 is stale"})
+            continue
+        report.referenced.add(digest)
+
+        size = path.stat().st_size
+        try:
+            outcome = store.put(path, digest)
+        except LinkUnsupported as exc:
+            report.skipped.append({"path": f"{run_dir.name}/{relpath}", "reason": str(exc)})
+            continue
+        setattr(report, outcome, getattr(report, outcome) + 1)
+        report.files += 1
+        report.total_bytes += size
+        report.objects[digest] = size
+        report.sharing[digest] = report.sharing.get(digest, 0) + 1
+        run_stats["files"] += 1
+        run_stats["bytes"] += size
+        if report.sharing[digest] > 1:
+            run_stats["duplicate_bytes"] += size
+        if outcome == "linked" and not store.dry_run:
+            cache.store(relpath, path.stat(), digest)
+    if not store.dry_run:
+        cache.save()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Deduplicate declared AOI evidence artefacts through a content-addressed object store."
+    )
+    parser.add_argument("--site-root", default="docs/site", help="Root folder containing site HTML")
+    parser.add_argument(
+        "--mode",
+        choices=LINK_MODES,
+        default="auto",
+        help="How declared paths share store objects (default: auto = reflink, else hardlink)",
+    )
+    parser.add_argument("--prune", action="store_true", help="Remove store objects no declared artefact refers to")
+    parser.add_argument("--dry-run", action="store_true", help="Report savings without touching any file")
+    parser.add_argument("--report-json", default=None, help="Write the dedup report to this path")
+    args = parser.parse_args()
+
+    site_root = Path(args.site_root)
+    runs_dir = site_root / "aoi_reports" / "runs"
+    if not runs_dir.is_dir():
+        raise SystemExit(f"Runs dir not found: {runs_dir}")
+
+    store = ObjectStore(site_root / OBJECTS_DIR_NAME, mode=args.mode, dry_run=args.dry_run)
+    report = DedupReport()
+    for run_dir in iter_runs(runs_dir):
+        dedup_run(run_dir, store, report)
+    pruned = store.prune(report.referenced) if args.prune else 0
+
+    summary = report.as_dict()
+    summary["pruned_objects"] = pruned
+    if args.report_json:
+        Path(args.report_json).write_text(json.dumps(summary, sort_keys=True, indent=2) + "\n", encoding="utf-8")
+    for skipped in report.skipped:
+        print(f"SKIP: {skipped['path']} ({skipped['reason']})")
+    print(
+        f"{summary['files']} declared files, {summary['unique_objects']} unique objects: "
+        f"{summary['total_bytes']} -> {summary['unique_bytes']} bytes "
+        f"({summary['bytes_saved']} saved; {report.linked} newly linked, {report.already_linked} already linked)"
+        + (" [dry run]" if args.dry_run else "")
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
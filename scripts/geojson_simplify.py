@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import math
+from typing import Any
+
+
+Point = list[float]
+
+
+def _segment_distance(point: Point, start: Point, end: Point) -> float:
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    if dx == 0 and dy == 0:
+        return math.hypot(point[0] - start[0], point[1] - start[1])
+    t = ((point[0] - start[0]) * dx + (point[1] - start[1]) * dy) / (dx * dx + dy * dy)
+    t = max(0.0, min(1.0, t))
+    return math.hypot(point[0] - (start[0] + t * dx), point[1] - (start[1] + t * dy))
+
+
+def simplify_line(points: list[Point], tolerance: float) -> list[Point]:
+    """Douglas-Peucker simplification of an open line; endpoints are always kept."""
+
+    if len(points) <= 2 or tolerance < 0:
+        return list(points)
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        farthest = -1
+        farthest_distance = tolerance
+        for index in range(first + 1, last):
+            distance = _segment_distance(points[index], points[first], points[last])
+            if distance > farthest_distance:
+                farthest, farthest_distance = index, distance
+        if farthest != -1:
+            keep[farthest] = True
+            stack.append((first, farthest))
+            stack.append((farthest, last))
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def simplify_ring(ring: list[Point], tolerance: float) -> list[Point]:
+    """Simplify a closed ring, splitting it at the vertex farthest from its start."""
+
+    if len(ring) < 4 or ring[0] != ring[-1]:
+        return simplify_line(ring, tolerance)
+    start = ring[0]
+
+    def distance_from_start(index: int) -> float:
+        return math.hypot(ring[index][0] - start[0], ring[index][1] - start[1])
+
+    split = max(range(1, len(ring) - 1), key=distance_from_start)
+    head = simplify_line(ring[: split + 1], tolerance)
+    tail = simplify_line(ring[split:], tolerance)
+    return head + tail[1:]
+
+
+def quantize(points: list[Point], precision: int) -> list[Point]:
+    """Round coordinates to `precision` decimals, dropping consecutive duplicates."""
+
+    quantized: list[Point] = []
+    for point in points:
+        rounded = [round(value, precision) for value in point[:2]]
+        if not quantized or quantized[-1] != rounded:
+            quantized.append(rounded)
+    return quantized
+
+
+def _valid_ring(ring: list[Point]) -> bool:
+    return len(ring) >= 4 and ring[0] == ring[-1]
+
+
+def _display_ring(ring: list[Point], tolerance: float, precision: int) -> list[Point] | None:
+    # Rings the tolerance would collapse (e.g. single-pixel masks) keep their
+    # unsimplified outline so small patches stay visible on the map.
+    simplified = quantize(simplify_ring(ring, tolerance), precision)
+    if _valid_ring(simplified):
+        return simplified
+    quantized = quantize(ring, precision)
+    return quantized if _valid_ring(quantized) else None
+
+
+def _display_polygon(rings: list[list[Point]], tolerance: float, precision: int) -> list[list[Point]] | None:
+    if not rings:
+        return None
+    exterior = _display_ring(rings[0], tolerance, precision)
+    if exterior is None:
+        return None
+    holes = [hole for hole in (_display_ring(ring, tolerance, precision) for ring in rings[1:]) if hole]
+    return [exterior, *holes]
+
+
+def simplify_geometry(geometry: dict[str, Any] | None, tolerance: float, precision: int) -> dict[str, Any] | None:
+    """Return a simplified, quantized copy of a GeoJSON geometry, or None if it collapses."""
+
+    if not isinstance(geometry, dict):
+        return geometry
+    kind = geometry.get("type")
+    coordinates = geometry.get("coordinates")
+    if kind == "Point":
+        simplified: Any = [round(value, precision) for value in coordinates[:2]]
+    elif kind == "MultiPoint":
+        simplified = [[round(value, precision) for value in point[:2]] for point in coordinates]
+    elif kind == "LineString":
+        simplified = quantize(simplify_line(coordinates, tolerance), precision)
+        if len(simplified) < 2:
+            return None
+    elif kind == "MultiLineString":
+        lines = [quantize(simplify_line(line, tolerance), precision) for line in coordinates]
+        simplified = [line for line in lines if len(line) >= 2]
+        if not simplified:
+            return None
+    elif kind == "Polygon":
+        simplified = _display_polygon(coordinates, tolerance, precision)
+        if simplified is None:
+            return None
+    elif kind == "MultiPolygon":
+        polygons = [_display_polygon(polygon, tolerance, precision) for polygon in coordinates]
+        simplified = [polygon for polygon in polygons if polygon]
+        if not simplified:
+            return None
+    elif kind == "GeometryCollection":
+        members = [simplify_geometry(member, tolerance, precision) for member in geometry.get("geometries", [])]
+        return {**geometry, "geometries": [member for member in members if member]}
+    else:
+        return geometry
+    return {**geometry, "coordinates": simplified}
+
+
+def simplify_feature_collection(data: dict[str, Any], tolerance: float, precision: int) -> dict[str, Any]:
+    """Simplify every feature geometry; features that collapse below `precision` are dropped."""
+
+    features = []
+    for feature in data.get("features", []):
+        if not isinstance(feature, dict):
+            continue
+        geometry = feature.get("geometry")
+        simplified = simplify_geometry(geometry, tolerance, precision)
+        if geometry is not None and simplified is None:
+            continue
+        features.append({**feature, "geometry": simplified})
+    return {**data, "features": features}
+
+
+def count_vertices(value: Any) -> int:
+    """Number of coordinate positions in a GeoJSON object."""
+
+    if isinstance(value, dict):
+        if "coordinates" in value:
+            return count_vertices(value["coordinates"])
+        if value.get("type") == "GeometryCollection":
+            return sum(count_vertices(member) for member in value.get("geometries", []))
+        if value.get("type") == "Feature":
+            return count_vertices(value.get("geometry"))
+        return sum(count_vertices(feature) for feature in value.get("features", []))
+    if isinstance(value, list):
+        if value and isinstance(value[0], (int, float)):
+            return 1
+        return sum(count_vertices(item) for item in value)
+    return 0
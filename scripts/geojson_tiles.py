@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Iterable, Iterator
+
+from geojson_simplify import simplify_geometry
+
+
+Bounds = tuple[float, float, float, float]  # (min_lon, min_lat, max_lon, max_lat)
+TileKey = tuple[int, int, int]  # (z, x, y)
+
+TILE_SIZE_PX = 256
+MAX_MERCATOR_LAT = 85.05112878
+DEFAULT_MAX_ZOOM = 14
+
+
+def tile_x(lon: float, zoom: int) -> int:
+    n = 2**zoom
+    return min(n - 1, max(0, int((lon + 180.0) / 360.0 * n)))
+
+
+def tile_y(lat: float, zoom: int) -> int:
+    n = 2**zoom
+    lat_rad = math.radians(max(-MAX_MERCATOR_LAT, min(MAX_MERCATOR_LAT, lat)))
+    y = (1.0 - math.log(math.tan(lat_rad) + 1.0 / math.cos(lat_rad)) / math.pi) / 2.0 * n
+    return min(n - 1, max(0, int(y)))
+
+
+def zoom_tolerance(zoom: int) -> float:
+    """Douglas-Peucker tolerance in degrees: half a screen pixel at `zoom`."""
+
+    return 360.0 / (TILE_SIZE_PX * 2**zoom) / 2.0
+
+
+def zoom_precision(zoom: int) -> int:
+    """Coordinate decimals that keep rounding under a quarter pixel at `zoom`."""
+
+    return min(7, max(0, math.ceil(-math.log10(360.0 / (TILE_SIZE_PX * 2**zoom) / 4.0))))
+
+
+def default_min_zoom(bounds: Bounds, max_zoom: int = DEFAULT_MAX_ZOOM) -> int:
+    """The zoom at which the bounds span about one tile, i.e. the AOI overview."""
+
+    span = max(bounds[2] - bounds[0], bounds[3] - bounds[1], 1e-9)
+    return max(0, min(max_zoom, int(math.log2(360.0 / span))))
+
+
+def _positions(coordinates: Any) -> Iterator[list[float]]:
+    if isinstance(coordinates, list) and coordinates and isinstance(coordinates[0], (int, float)):
+        yield coordinates
+    elif isinstance(coordinates, list):
+        for item in coordinates:
+            yield from _positions(item)
+
+
+def geometry_bounds(geometry: dict[str, Any] | None) -> Bounds | None:
+    if not isinstance(geometry, dict):
+        return None
+    if geometry.get("type") == "GeometryCollection":
+        members = [geometry_bounds(member) for member in geometry.get("geometries", [])]
+        return union_bounds(member for member in members if member)
+    lons: list[float] = []
+    lats: list[float] = []
+    for position in _positions(geometry.get("coordinates")):
+        lons.append(position[0])
+        lats.append(position[1])
+    if not lons:
+        return None
+    return (min(lons), min(lats), max(lons), max(lats))
+
+
+def union_bounds(bounds: Iterable[Bounds]) -> Bounds | None:
+    merged: Bounds | None = None
+    for item in bounds:
+        if merged is None:
+            merged = item
+        else:
+            merged = (min(merged[0], item[0]), min(merged[1], item[1]), max(merged[2], item[2]), max(merged[3], item[3]))
+    return merged
+
+
+def tile_bounds(zoom: int, x: int, y: int) -> Bounds:
+    n = 2**zoom
+
+    def lat(row: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1.0 - 2.0 * row / n))))
+
+    return (x / n * 360.0 - 180.0, lat(y + 1), (x + 1) / n * 360.0 - 180.0, lat(y))
+
+
+def _clip_edge(points: list[list[float]], axis: int, limit: float, keep_above: bool) -> list[list[float]]:
+    """One Sutherland-Hodgman pass against the line `point[axis] == limit`."""
+
+    def inside(point: list[float]) -> bool:
+        return point[axis] >= limit if keep_above else point[axis] <= limit
+
+    clipped: list[list[float]] = []
+    for index, current in enumerate(points):
+        previous = points[index - 1]
+        if inside(current) != inside(previous):
+            t = (limit - previous[axis]) / (current[axis] - previous[axis])
+            crossing = [previous[0] + t * (current[0] - previous[0]), previous[1] + t * (current[1] - previous[1])]
+            crossing[axis] = limit
+            clipped.append(crossing)
+        if inside(current):
+            clipped.append(current)
+    return clipped
+
+
+def clip_ring(ring: list[list[float]], bounds: Bounds, precision: int) -> list[list[float]] | None:
+    """Clip a closed ring to bounds; None when nothing of it is left."""
+
+    points = [point[:2] for point in ring[:-1]] if ring and ring[0] == ring[-1] else [point[:2] for point in ring]
+    for axis, limit, keep_above in ((0, bounds[0], True), (0, bounds[2], False), (1, bounds[1], True), (1, bounds[3], False)):
+        if not points:
+            return None
+        points = _clip_edge(points, axis, limit, keep_above)
+    rounded: list[list[float]] = []
+    for point in points:
+        position = [round(point[0], precision), round(point[1], precision)]
+        if not rounded or rounded[-1] != position:
+            rounded.append(position)
+    if len(rounded) > 1 and rounded[0] == rounded[-1]:
+        rounded.pop()
+    if len(rounded) < 3:
+        return None
+    return [*rounded, rounded[0]]
+
+
+def _clip_polygon(rings: list[list[list[float]]], bounds: Bounds, precision: int) -> list[list[list[float]]] | None:
+    exterior = clip_ring(rings[0], bounds, precision) if rings else None
+    if exterior is None:
+        return None
+    holes = [hole for hole in (clip_ring(ring, bounds, precision) for ring in rings[1:]) if hole]
+    return [exterior, *holes]
+
+
+def _clip_line(points: list[list[float]], bounds: Bounds) -> list[list[list[float]]]:
+    """Liang-Barsky clip of each segment, joining consecutive visible pieces."""
+
+    lines: list[list[list[float]]] = []
+    current: list[list[float]] = []
+    for start, end in zip(points, points[1:]):
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        t0, t1 = 0.0, 1.0
+        visible = True
+        for p, q in ((-dx, start[0] - bounds[0]), (dx, bounds[2] - start[0]), (-dy, start[1] - bounds[1]), (dy, bounds[3] - start[1])):
+            if p == 0:
+                if q < 0:
+                    visible = False
+                    break
+                continue
+            t = q / p
+            if p < 0:
+                t0 = max(t0, t)
+            else:
+                t1 = min(t1, t)
+        if not visible or t0 > t1:
+            if len(current) >= 2:
+                lines.append(current)
+            current = []
+            continue
+        a = [start[0] + t0 * dx, start[1] + t0 * dy]
+        b = [start[0] + t1 * dx, start[1] + t1 * dy]
+        if not current or current[-1] != a:
+            if len(current) >= 2:
+                lines.append(current)
+            current = [a]
+        current.append(b)
+    if len(current) >= 2:
+        lines.append(current)
+    return lines
+
+
+def clip_geometry(geometry: dict[str, Any], bounds: Bounds, precision: int) -> dict[str, Any] | None:
+    """The part of a geometry inside bounds, or None when it lies outside."""
+
+    kind = geometry.get("type")
+    coordinates = geometry.get("coordinates")
+
+    def inside(point: list[float]) -> bool:
+        return bounds[0] <= point[0] <= bounds[2] and bounds[1] <= point[1] <= bounds[3]
+
+    if kind == "Point":
+        return geometry if inside(coordinates) else None
+    if kind == "MultiPoint":
+        points = [point for point in coordinates if inside(point)]
+        return {**geometry, "coordinates": points} if points else None
+    if kind in {"LineString", "MultiLineString"}:
+        lines = coordinates if kind == "MultiLineString" else [coordinates]
+        pieces = [
+            [[round(value, precision) for value in point] for point in piece]
+            for line in lines
+            for piece in _clip_line(line, bounds)
+        ]
+        if not pieces:
+            return None
+        if len(pieces) == 1:
+            return {**geometry, "type": "LineString", "coordinates": pieces[0]}
+        return {**geometry, "type": "MultiLineString", "coordinates": pieces}
+    if kind in {"Polygon", "MultiPolygon"}:
+        polygons = coordinates if kind == "MultiPolygon" else [coordinates]
+        clipped = [polygon for polygon in (_clip_polygon(rings, bounds, precision) for rings in polygons) if polygon]
+        if not clipped:
+            return None
+        if len(clipped) == 1:
+            return {**geometry, "type": "Polygon", "coordinates": clipped[0]}
+        return {**geometry, "type": "MultiPolygon", "coordinates": clipped}
+    if kind == "GeometryCollection":
+        members = [clip_geometry(member, bounds, precision) for member in geometry.get("geometries", [])]
+        members = [member for member in members if member]
+        return {**geometry, "geometries": members} if members else None
+    return geometry
+
+
+def drop_small_holes(geometry: dict[str, Any], min_extent: float) -> dict[str, Any]:
+    """Remove polygon holes narrower and shorter than min_extent degrees."""
+
+    def large(ring: list[list[float]]) -> bool:
+        bounds = geometry_bounds({"type": "LineString", "coordinates": ring})
+        return bounds is not None and max(bounds[2] - bounds[0], bounds[3] - bounds[1]) >= min_extent
+
+    kind = geometry.get("type")
+    if kind == "Polygon" and geometry.get("coordinates"):
+        rings = geometry["coordinates"]
+        return {**geometry, "coordinates": [rings[0], *[ring for ring in rings[1:] if large(ring)]]}
+    if kind == "MultiPolygon":
+        return {
+            **geometry,
+            "coordinates": [[rings[0], *[ring for ring in rings[1:] if large(ring)]] for rings in geometry["coordinates"] if rings],
+        }
+    return geometry
+
+
+def build_tile_pyramid(
+    data: dict[str, Any],
+    min_zoom: int,
+    max_zoom: int,
+) -> dict[TileKey, tuple[dict[str, Any], Bounds]]:
+    """Cut a FeatureCollection into z/x/y tiles for every zoom in [min_zoom, max_zoom].
+
+    Each feature is simplified for the zoom; below max_zoom, holes smaller than a
+    screen pixel are dropped. A feature that fits in one tile goes into it whole,
+    larger ones are clipped to every tile they cover. Returns
+    {(z, x, y): (feature collection, bounds of the tile's content)}.
+    """
+
+    tiles: dict[TileKey, tuple[list[dict[str, Any]], list[Bounds]]] = {}
+    features = [feature for feature in data.get("features", []) if isinstance(feature, dict)]
+    for zoom in range(min_zoom, max_zoom + 1):
+        tolerance = zoom_tolerance(zoom)
+        precision = zoom_precision(zoom)
+        for feature in features:
+            geometry = simplify_geometry(feature.get("geometry"), tolerance, precision)
+            if geometry is not None and zoom < max_zoom:
+                geometry = drop_small_holes(geometry, 2.0 * tolerance)
+            bounds = geometry_bounds(geometry)
+            if geometry is None or bounds is None:
+                continue
+            x0, x1 = tile_x(bounds[0], zoom), tile_x(bounds[2], zoom)
+            y0, y1 = tile_y(bounds[3], zoom), tile_y(bounds[1], zoom)
+            for x in range(x0, x1 + 1):
+                for y in range(y0, y1 + 1):
+                    if x0 == x1 and y0 == y1:
+                        piece, piece_bounds = geometry, bounds
+                    else:
+                        piece = clip_geometry(geometry, tile_bounds(zoom, x, y), precision)
+                        piece_bounds = geometry_bounds(piece)
+                        if piece is None or piece_bounds is None:
+                            continue
+                    tile_features, content_bounds = tiles.setdefault((zoom, x, y), ([], []))
+                    tile_features.append({**feature, "geometry": piece})
+                    content_bounds.append(piece_bounds)
+
+    pyramid: dict[TileKey, tuple[dict[str, Any], Bounds]] = {}
+    for key in sorted(tiles):
+        tile_features, content_bounds = tiles[key]
+        merged = union_bounds(content_bounds)
+        if merged is not None:
+            pyramid[key] = ({"type": "FeatureCollection", "features": tile_features}, merged)
+    return pyramid
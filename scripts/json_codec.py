@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import math
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is not installed
+    orjson = None
+
+
+# Output must stay byte-identical to json.dumps(..., ensure_ascii=False) whichever
+# backend is used. orjson differs from stdlib only in float exponent notation
+# ("1e16" vs "1e+16") and non-finite floats, so values containing those, along with
+# anything orjson rejects (non-str keys, ints beyond 64 bits, lone surrogates),
+# go through stdlib json instead.
+BACKEND = "orjson" if orjson is not None else "json"
+BACKENDS = ("orjson", "json") if orjson is not None else ("json",)
+# orjson parses integers outside the 64-bit range as floats instead of failing;
+# any run of 19+ digits sends the document to stdlib json.
+_LONG_DIGITS = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+
+
+def _resolve_backend(backend: str | None) -> str:
+    backend = backend or BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"JSON backend not available: {backend}")
+    return backend
+
+
+def _orjson_compatible(value: Any) -> bool:
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is dict:
+            stack.extend(item.values())
+        elif kind is list or kind is tuple:
+            stack.extend(item)
+        elif kind is float and (not math.isfinite(item) or "e" in repr(item)):
+            return False
+    return True
+
+
+def loads(data: str | bytes, backend: str | None = None) -> Any:
+    long_digits = _LONG_DIGITS_BYTES if isinstance(data, bytes) else _LONG_DIGITS
+    if _resolve_backend(backend) == "orjson" and not long_digits.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity, big ints and lone surrogates are accepted by stdlib json.
+            pass
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def _dumps(value: Any, sort_keys: bool, indent: bool, backend: str | None) -> str:
+    if _resolve_backend(backend) == "orjson" and _orjson_compatible(value):
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(value, option=option).decode("utf-8")
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(value, sort_keys=sort_keys, indent=2, ensure_ascii=False)
+    return json.dumps(value, sort_keys=sort_keys, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_pretty(value: Any, sort_keys: bool = False, backend: str | None = None) -> str:
+    """json.dumps(value, sort_keys=sort_keys, indent=2, ensure_ascii=False)."""
+
+    return _dumps(value, sort_keys, True, backend)
+
+
+def dumps_compact(value: Any, sort_keys: bool = False, backend: str | None = None) -> str:
+    """json.dumps(value, sort_keys=sort_keys, ensure_ascii=False, separators=(",", ":"))."""
+
+    return _dumps(value, sort_keys, False, backend)
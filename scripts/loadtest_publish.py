@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from synthetic_aoi_bundle import SyntheticSpec, write_synthetic_run
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+ROOT_DIR = SCRIPT_DIR.parent
+DEFAULT_SPEC = SyntheticSpec(evidence=3, parcels=5, criteria=3, results=3, metrics=5, mask_vertices=32, mask_polygons=2)
+# Same filters as the rsync in publish_aoi_run_from_staging.sh: excluded, but they do not
+# stop --delete from removing a directory gone from staging.
+STAGING_PERISHABLE = (".render_cache.json", ".digest_cache.json", "/runs_index.json")
+STAGES = ("staging", "map_layers", "render", "dedup", "index", "nav", "link_check", "precompress", "publish_scope")
+
+Snapshot = dict[str, tuple[int, int, int]]
+
+
+@dataclass(frozen=True)
+class StageResult:
+    stage: str
+    seconds: float
+    files_written: int
+    bytes_written: int
+    files_deleted: int
+
+
+def snapshot(root: Path) -> Snapshot:
+    """relpath -> (size, mtime_ns, inode) for every file under root except .git/."""
+
+    files: Snapshot = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        if dirpath == str(root):
+            dirnames[:] = [name for name in dirnames if name != ".git"]
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            stat = os.lstat(path)
+            files[os.path.relpath(path, root)] = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+    return files
+
+
+def diff_snapshots(before: Snapshot, after: Snapshot) -> tuple[int, int, int]:
+    """Files created or modified, their total size, and files deleted."""
+
+    written = [relpath for relpath, key in after.items() if before.get(relpath) != key]
+    deleted = sum(relpath not in after for relpath in before)
+    return len(written), sum(after[relpath][0] for relpath in written), deleted
+
+
+def _perishable(relpath: str) -> bool:
+    name = relpath.rsplit("/", 1)[-1]
+    return any(
+        relpath == pattern[1:] if pattern.startswith("/") else fnmatch.fnmatch(name, pattern)
+        for pattern in STAGING_PERISHABLE
+    )
+
+
+def mirror_tree(src: Path, dst: Path) -> None:
+    """`rsync -a --delete` with the publish filters, for hosts without rsync."""
+
+    wanted = set()
+    for dirpath, _dirnames, filenames in os.walk(src):
+        for filename in filenames:
+            relpath = (Path(dirpath) / filename).relative_to(src).as_posix()
+            if _perishable(relpath):
+                continue
+            wanted.add(relpath)
+            source, target = src / relpath, dst / relpath
+            source_stat = source.stat()
+            if target.is_file():
+                target_stat = target.stat()
+                if (target_stat.st_size, target_stat.st_mtime_ns) == (source_stat.st_size, source_stat.st_mtime_ns):
+                    continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+    for dirpath, dirnames, filenames in os.walk(dst, topdown=False):
+        for filename in filenames:
+            relpath = (Path(dirpath) / filename).relative_to(dst).as_posix()
+            if relpath in wanted:
+                continue
+            if not _perishable(relpath) or not (src / relpath).parent.is_dir():
+                os.unlink(os.path.join(dirpath, filename))
+        if dirpath != str(dst) and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+
+
+def generate_staging(staging_dir: Path, runs: int, spec: SyntheticSpec) -> None:
+    for index in range(runs):
+        run_spec = SyntheticSpec(**{**asdict(spec), "seed": spec.seed + index})
+        write_synthetic_run(staging_dir / "runs" / f"synthetic_{index:05d}", run_spec, render=False)
+
+
+def prepare_repo(work_root: Path) -> None:
+    """A throwaway git checkout holding docs/ without any AOI runs, as publish starts from."""
+
+    def ignore(directory: str, names: list[str]) -> set[str]:
+        skipped = {name for name in names if name in {".objects", ".precompressed"}}
+        if Path(directory).resolve() == (ROOT_DIR / "docs/site/aoi_reports").resolve():
+            skipped |= {"runs", "runs_index.json", "runs_catalog.json"} | set(fnmatch.filter(names, "page-*.html"))
+        return skipped
+
+    shutil.copytree(ROOT_DIR / "docs", work_root / "docs", ignore=ignore)
+    (work_root / "docs/site/aoi_reports/runs").mkdir(parents=True, exist_ok=True)
+    shutil.copy2(ROOT_DIR / ".gitignore", work_root / ".gitignore")
+    git = ["git", "-c", "user.name=loadtest", "-c", "user.email=loadtest@localhost"]
+    for command in (["init", "-q"], ["add", "-A"], ["commit", "-q", "-m", "baseline"]):
+        subprocess.run(git + command, cwd=work_root, check=True)
+
+
+def stage_commands(jobs: int, page_size: int) -> dict[str, list[str]]:
+    python = [sys.executable]
+    return {
+        "map_layers": python + [str(SCRIPT_DIR / "build_map_display_layers.py"), "--runs-dir", "docs/site/aoi_reports/runs"],
+        "render": python
+        + [str(SCRIPT_DIR / "render_aoi_report_from_json.py"), "--runs-dir", "docs/site/aoi_reports/runs", "--update-json", "--jobs", str(jobs)],
+        "dedup": python + [str(SCRIPT_DIR / "dedup_evidence_objects.py"), "--site-root", "docs/site", "--prune"],
+        "index": python
+        + [str(SCRIPT_DIR / "rebuild_aoi_reports_index.py"), "--site-root", "docs/site", "--full-rescan", "--page-size", str(page_size)],
+        "nav": python + [str(SCRIPT_DIR / "rebuild_site_nav.py"), "--site-root", "docs/site", "--all", "--jobs", str(jobs)],
+        "link_check": python
+        + [
+            str(SCRIPT_DIR / "check_links_site.py"),
+            "--site-root",
+            "docs/site",
+            "--jobs",
+            str(jobs),
+            "--known-broken",
+            "docs/link_check_known_broken.txt",
+        ],
+        "precompress": python + [str(SCRIPT_DIR / "precompress_site.py"), "--site-root", "docs/site"],
+        "publish_scope": ["bash", str(SCRIPT_DIR / "assert_publish_scope.sh")],
+    }
+
+
+def run_pipeline(
+    work_root: Path, staging_dir: Path, runs: int, stages: list[str], jobs: int, page_size: int
+) -> list[StageResult]:
+    commands = stage_commands(jobs, page_size)
+    env = {**os.environ, "EXPECTED_RUN_COUNT": str(runs), "REQUIRED_RUNS": ""}
+    results = []
+    for stage in stages:
+        before = snapshot(work_root)
+        started = time.perf_counter()
+        if stage == "staging":
+            target = work_root / "docs/site/aoi_reports"
+            if shutil.which("rsync"):
+                filters = [f"--filter=-p {pattern}" for pattern in STAGING_PERISHABLE]
+                subprocess.run(["rsync", "-a", "--delete", *filters, f"{staging_dir}/", f"{target}/"], check=True)
+            else:
+                mirror_tree(staging_dir, target)
+        else:
+            completed = subprocess.run(commands[stage], cwd=work_root, env=env, capture_output=True, text=True)
+            if completed.returncode != 0:
+                output = (completed.stdout + completed.stderr).strip().splitlines()
+                raise SystemExit(f"Stage {stage} failed ({completed.returncode}):\n" + "\n".join(output[-20:]))
+        seconds = time.perf_counter() - started
+        files_written, bytes_written, files_deleted = diff_snapshots(before, snapshot(work_root))
+        results.append(StageResult(stage, round(seconds, 6), files_written, bytes_written, files_deleted))
+    return results
+
+
+def load_test(runs: int, spec: SyntheticSpec, stages: list[str], jobs: int, page_size: int, keep: Path | None) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        base = keep if keep is not None else Path(tmp)
+        work_root = base / f"runs_{runs}"
+        if work_root.exists():
+            raise SystemExit(f"Work directory already exists: {work_root}")
+        staging_dir = work_root / "staging"
+        repo_root = work_root / "repo"
+        repo_root.mkdir(parents=True)
+        prepare_repo(repo_root)
+
+        started = time.perf_counter()
+        generate_staging(staging_dir, runs, spec)
+        generate_seconds = time.perf_counter() - started
+
+        results = run_pipeline(repo_root, staging_dir, runs, stages, jobs, page_size)
+    return {
+        "runs": runs,
+        "generate_seconds": round(generate_seconds, 6),
+        "stages": [asdict(result) for result in results],
+        "total_seconds": round(sum(result.seconds for result in results), 6),
+    }
+
+
+def scaling_exponents(reports: list[dict[str, Any]]) -> dict[str, float]:
+    """Per-stage k in time ~ runs**k between the smallest and largest run counts (k > 1 is superlinear)."""
+
+    if len(reports) < 2:
+        return {}
+    small, large = reports[0], reports[-1]
+    if large["runs"] <= small["runs"]:
+        return {}
+    exponents = {}
+    for before, after in zip(small["stages"], large["stages"]):
+        if before["seconds"] > 0 and after["seconds"] > 0:
+            exponents[before["stage"]] = round(
+                math.log(after["seconds"] / before["seconds"]) / math.log(large["runs"] / small["runs"]), 3
+            )
+    return exponents
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Publish N synthetic AOI runs into a throwaway site and time every publish stage (no push, no S3)."
+    )
+    parser.add_argument("--runs", type=int, nargs="+", default=[1000, 10000], help="Run counts to load test")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES), help="Stages to run, in order")
+    parser.add_argument("--jobs", type=int, default=0, help="Worker processes for render/nav/link check (0 = one per CPU)")
+    parser.add_argument("--page-size", type=int, default=0, help="Passed to rebuild_aoi_reports_index.py (0 = single page)")
+    parser.add_argument("--keep", default=None, help="Keep the generated trees under this directory")
+    parser.add_argument("--output", default=None, help="Write the per-stage results as JSON")
+    for name, value in asdict(DEFAULT_SPEC).items():
+        if name != "aoi_id":
+            parser.add_argument(f"--{name.replace('_', '-')}", type=type(value), default=value, help=f"(default: {value})")
+    args = parser.parse_args()
+
+    spec = SyntheticSpec(**{name: getattr(args, name, value) for name, value in asdict(DEFAULT_SPEC).items()})
+    keep = Path(args.keep).resolve() if args.keep else None
+    reports = []
+    for runs in sorted(args.runs):
+        report = load_test(runs, spec, args.stages, args.jobs, args.page_size, keep)
+        reports.append(report)
+        print(f"runs={runs} (generated in {report['generate_seconds']:.2f}s)")
+        print(f"  {'stage':<14} {'seconds':>9} {'ms/run':>8} {'files':>8} {'MiB':>9} {'deleted':>8}")
+        for stage in report["stages"]:
+            print(
+                f"  {stage['stage']:<14} {stage['seconds']:9.2f} {stage['seconds'] * 1000 / runs:8.2f} "
+                f"{stage['files_written']:8d} {stage['bytes_written'] / 2**20:9.2f} {stage['files_deleted']:8d}"
+            )
+        print(f"  {'total':<14} {report['total_seconds']:9.2f}")
+
+    exponents = scaling_exponents(reports)
+    if exponents:
+        print(f"Scaling exponent (time ~ runs^k) from {reports[0]['runs']} to {reports[-1]['runs']} runs:")
+        for stage, exponent in exponents.items():
+            print(f"  {stage:<14} {exponent:6.2f}{'  superlinear' if exponent > 1.2 else ''}")
+
+    if args.output:
+        result = {"spec": asdict(spec), "jobs": args.jobs, "reports": reports, "scaling_exponents": exponents}
+        Path(args.output).write_text(json.dumps(result, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
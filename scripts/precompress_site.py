@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import gzip
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+from aoi_report_renderer import DIGEST_CACHE_NAME, DigestCache, sha256_hex_many, write_text
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip sidecars are written when brotli is not installed
+    brotli = None
+
+
+PRECOMPRESS_MANIFEST_NAME = "precompress_manifest.json"
+# Sidecars live in their own gitignored tree, mirroring the site layout, so genuine
+# .gz/.br artefacts in the site stay trackable and rsync --delete never sees sidecars.
+SIDECAR_DIR_NAME = ".precompressed"
+# Version 1 wrote sidecars next to their sources.
+PRECOMPRESS_MANIFEST_VERSION = 2
+COMPRESSIBLE_SUFFIXES = (".css", ".csv", ".geojson", ".html", ".js", ".json", ".md", ".svg", ".txt", ".xml")
+# Below roughly one network packet compression saves nothing worth a second file.
+DEFAULT_MIN_BYTES = 1400
+# Encoding name (as in Accept-Encoding / Content-Encoding) -> sidecar suffix.
+SIDECAR_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+DEFAULT_JOBS = min(8, os.cpu_count() or 1)
+
+
+def gzip_bytes(data: bytes) -> bytes:
+    # mtime=0 and no filename in the header keep the output byte-for-byte reproducible.
+    buffer = io.BytesIO()
+    with gzip.GzipFile(filename="", mode="wb", fileobj=buffer, compresslevel=9, mtime=0) as handle:
+        handle.write(data)
+    return buffer.getvalue()
+
+
+def brotli_bytes(data: bytes) -> bytes:
+    return brotli.compress(data, quality=11)
+
+
+def available_encoders() -> dict[str, Callable[[bytes], bytes]]:
+    encoders: dict[str, Callable[[bytes], bytes]] = {}
+    if brotli is not None:
+        encoders["br"] = brotli_bytes
+    encoders["gzip"] = gzip_bytes
+    return encoders
+
+
+def sidecar_path(site_root: Path, relpath: str, encoding: str) -> Path:
+    return site_root / SIDECAR_DIR_NAME / (relpath + SIDECAR_SUFFIXES[encoding])
+
+
+def is_compressible(path: Path, site_root: Path, min_bytes: int) -> bool:
+    relative = path.relative_to(site_root)
+    # Hidden files and folders are local caches (.render_cache.json, .objects/, ...).
+    if any(part.startswith(".") for part in relative.parts) or relative.as_posix() == PRECOMPRESS_MANIFEST_NAME:
+        return False
+    return path.suffix in COMPRESSIBLE_SUFFIXES and path.stat().st_size >= min_bytes
+
+
+def load_manifest(site_root: Path) -> dict[str, Any]:
+    path = site_root / PRECOMPRESS_MANIFEST_NAME
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict):
+        return {}
+    if manifest.get("version") == 1 and isinstance(manifest.get("files"), dict):
+        remove_legacy_sidecars(site_root, manifest["files"])
+    if manifest.get("version") != PRECOMPRESS_MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def remove_legacy_sidecars(site_root: Path, files: dict[str, Any]) -> None:
+    """Delete the sidecars a version 1 manifest lists next to their sources."""
+
+    for relpath in files:
+        source = site_root / relpath
+        for suffix in SIDECAR_SUFFIXES.values():
+            source.with_name(source.name + suffix).unlink(missing_ok=True)
+
+
+def write_sidecar(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def precompress_file(
+    site_root: Path,
+    relpath: str,
+    digest: str,
+    previous: dict[str, Any] | None,
+    encoders: dict[str, Callable[[bytes], bytes]],
+) -> tuple[dict[str, Any], int]:
+    """Write (or keep) the sidecars of one file; returns its manifest entry and sidecars written."""
+
+    path = site_root / relpath
+    stat = path.stat()
+    entry: dict[str, Any] = {"sha256": digest, "bytes": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    data: bytes | None = None
+    written = 0
+    for encoding in SIDECAR_SUFFIXES:
+        target = sidecar_path(site_root, relpath, encoding)
+        if encoding not in encoders:
+            target.unlink(missing_ok=True)
+            entry[encoding] = None
+            continue
+        known = previous.get(encoding) if previous and previous.get("sha256") == digest else None
+        if isinstance(known, int) and target.is_file() and target.stat().st_size == known:
+            entry[encoding] = known
+            continue
+        if data is None:
+            data = path.read_bytes()
+        compressed = encoders[encoding](data)
+        if len(compressed) >= len(data):
+            target.unlink(missing_ok=True)
+            entry[encoding] = None
+            continue
+        write_sidecar(target, compressed)
+        entry[encoding] = len(compressed)
+        written += 1
+    return entry, written
+
+
+def precompress_site(
+    site_root: Path,
+    min_bytes: int = DEFAULT_MIN_BYTES,
+    jobs: int = DEFAULT_JOBS,
+    encoders: dict[str, Callable[[bytes], bytes]] | None = None,
+) -> dict[str, Any]:
+    """Write deterministic .gz/.br sidecars for compressible files and the size manifest.
+
+    Sidecars go under <site_root>/.precompressed/. Sources are only read, so declared
+    artefact hashes keep describing the uncompressed originals. Sidecars whose source
+    hash is unchanged are reused; sidecars of files that are gone or no longer
+    qualify are removed.
+    """
+
+    encoders = encoders if encoders is not None else available_encoders()
+    previous_files = load_manifest(site_root).get("files", {})
+    sources = sorted(path for path in site_root.rglob("*") if path.is_file() and is_compressible(path, site_root, min_bytes))
+
+    digests = DigestCache.load(site_root / DIGEST_CACHE_NAME)
+    relpaths = [path.relative_to(site_root).as_posix() for path in sources]
+    stats = [path.stat() for path in sources]
+    cached = [digests.lookup(relpath, stat) for relpath, stat in zip(relpaths, stats)]
+    missing = [index for index, digest in enumerate(cached) if digest is None]
+    for index, digest in zip(missing, sha256_hex_many([sources[index] for index in missing])):
+        cached[index] = digest
+        digests.store(relpaths[index], stats[index], digest)
+    digests.save()
+
+    def work(index: int) -> tuple[dict[str, Any], int]:
+        relpath = relpaths[index]
+        return precompress_file(site_root, relpath, str(cached[index]), previous_files.get(relpath), encoders)
+
+    if jobs > 1 and len(sources) > 1:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(sources))) as executor:
+            results = list(executor.map(work, range(len(sources))))
+    else:
+        results = [work(index) for index in range(len(sources))]
+
+    files = {relpath: entry for relpath, (entry, _written) in zip(relpaths, results)}
+    for relpath in sorted(set(previous_files) - set(files)):
+        for encoding in SIDECAR_SUFFIXES:
+            sidecar_path(site_root, relpath, encoding).unlink(missing_ok=True)
+
+    totals = {"files": len(files), "bytes": sum(entry["bytes"] for entry in files.values())}
+    for encoding in SIDECAR_SUFFIXES:
+        totals[encoding] = sum(entry[encoding] or entry["bytes"] for entry in files.values())
+    manifest = {
+        "version": PRECOMPRESS_MANIFEST_VERSION,
+        "min_bytes": min_bytes,
+        "encodings": sorted(encoders),
+        "files": files,
+        "totals": totals,
+    }
+    write_text(site_root / PRECOMPRESS_MANIFEST_NAME, json.dumps(manifest, sort_keys=True, indent=2) + "\n")
+    manifest["sidecars_written"] = sum(written for _entry, written in results)
+    return manifest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Write precompressed .gz/.br sidecars for the static site.")
+    parser.add_argument("--site-root", default="docs/site", help="Root folder containing site HTML")
+    parser.add_argument(
+        "--min-bytes",
+        type=int,
+        default=DEFAULT_MIN_BYTES,
+        help=f"Skip files smaller than this (default: {DEFAULT_MIN_BYTES})",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Files compressed in parallel (default: {DEFAULT_JOBS})",
+    )
+    args = parser.parse_args()
+
+    site_root = Path(args.site_root)
+    if not site_root.is_dir():
+        raise SystemExit(f"Site root not found: {site_root}")
+
+    manifest = precompress_site(site_root, min_bytes=args.min_bytes, jobs=max(1, args.jobs))
+    totals = manifest["totals"]
+    sizes = ", ".join(f"{encoding} {totals[encoding]}" for encoding in manifest["encodings"])
+    print(
+        f"{totals['files']} files, {totals['bytes']} bytes -> {sizes} bytes "
+        f"({manifest['sidecars_written']} sidecars written)"
+    )
+    if "br" not in manifest["encodings"]:
+        print("NOTE: brotli is not installed; only .gz sidecars were written")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+
+# Opt-in spans that time publish stages and count the bytes they read and write.
+# Nothing is recorded unless a profile session is active: span() then returns a
+# shared no-op context manager and the byte counters return immediately.
+PROFILE_VERSION = 1
+TOP_ENTRIES = 25
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    # Slash-joined names of the enclosing spans, e.g. "run/render_aoi_run/render_report_html".
+    path: str
+    run: str | None
+    seconds: float
+    # Inclusive of nested spans.
+    bytes_read: int
+    bytes_written: int
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.records: list[SpanRecord] = []
+        self.stack: list[_Span] = []
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "run", "path", "started", "read_at_start", "written_at_start")
+
+    def __init__(self, profiler: Profiler, name: str, run: str | None) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.run = run
+
+    def __enter__(self) -> _Span:
+        profiler = self.profiler
+        parent = profiler.stack[-1] if profiler.stack else None
+        if parent is not None:
+            self.path = f"{parent.path}/{self.name}"
+            self.run = self.run or parent.run
+        else:
+            self.path = self.name
+        profiler.stack.append(self)
+        self.read_at_start = profiler.bytes_read
+        self.written_at_start = profiler.bytes_written
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> bool:
+        seconds = time.perf_counter() - self.started
+        profiler = self.profiler
+        profiler.stack.pop()
+        profiler.records.append(
+            SpanRecord(
+                path=self.path,
+                run=self.run,
+                seconds=seconds,
+                bytes_read=profiler.bytes_read - self.read_at_start,
+                bytes_written=profiler.bytes_written - self.written_at_start,
+            )
+        )
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc_info: object) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+_active: Profiler | None = None
+
+
+def enabled() -> bool:
+    return _active is not None
+
+
+def span(name: str, run: str | None = None) -> _Span | _NullSpan:
+    """Time the enclosed block as `name`; run tags it (and nested spans) with a run id."""
+
+    if _active is None:
+        return _NULL_SPAN
+    return _Span(_active, name, run)
+
+
+def add_read(nbytes: int) -> None:
+    if _active is not None:
+        _active.bytes_read += nbytes
+
+
+def add_written(nbytes: int) -> None:
+    if _active is not None:
+        _active.bytes_written += nbytes
+
+
+def add_read_file(path: Path) -> None:
+    """Count a file read as text, where the decoded length is not its size on disk."""
+
+    if _active is not None:
+        _active.bytes_read += path.stat().st_size
+
+
+def add_written_file(path: Path) -> None:
+    """Count a file just written through a stream whose byte length is not known."""
+
+    if _active is not None:
+        _active.bytes_written += path.stat().st_size
+
+
+def call_in_worker(profile: bool, fn: Callable[..., Any], *args: Any) -> tuple[Any, list[SpanRecord]]:
+    """Run fn in a pool worker, returning its result and the spans it recorded.
+
+    Pass profiling.enabled() from the parent as `profile` and hand the spans to merge().
+    """
+
+    global _active
+    if not profile:
+        return fn(*args), []
+    previous, _active = _active, Profiler()
+    try:
+        return fn(*args), _active.records
+    finally:
+        _active = previous
+
+
+def merge(records: list[SpanRecord]) -> None:
+    """Adopt spans recorded in another process, nesting them under the current span."""
+
+    if _active is None or not records:
+        return
+    prefix = f"{_active.stack[-1].path}/" if _active.stack else ""
+    _active.records.extend(
+        SpanRecord(f"{prefix}{record.path}", record.run, record.seconds, record.bytes_read, record.bytes_written)
+        for record in records
+    )
+    # Top-level worker spans carry the worker's totals; nested ones are already included in them.
+    for record in records:
+        if "/" not in record.path:
+            _active.bytes_read += record.bytes_read
+            _active.bytes_written += record.bytes_written
+
+
+def _aggregate(records: list[SpanRecord]) -> tuple[dict[str, Any], dict[str, Any]]:
+    stages: dict[str, dict[str, float]] = defaultdict(lambda: {"count": 0, "seconds": 0.0, "bytes_read": 0, "bytes_written": 0})
+    runs: dict[str, dict[str, dict[str, float]]] = defaultdict(
+        lambda: defaultdict(lambda: {"seconds": 0.0, "bytes_read": 0, "bytes_written": 0})
+    )
+    for record in records:
+        totals = stages[record.path]
+        totals["count"] += 1
+        totals["seconds"] += record.seconds
+        totals["bytes_read"] += record.bytes_read
+        totals["bytes_written"] += record.bytes_written
+        if record.run is not None:
+            per_run = runs[record.run][record.path]
+            per_run["seconds"] += record.seconds
+            per_run["bytes_read"] += record.bytes_read
+            per_run["bytes_written"] += record.bytes_written
+    for totals in stages.values():
+        totals["seconds"] = round(totals["seconds"], 6)
+    for per_run in runs.values():
+        for totals in per_run.values():
+            totals["seconds"] = round(totals["seconds"], 6)
+    return dict(sorted(stages.items())), {run: dict(sorted(paths.items())) for run, paths in sorted(runs.items())}
+
+
+def _cprofile_top(profile: cProfile.Profile) -> list[dict[str, Any]]:
+    stats = pstats.Stats(profile, stream=io.StringIO())
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    top = []
+    for (filename, line, function) in stats.fcn_list[:TOP_ENTRIES]:
+        calls, _primitive, own_seconds, cumulative_seconds, _callers = stats.stats[(filename, line, function)]
+        top.append(
+            {
+                "function": f"{os.path.basename(filename)}:{line}({function})",
+                "calls": calls,
+                "own_seconds": round(own_seconds, 6),
+                "cumulative_seconds": round(cumulative_seconds, 6),
+            }
+        )
+    return top
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--profile", default=None, help="Write per-run, per-stage timings and bytes read/written to this JSON file")
+    parser.add_argument(
+        "--profile-cprofile",
+        action="store_true",
+        help="With --profile: also run cProfile (main process) and dump stats next to the JSON as .prof",
+    )
+    parser.add_argument(
+        "--profile-tracemalloc",
+        action="store_true",
+        help="With --profile: also record peak memory and top allocation sites (main process)",
+    )
+
+
+@contextmanager
+def session(
+    output: str | None, command: str, use_cprofile: bool = False, use_tracemalloc: bool = False
+) -> Iterator[None]:
+    """Profile the enclosed block into `output`; a no-op when output is None."""
+
+    global _active
+    if output is None:
+        yield
+        return
+
+    _active = profiler = Profiler()
+    c_profile = cProfile.Profile() if use_cprofile else None
+    if use_tracemalloc:
+        tracemalloc.start()
+    if c_profile is not None:
+        c_profile.enable()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        wall_seconds = time.perf_counter() - started
+        if c_profile is not None:
+            c_profile.disable()
+        _active = None
+        stages, runs = _aggregate(profiler.records)
+        result: dict[str, Any] = {
+            "version": PROFILE_VERSION,
+            "command": command,
+            "wall_seconds": round(wall_seconds, 6),
+            "bytes_read": profiler.bytes_read,
+            "bytes_written": profiler.bytes_written,
+            "stages": stages,
+            "runs": runs,
+        }
+        output_path = Path(output)
+        if c_profile is not None:
+            dump_path = output_path.with_suffix(".prof")
+            c_profile.dump_stats(dump_path)
+            result["cprofile"] = {"dump": str(dump_path), "top_cumulative": _cprofile_top(c_profile)}
+        if use_tracemalloc:
+            snapshot = tracemalloc.take_snapshot()
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            result["tracemalloc"] = {
+                "peak_bytes": peak_bytes,
+                "top": [
+                    {"location": str(stat.traceback), "size_bytes": stat.size, "count": stat.count}
+                    for stat in snapshot.statistics("lineno")[:TOP_ENTRIES]
+                ],
+            }
+        output_path.write_text(json.dumps(result, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def session_from_args(args: argparse.Namespace, command: str) -> Any:
+    return session(args.profile, command, args.profile_cprofile, args.profile_tracemalloc)
+
@@ -7,6 +7,9 @@ set -euo pipefail
 #   RUN_ID
 #   STAGING_DIR (e.g. /Users/server/projects/eudr-dmi-gil/out/site_publish/aoi_reports)
 #
+# Optional env vars:
+#   RENDER_JOBS (default: 0 = one render worker per CPU)
+#
 # This script:
 # - creates/switches to branch publish/aoi_${RUN_ID}
 # - rsyncs staging into docs/site/aoi_reports/
@@ -45,31 +48,31 @@ git checkout -B "$branch"
 
 # Sync staging into docs/site/aoi_reports/
 mkdir -p docs/site/aoi_reports
-rsync -a --delete "$STAGING_DIR/" docs/site/aoi_reports/
-
-# Render deterministic AOI artefacts from aoi_report.json and refresh hashes.
+# Local build caches are excluded so --delete keeps them between publishes. They are
+# perishable (-p) so they do not keep the directory of a run removed from staging alive.
+rsync -a --delete \
+  --filter="-p .render_cache.json" --filter="-p .digest_cache.json" --filter="-p /runs_index.json" \
+  "$STAGING_DIR/" docs/site/aoi_reports/
+
+# Write simplified map display layers and z/x/y tile pyramids (the declared masks and
+# map_config.json are untouched), then render deterministic AOI artefacts from
+# aoi_report.json and refresh hashes.
 if [[ -d "docs/site/aoi_reports/runs" ]]; then
-  while IFS= read -r -d '' run_dir; do
-    report_json_name=""
-    if [[ -f "${run_dir}/aoi_report.json" ]]; then
-      report_json_name="aoi_report.json"
-    else
-      mapfile -t json_candidates < <(find "${run_dir}" -maxdepth 1 -type f -name "*.json" \
-        ! -name "summary.json" ! -name "manifest.json" -print | sort)
-      if [[ ${#json_candidates[@]} -eq 1 ]]; then
-        report_json_name="$(basename "${json_candidates[0]}")"
-      fi
-    fi
-
-    if [[ -n "$report_json_name" ]]; then
-      python3 scripts/render_aoi_report_from_json.py \
-        --run-dir "${run_dir}" \
-        --report-json-name "$report_json_name" \
-        --update-json
-    fi
-  done < <(find "docs/site/aoi_reports/runs" -mindepth 1 -maxdepth 1 -type d -print0)
+  python3 scripts/build_map_display_layers.py --runs-dir "docs/site/aoi_reports/runs"
+  python3 scripts/render_aoi_report_from_json.py \
+    --runs-dir "docs/site/aoi_reports/runs" \
+    --update-json \
+    --jobs "${RENDER_JOBS:-0}"
+  # Share identical declared artefacts across runs through docs/site/.objects (local only).
+  python3 scripts/dedup_evidence_objects.py --site-root docs/site --prune
+  # Refresh the AOI index; the published run is always rescanned in runs_index.json.
+  python3 scripts/rebuild_aoi_reports_index.py --site-root docs/site --run-id "$RUN_ID"
 fi
 
+# Precompressed .gz/.br sidecars for local preview (scripts/serve_site.py), written
+# under the gitignored docs/site/.precompressed/ so staged .gz/.br artefacts publish.
+python3 scripts/precompress_site.py --site-root docs/site
+
 # Enforce publish scope
 scripts/assert_publish_scope.sh
 
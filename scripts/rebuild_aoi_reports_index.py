@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 import argparse
+import json
 import sys
 from pathlib import Path
+from typing import Any
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 sys.path.insert(0, str(SCRIPT_DIR))
 
-from render_dte_instructions import render_to_site  # noqa: E402
+import profiling  # noqa: E402
+from render_markdown_site import render_site  # noqa: E402
 from site_nav import render_header_nav  # noqa: E402
 
 
@@ -33,6 +36,21 @@ RUN_DISPLAY_METADATA: dict[str, tuple[str, str]] = {
 
 RUN_DISPLAY_ORDER = ["example", "latin_america", "se_asia", "west_africa"]
 
+# Persisted per-run scan results (site_root/aoi_reports/runs_index.json); a local
+# build cache, not published.
+RUNS_INDEX_NAME = "runs_index.json"
+RUNS_INDEX_VERSION = 4
+
+# Paginated mode: index.html is page 1, later pages are page-<N>.html shards.
+RUNS_CATALOG_NAME = "runs_catalog.json"
+PAGE_SHARD_GLOB = "page-*.html"
+CATALOG_HEADLINE_METRICS = (
+  "aoi_area_ha",
+  "forest_end_year_ha",
+  "pixel_forest_loss_post_2020_ha",
+  "forest_loss_post_2020_percent_of_aoi",
+)
+
 
 def _sort_runs(run_ids: list[str]) -> list[str]:
   order_rank = {run_id: index for index, run_id in enumerate(RUN_DISPLAY_ORDER)}
@@ -49,25 +67,198 @@ def _resolve_report_json_filename(run_id: str, run_dir: Path) -> str | None:
     return "aoi_report.json"
 
   json_candidates = sorted(
-    p.name for p in run_dir.glob("*.json") if p.name not in {"summary.json", "manifest.json"}
+    p.name
+    for p in run_dir.glob("*.json")
+    if p.name not in {"summary.json", "manifest.json"} and not p.name.startswith(".")
   )
   return json_candidates[0] if json_candidates else None
 
 
-def render_runs(runs_dir: Path) -> str:
-  run_dirs = [entry for entry in runs_dir.iterdir() if entry.is_dir()]
-  if not run_dirs:
+def _run_label(run_id: str) -> str:
+  return RUN_DISPLAY_METADATA.get(run_id, (run_id, ""))[0]
+
+
+def _report_summary(report_path: Path) -> dict[str, Any]:
+  try:
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    profiling.add_read_file(report_path)
+  except (OSError, ValueError):
+    report = {}
+  if not isinstance(report, dict):
+    report = {}
+
+  metrics = report.get("metrics") if isinstance(report.get("metrics"), dict) else {}
+  headline: dict[str, Any] = {}
+  for key in CATALOG_HEADLINE_METRICS:
+    entry = metrics.get(key)
+    if isinstance(entry, dict) and "value" in entry:
+      headline[key] = entry["value"]
+  results_summary = report.get("results_summary") if isinstance(report.get("results_summary"), dict) else {}
+  deforestation_free = results_summary.get("deforestation_free_post_2020")
+  if isinstance(deforestation_free, dict) and "status" in deforestation_free:
+    headline["deforestation_free_post_2020_status"] = deforestation_free["status"]
+
+  return {
+    "aoi_id": report.get("aoi_id"),
+    "generated_at_utc": report.get("generated_at_utc"),
+    "metrics": headline,
+  }
+
+
+def scan_run(runs_dir: Path, run_id: str) -> dict[str, Any] | None:
+  """Stat one run directory and summarize its report JSON; None when the run is gone."""
+
+  with profiling.span("scan_run", run=run_id):
+    return _scan_run(runs_dir, run_id)
+
+
+def _scan_run(runs_dir: Path, run_id: str) -> dict[str, Any] | None:
+  run_dir = runs_dir / run_id
+  try:
+    run_dir_stat = run_dir.stat()
+  except FileNotFoundError:
+    return None
+  if not run_dir.is_dir():
+    return None
+
+  expected_json_filename = RUN_DISPLAY_METADATA.get(run_id, (run_id, "aoi_report.json"))[1]
+  report_json_filename = _resolve_report_json_filename(run_id, run_dir) or expected_json_filename
+  report_json_size, report_json_mtime_ns = _file_signature(run_dir / report_json_filename)
+  return {
+    "run_id": run_id,
+    "label": _run_label(run_id),
+    "report_json_filename": report_json_filename,
+    "report_json_size": report_json_size,
+    "report_json_mtime_ns": report_json_mtime_ns,
+    "run_dir_mtime_ns": run_dir_stat.st_mtime_ns,
+    "has_report_html": (run_dir / "report.html").is_file(),
+    **_report_summary(run_dir / report_json_filename),
+  }
+
+
+def load_runs_index(index_path: Path) -> dict[str, Any] | None:
+  try:
+    data = json.loads(index_path.read_text(encoding="utf-8"))
+  except (FileNotFoundError, json.JSONDecodeError):
+    return None
+  if not isinstance(data, dict) or data.get("version") != RUNS_INDEX_VERSION or not isinstance(data.get("runs"), dict):
+    return None
+  return data
+
+
+def write_runs_index(index_path: Path, data: dict[str, Any]) -> None:
+  content = json.dumps(data, sort_keys=True, indent=2) + "\n"
+  if index_path.is_file() and index_path.read_text(encoding="utf-8") == content:
+    return
+  index_path.write_text(content, encoding="utf-8")
+
+
+def _file_signature(path: Path) -> tuple[int | None, int | None]:
+  try:
+    stat = path.stat()
+  except OSError:
+    return None, None
+  return stat.st_size, stat.st_mtime_ns
+
+
+def _run_changed(runs_dir: Path, run_id: str, known: dict[str, Any]) -> bool:
+  """True when the run directory or its report JSON differs from the stored entry.
+
+  The directory mtime catches added or removed files; the report JSON's own
+  size and mtime catch it being rewritten in place, which the directory misses.
+  """
+
+  run_dir = runs_dir / run_id
+  if known.get("run_dir_mtime_ns") != run_dir.stat().st_mtime_ns:
+    return True
+  report_json_filename = known.get("report_json_filename")
+  if not isinstance(report_json_filename, str):
+    return True
+  size, mtime_ns = _file_signature(run_dir / report_json_filename)
+  return (known.get("report_json_size"), known.get("report_json_mtime_ns")) != (size, mtime_ns)
+
+
+def refresh_runs_index(
+  runs_dir: Path,
+  index_path: Path,
+  *,
+  run_ids: list[str] | None = None,
+  full_rescan: bool = False,
+) -> dict[str, dict[str, Any]]:
+  """Return run entries keyed by run_id, rescanning only what may have changed.
+
+  run_ids are always rescanned: publishing re-writes files inside runs/<id>/,
+  which leaves runs_dir's own mtime untouched, so the publish path names its run.
+  Otherwise, when runs_dir's mtime matches the index the stored entries are used
+  as-is; when it differs, new run directories are scanned and removed ones
+  dropped. full_rescan also stats every run and rescans those whose directory or
+  report JSON changed; a missing or unreadable index scans every run.
+  """
+
+  runs_dir_mtime_ns = runs_dir.stat().st_mtime_ns
+  data = load_runs_index(index_path)
+
+  if data is None:
+    runs = {}
+    for entry in runs_dir.iterdir():
+      scanned = scan_run(runs_dir, entry.name) if entry.is_dir() else None
+      if scanned is not None:
+        runs[entry.name] = scanned
+  else:
+    runs = dict(data["runs"])
+    if full_rescan or data.get("runs_dir_mtime_ns") != runs_dir_mtime_ns:
+      present = {entry.name for entry in runs_dir.iterdir() if entry.is_dir()}
+      for run_id in list(runs):
+        if run_id not in present:
+          del runs[run_id]
+      for run_id in sorted(present):
+        known = runs.get(run_id)
+        if known is None or (full_rescan and _run_changed(runs_dir, run_id, known)):
+          scanned = scan_run(runs_dir, run_id)
+          if scanned is None:
+            runs.pop(run_id, None)
+          else:
+            runs[run_id] = scanned
+    for run_id, entry in runs.items():
+      entry["label"] = _run_label(run_id)
+
+  for run_id in run_ids or []:
+    scanned = scan_run(runs_dir, run_id)
+    if scanned is None:
+      runs.pop(run_id, None)
+    else:
+      runs[run_id] = scanned
+
+  write_runs_index(
+    index_path,
+    {"version": RUNS_INDEX_VERSION, "runs_dir_mtime_ns": runs_dir_mtime_ns, "runs": runs},
+  )
+  return runs
+
+
+def _listed_run_ids(runs: dict[str, dict[str, Any]]) -> list[str]:
+  return [run_id for run_id in _sort_runs(list(runs)) if runs[run_id].get("has_report_html")]
+
+
+def render_runs(
+  runs_dir: Path,
+  runs: dict[str, dict[str, Any]] | None = None,
+  run_ids: list[str] | None = None,
+) -> str:
+  if runs is None:
+    runs = {}
+    for entry in runs_dir.iterdir():
+      scanned = scan_run(runs_dir, entry.name) if entry.is_dir() else None
+      if scanned is not None:
+        runs[entry.name] = scanned
+  if not runs:
     return "<li><em>No AOI reports found.</em></li>"
 
   rows: list[str] = []
-  for run_id in _sort_runs([entry.name for entry in run_dirs]):
-    run_dir = runs_dir / run_id
-    report_path = run_dir / "report.html"
-    if not report_path.is_file():
-      continue
-
-    label, expected_json_filename = RUN_DISPLAY_METADATA.get(run_id, (run_id, "aoi_report.json"))
-    resolved_json_filename = _resolve_report_json_filename(run_id, run_dir) or expected_json_filename
+  for run_id in _listed_run_ids(runs) if run_ids is None else run_ids:
+    run = runs[run_id]
+    label = run["label"]
+    resolved_json_filename = run["report_json_filename"]
 
     report_href = f"runs/{run_id}/report.html"
     report_json_href = f"runs/{run_id}/{resolved_json_filename}"
@@ -83,9 +274,105 @@ def render_runs(runs_dir: Path) -> str:
   return "\n".join(rows) if rows else "<li><em>No AOI reports found.</em></li>"
 
 
-def build_page(*, runs_dir: Path) -> str:
+def page_filename(page: int) -> str:
+  return "index.html" if page == 1 else f"page-{page}.html"
+
+
+def render_pager(page: int, pages: int) -> str:
+  links = [f"Page {page} of {pages}"]
+  if page > 1:
+    links.append(f"<a href=\"{page_filename(page - 1)}\">Previous page</a>")
+  if page < pages:
+    links.append(f"<a href=\"{page_filename(page + 1)}\">Next page</a>")
+  links.append(f"All runs: <a href=\"{RUNS_CATALOG_NAME}\">{RUNS_CATALOG_NAME}</a>")
+  return "  <p class=\"muted\">" + " · ".join(links) + "</p>\n"
+
+
+def build_catalog(runs: dict[str, dict[str, Any]], page_size: int) -> dict[str, Any]:
+  run_ids = _listed_run_ids(runs)
+  entries = []
+  for position, run_id in enumerate(run_ids):
+    run = runs[run_id]
+    entries.append(
+      {
+        "run_id": run_id,
+        "label": run["label"],
+        "aoi_id": run.get("aoi_id"),
+        "generated_at_utc": run.get("generated_at_utc"),
+        "metrics": run.get("metrics") or {},
+        "page": page_filename(position // page_size + 1),
+        "report_href": f"runs/{run_id}/report.html",
+        "report_json_href": f"runs/{run_id}/{run['report_json_filename']}",
+      }
+    )
+  return {
+    "version": 1,
+    "page_size": page_size,
+    "pages": max(1, -(-len(run_ids) // page_size)),
+    "runs": entries,
+  }
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+  if path.is_file() and path.read_text(encoding="utf-8") == content:
+    return
+  path.write_text(content, encoding="utf-8")
+  profiling.add_written_file(path)
+
+
+def write_index_pages(
+  aoi_reports_dir: Path,
+  runs_dir: Path,
+  runs: dict[str, dict[str, Any]],
+  page_size: int = 0,
+) -> int:
+  """Write index.html, plus page-<N>.html shards and runs_catalog.json when page_size > 0.
+
+  Every page holds at most page_size runs, so index.html stays the same size
+  however many runs exist; Previous/Next links keep each run reachable by
+  clicking from index.html. Shards left over from an earlier, larger build are
+  removed. Returns the number of pages written.
+  """
+
+  if page_size <= 0:
+    _write_if_changed(aoi_reports_dir / "index.html", build_page(runs_dir=runs_dir, runs=runs))
+    for stale in [*aoi_reports_dir.glob(PAGE_SHARD_GLOB), aoi_reports_dir / RUNS_CATALOG_NAME]:
+      stale.unlink(missing_ok=True)
+    return 1
+
+  catalog = build_catalog(runs, page_size)
+  run_ids = [entry["run_id"] for entry in catalog["runs"]]
+  pages = catalog["pages"]
+  written = set()
+  for page in range(1, pages + 1):
+    page_run_ids = run_ids[(page - 1) * page_size:page * page_size]
+    content = build_page(
+      runs_dir=runs_dir,
+      runs=runs,
+      run_ids=page_run_ids,
+      pager_html=render_pager(page, pages),
+    )
+    _write_if_changed(aoi_reports_dir / page_filename(page), content)
+    written.add(page_filename(page))
+  for shard in aoi_reports_dir.glob(PAGE_SHARD_GLOB):
+    if shard.name not in written:
+      shard.unlink()
+  _write_if_changed(
+    aoi_reports_dir / RUNS_CATALOG_NAME,
+    json.dumps(catalog, sort_keys=True, ensure_ascii=False, separators=(",", ":")) + "\n",
+  )
+  return pages
+
+
+def build_page(
+    *,
+    runs_dir: Path,
+    runs: dict[str, dict[str, Any]] | None = None,
+    run_ids: list[str] | None = None,
+    pager_html: str = "",
+) -> str:
     header_html = render_header_nav(rel_prefix="../", active_label="AOI Reports")
-    runs_html = render_runs(runs_dir)
+    runs_html = render_runs(runs_dir, runs, run_ids)
     return f"""<!doctype html>
 <html lang=\"en\">
   <head>
@@ -138,7 +425,7 @@ def build_page(*, runs_dir: Path) -> str:
   <ul>
 {runs_html}
   </ul>
-</div>
+{pager_html}</div>
       </div>
     </main>
     <footer style=\"border-top:1px solid #e7e7e7; background:#fff;\">
@@ -156,16 +443,39 @@ def build_page(*, runs_dir: Path) -> str:
 def main() -> int:
     p = argparse.ArgumentParser(description="Rebuild AOI reports index from docs/site/aoi_reports/runs/.")
     p.add_argument("--site-root", default="docs/site", help="Root folder containing site HTML")
+    p.add_argument(
+        "--run-id",
+        action="append",
+        default=[],
+        help="Rescan only this run in runs_index.json (repeatable; use after publishing a run)",
+    )
+    p.add_argument("--full-rescan", action="store_true", help="Stat every run directory and report JSON and rescan the ones that changed")
+    p.add_argument(
+        "--page-size",
+        type=int,
+        default=0,
+        help="Runs per index page; > 0 also writes page-<N>.html shards and runs_catalog.json (default: 0, single page)",
+    )
+    profiling.add_profile_arguments(p)
     args = p.parse_args()
 
-    site_root = Path(args.site_root)
-    render_to_site(source_path=Path("docs/dte_instructions.md"), site_root=site_root)
-    runs_dir = site_root / "aoi_reports" / "runs"
-    if not runs_dir.is_dir():
-        raise SystemExit(f"Runs dir not found: {runs_dir}")
+    with profiling.session_from_args(args, "rebuild_aoi_reports_index"):
+        site_root = Path(args.site_root)
+        with profiling.span("render_markdown_site"):
+            render_site(docs_root=Path("docs"), site_root=site_root)
+        runs_dir = site_root / "aoi_reports" / "runs"
+        if not runs_dir.is_dir():
+            raise SystemExit(f"Runs dir not found: {runs_dir}")
 
-    out_path = site_root / "aoi_reports" / "index.html"
-    out_path.write_text(build_page(runs_dir=runs_dir), encoding="utf-8")
+        with profiling.span("refresh_runs_index"):
+            runs = refresh_runs_index(
+                runs_dir,
+                site_root / "aoi_reports" / RUNS_INDEX_NAME,
+                run_ids=args.run_id,
+                full_rescan=args.full_rescan,
+            )
+        with profiling.span("write_index_pages"):
+            write_index_pages(site_root / "aoi_reports", runs_dir, runs, page_size=args.page_size)
     return 0
 
 
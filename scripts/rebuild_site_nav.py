@@ -2,15 +2,21 @@
 from __future__ import annotations
 
 import argparse
+import difflib
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 
 from site_nav import render_header_nav
-from render_dte_instructions import render_to_site
+from render_markdown_site import render_site
 
 
 HEADER_RE = re.compile(r"<header>.*?</header>", re.DOTALL)
 BODY_RE = re.compile(r"<body(\s[^>]*)?>", re.IGNORECASE)
+ACTIVE_RE = re.compile(r'class="active">([^<]*)<')
 
 
 def replace_or_insert_header(html: str, header_html: str) -> str:
@@ -33,18 +39,113 @@ def rebuild_file(path: Path, *, rel_prefix: str, active_label: str | None) -> No
     path.write_text(updated, encoding="utf-8")
 
 
+def _line_indent(html: str, index: int) -> str | None:
+    """Whitespace between the start of the line and index, or None if other text precedes it."""
+
+    lead = html[html.rfind("\n", 0, index) + 1 : index]
+    return lead if not lead.strip() else None
+
+
+def rewrite_header(html: str, rel_prefix: str) -> str | None:
+    """The page with its <header> rebuilt, keeping its active label; None if it has no header.
+
+    A header indented as a block (e.g. the run report template) stays indented so the
+    page keeps matching what its generator writes.
+    """
+
+    match = HEADER_RE.search(html)
+    if not match:
+        return None
+    active = ACTIVE_RE.search(match.group(0))
+    header_html = render_header_nav(rel_prefix=rel_prefix, active_label=active.group(1) if active else None)
+    indent = _line_indent(html, match.start())
+    if indent and _line_indent(html, match.end() - len("</header>")) == indent:
+        header_html = header_html.replace("\n", "\n" + indent)
+    return html[: match.start()] + header_html + html[match.end() :]
+
+
+@dataclass(frozen=True)
+class NavRewrite:
+    relpath: str
+    # "changed", "unchanged" or "no_header" (pages such as standalone AOI reports are left alone).
+    status: str
+    lines_added: int = 0
+    lines_removed: int = 0
+
+
+def rebuild_page(site_root: Path, relpath: str, dry_run: bool = False) -> NavRewrite:
+    path = site_root / relpath
+    html = path.read_text(encoding="utf-8")
+    updated = rewrite_header(html, "../" * relpath.count("/"))
+    if updated is None:
+        return NavRewrite(relpath, "no_header")
+    if updated == html:
+        return NavRewrite(relpath, "unchanged")
+    added = removed = 0
+    for line in difflib.unified_diff(html.splitlines(), updated.splitlines(), lineterm="", n=0):
+        if line.startswith("+") and not line.startswith("+++"):
+            added += 1
+        elif line.startswith("-") and not line.startswith("---"):
+            removed += 1
+    if not dry_run:
+        path.write_text(updated, encoding="utf-8")
+    return NavRewrite(relpath, "changed", added, removed)
+
+
+def site_pages(site_root: Path) -> list[str]:
+    pages = []
+    for dirpath, dirnames, filenames in os.walk(site_root):
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith("."))
+        for filename in filenames:
+            if filename.endswith(".html"):
+                pages.append((Path(dirpath) / filename).relative_to(site_root).as_posix())
+    return sorted(pages)
+
+
+def rebuild_site(site_root: Path, jobs: int = 1, dry_run: bool = False) -> list[NavRewrite]:
+    """Rebuild the header of every page under site_root; files are written only if their bytes change."""
+
+    relpaths = site_pages(site_root)
+    rebuild = partial(rebuild_page, site_root, dry_run=dry_run)
+    if jobs <= 1 or len(relpaths) <= 1:
+        return [rebuild(relpath) for relpath in relpaths]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(relpaths))) as executor:
+        return list(executor.map(rebuild, relpaths, chunksize=max(1, len(relpaths) // (jobs * 4))))
+
+
 def main() -> int:
     p = argparse.ArgumentParser(description="Rebuild site header/nav with correct rel_prefix.")
     p.add_argument("--site-root", default="docs/site", help="Root folder containing site HTML")
-    p.add_argument("--run-id", required=True, help="AOI run id to update (runs/<run_id>/report.html)")
+    target = p.add_mutually_exclusive_group(required=True)
+    target.add_argument("--run-id", help="AOI run id to update (runs/<run_id>/report.html)")
+    target.add_argument(
+        "--all",
+        action="store_true",
+        help="Rebuild the header of every page that has one, with rel_prefix from its depth",
+    )
+    p.add_argument("--jobs", type=int, default=0, help="With --all: worker processes (default: 0 = one per CPU)")
+    p.add_argument("--dry-run", action="store_true", help="With --all: report what would change without writing")
     args = p.parse_args()
 
     site_root = Path(args.site_root)
 
-    render_to_site(
-        source_path=Path("docs/dte_instructions.md"),
-        site_root=site_root,
-    )
+    if not args.dry_run:
+        render_site(docs_root=Path("docs"), site_root=site_root)
+
+    if args.all:
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        results = rebuild_site(site_root, jobs, args.dry_run)
+        changed = [result for result in results if result.status == "changed"]
+        verb = "would update" if args.dry_run else "updated"
+        for result in changed:
+            print(f"{verb} {result.relpath} (+{result.lines_added} -{result.lines_removed})")
+        unchanged = sum(result.status == "unchanged" for result in results)
+        no_header = sum(result.status == "no_header" for result in results)
+        print(f"{len(changed)} changed, {unchanged} unchanged, {no_header} without a header")
+        return 0
+
+    if args.dry_run:
+        p.error("--dry-run requires --all")
 
     rebuild_file(site_root / "index.html", rel_prefix="", active_label="Home")
     rebuild_file(site_root / "aoi_reports" / "index.html", rel_prefix="../", active_label="AOI Reports")
@@ -2,9 +2,27 @@
 from __future__ import annotations
 
 import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
-from aoi_report_renderer import load_report, render_aoi_run, update_evidence_hashes, write_report
+import profiling
+from aoi_report_renderer import iter_runs, load_report, render_aoi_run, update_evidence_hashes, write_report
+
+
+@dataclass(frozen=True)
+class RunTiming:
+    run_id: str
+    report_json_name: str
+    render_seconds: float
+    hash_seconds: float
+    cached: bool = False
+
+    @property
+    def total_seconds(self) -> float:
+        return self.render_seconds + self.hash_seconds
 
 
 def resolve_report_path(run_dir: Path, report_json_name: str | None) -> Path:
@@ -19,7 +37,9 @@ def resolve_report_path(run_dir: Path, report_json_name: str | None) -> Path:
         return fallback
 
     candidates = sorted(
-        path for path in run_dir.glob("*.json") if path.name not in {"summary.json", "manifest.json"}
+        path
+        for path in run_dir.glob("*.json")
+        if path.name not in {"summary.json", "manifest.json"} and not path.name.startswith(".")
     )
     if len(candidates) == 1:
         return candidates[0]
@@ -33,33 +53,153 @@ def resolve_report_path(run_dir: Path, report_json_name: str | None) -> Path:
     )
 
 
-def render_run(run_dir: Path, update_json: bool, report_json_name: str | None) -> None:
+def resolve_batch_report_name(run_dir: Path) -> str | None:
+    """Resolve the report JSON for batch mode, or None when the run should be skipped.
+
+    Mirrors the selection previously done by the shell loop in
+    publish_aoi_run_from_staging.sh: aoi_report.json, else a single JSON candidate.
+    """
+
+    try:
+        return resolve_report_path(run_dir, None).name
+    except SystemExit:
+        return None
+
+
+def render_run(
+    run_dir: Path, update_json: bool, report_json_name: str | None, force: bool = False, verify: bool = False
+) -> None:
+    render_run_timed(run_dir, update_json=update_json, report_json_name=report_json_name, force=force, verify=verify)
+
+
+def render_run_timed(
+    run_dir: Path, update_json: bool, report_json_name: str | None, force: bool = False, verify: bool = False
+) -> RunTiming:
     report_path = resolve_report_path(run_dir, report_json_name)
-    report = load_report(report_path)
 
-    render_aoi_run(run_dir, report_json_name=report_path.name)
+    with profiling.span("run", run=run_dir.name):
+        started = time.perf_counter()
+        report = load_report(report_path)
+        rendered_artifacts = render_aoi_run(run_dir, report_json_name=report_path.name, force=force)
+        rendered = time.perf_counter()
+
+        if update_json:
+            updated = update_evidence_hashes(run_dir, report, verify=verify)
+            write_report(report_path, updated)
+        finished = time.perf_counter()
+
+    return RunTiming(
+        run_id=run_dir.name,
+        report_json_name=report_path.name,
+        render_seconds=rendered - started,
+        hash_seconds=finished - rendered,
+        cached=rendered_artifacts.cached,
+    )
+
 
-    if update_json:
-        updated = update_evidence_hashes(run_dir, report)
-        write_report(report_path, updated)
+def render_runs(
+    runs_dir: Path, update_json: bool, jobs: int, force: bool = False, verify: bool = False
+) -> list[RunTiming]:
+    """Render every run under runs_dir, optionally across a process pool.
+
+    Each run only touches files inside its own directory, so the outputs are the
+    same as a serial render; results are returned in iter_runs order.
+    """
+
+    targets: list[tuple[Path, str]] = []
+    for run_dir in iter_runs(runs_dir):
+        report_json_name = resolve_batch_report_name(run_dir)
+        if report_json_name is None:
+            print(f"SKIP: no unique report JSON in {run_dir}")
+            continue
+        targets.append((run_dir, report_json_name))
+
+    if jobs <= 1 or len(targets) <= 1:
+        return [render_run_timed(run_dir, update_json, name, force, verify) for run_dir, name in targets]
+
+    profile = profiling.enabled()
+    with ProcessPoolExecutor(max_workers=min(jobs, len(targets))) as executor:
+        futures = [
+            executor.submit(profiling.call_in_worker, profile, render_run_timed, run_dir, update_json, name, force, verify)
+            for run_dir, name in targets
+        ]
+        timings = []
+        for future in futures:
+            timing, spans = future.result()
+            profiling.merge(spans)
+            timings.append(timing)
+        return timings
+
+
+def print_timing_summary(timings: list[RunTiming], wall_seconds: float, jobs: int) -> None:
+    print(f"{'render_s':>9} {'hash_s':>9} {'total_s':>9}  run")
+    for timing in timings:
+        print(
+            f"{timing.render_seconds:9.3f} {timing.hash_seconds:9.3f} {timing.total_seconds:9.3f}  "
+            f"{timing.run_id} ({timing.report_json_name}){' [cached]' if timing.cached else ''}"
+        )
+    busy = sum(timing.total_seconds for timing in timings)
+    cached = sum(1 for timing in timings if timing.cached)
+    print(
+        f"Rendered {len(timings)} run(s) ({cached} unchanged) with {jobs} job(s): "
+        f"wall {wall_seconds:.3f}s, busy {busy:.3f}s"
+    )
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Render AOI HTML/JSON/CSV from a run report JSON file.")
-    parser.add_argument("--run-dir", required=True, help="Path to site/aoi_reports/runs/<run_id>")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--run-dir", help="Path to site/aoi_reports/runs/<run_id>")
+    target.add_argument("--runs-dir", help="Batch mode: render every run under site/aoi_reports/runs/")
     parser.add_argument(
         "--report-json-name",
         default=None,
         help="Custom root report JSON filename (default: auto-detect, preferring aoi_report.json)",
     )
     parser.add_argument("--update-json", action="store_true", help="Update evidence_artifacts hashes and sizes")
+    parser.add_argument("--force", action="store_true", help="Re-render even when .render_cache.json is fresh")
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="With --update-json, rehash every artefact instead of trusting .digest_cache.json",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Batch mode worker processes (default: 1, 0 = one per CPU)",
+    )
+    profiling.add_profile_arguments(parser)
     args = parser.parse_args()
 
+    with profiling.session_from_args(args, "render_aoi_report_from_json"):
+        return _run(parser, args)
+
+
+def _run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    if args.runs_dir:
+        if args.report_json_name:
+            parser.error("--report-json-name cannot be combined with --runs-dir")
+        runs_dir = Path(args.runs_dir)
+        if not runs_dir.is_dir():
+            raise SystemExit(f"Runs dir not found: {runs_dir}")
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        started = time.perf_counter()
+        timings = render_runs(runs_dir, update_json=args.update_json, jobs=jobs, force=args.force, verify=args.verify)
+        print_timing_summary(timings, time.perf_counter() - started, jobs)
+        return 0
+
     run_dir = Path(args.run_dir)
     if not run_dir.is_dir():
         raise SystemExit(f"Run dir not found: {run_dir}")
 
-    render_run(run_dir, update_json=args.update_json, report_json_name=args.report_json_name)
+    render_run(
+        run_dir,
+        update_json=args.update_json,
+        report_json_name=args.report_json_name,
+        force=args.force,
+        verify=args.verify,
+    )
     return 0
 
 
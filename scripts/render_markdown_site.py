@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import posixpath
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from site_nav import render_header_nav  # noqa: E402
+
+
+# Bump when the markup produced for unchanged sources changes.
+RENDERER_VERSION = "2"
+RENDER_CACHE_NAME = ".markdown_render_cache.json"
+
+
+@dataclass(frozen=True)
+class SiteDocument:
+    """A Markdown source under docs/ and the site page rendered from it."""
+
+    source: str
+    output: str
+    title: str
+    active_label: str | None = None
+
+    @property
+    def rel_prefix(self) -> str:
+        return "../" * self.output.count("/")
+
+
+SITE_DOCUMENTS = (
+    SiteDocument("dte_instructions.md", "dte_instructions.html", "DTE Instructions v1.2", "DTE Instructions v1.2"),
+    SiteDocument("privacy.md", "privacy.html", "Privacy Policy"),
+    SiteDocument("regulation/sources.md", "regulation/sources.html", "Regulation sources", "Regulation"),
+    SiteDocument(
+        "regulation/policy_to_evidence_spine.md",
+        "regulation/policy_to_evidence_spine.html",
+        "Policy-to-evidence spine",
+        "Spine",
+    ),
+    SiteDocument("views/agentic_view.md", "views/agentic_view.html", "Agentic view", "Views"),
+    SiteDocument("views/digital_twin_view.md", "views/digital_twin_view.html", "Digital twin view", "Views"),
+    SiteDocument("views/task_view.md", "views/task_view.html", "Task view", "Views"),
+)
+
+
+# One pass per line: the first alternative that matches classifies the line, in the
+# precedence the renderer has always used (fence, heading, quote, raw HTML, lists, table).
+# List items may be indented; the indent width sets their nesting depth.
+BLOCK_RE = re.compile(
+    r"(?P<fence>```.*)"
+    r"|(?P<heading>#{1,3}) (?P<heading_text>.*)"
+    r"|> (?P<quote>.*)"
+    r"|(?P<raw_html>\s*<.*)"
+    r"|(?P<ol_indent>[ \t]*)\d+\.\s+(?P<ol_item>.*)"
+    r"|(?P<ul_indent>[ \t]*)- (?P<ul_item>.*)"
+    r"|(?P<table_row>\|.*)"
+)
+# Inline spans in one left-to-right scan; code spans are literal, link text may hold bold/code.
+# Bare http(s) URLs become links; trailing sentence punctuation stays outside the link.
+INLINE_RE = re.compile(
+    r"`(?P<code>[^`]+)`"
+    r"|\[(?P<text>[^\]]+)\]\((?P<href>[^)]+)\)"
+    r"|\*\*(?P<bold>[^*]+)\*\*"
+    r"|(?P<url>https?://[^\s<>()\[\]`]*[^\s<>()\[\]`.,;:!?'\"])"
+)
+TABLE_SEPARATOR_RE = re.compile(r"^\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?$")
+SLUG_DROP_RE = re.compile(r"[^\w\- ]")
+TAG_RE = re.compile(r"<[^>]+>")
+
+LinkResolver = Callable[[str], "tuple[str, str | None]"]
+
+
+def _keep_href(href: str) -> tuple[str, str | None]:
+    return href, None
+
+
+def format_inline(text: str, resolve_link: LinkResolver = _keep_href) -> str:
+    def replace(match: re.Match[str]) -> str:
+        if match.group("code") is not None:
+            return f"<code>{html.escape(match.group('code'), quote=False)}</code>"
+        if match.group("bold") is not None:
+            return f"<strong>{format_inline(match.group('bold'), resolve_link)}</strong>"
+        if match.group("url") is not None:
+            url = html.escape(match.group("url"))
+            return f'<a href="{url}">{url}</a>'
+        href, title = resolve_link(match.group("href"))
+        title_attr = f' title="{html.escape(title)}"' if title else ""
+        return f'<a href="{href}"{title_attr}>{format_inline(match.group("text"), resolve_link)}</a>'
+
+    return INLINE_RE.sub(replace, text)
+
+
+def heading_slug(heading_html: str) -> str:
+    """GitHub-style anchor for a rendered heading."""
+
+    plain = html.unescape(TAG_RE.sub("", heading_html)).strip().lower()
+    return SLUG_DROP_RE.sub("", plain).replace(" ", "-")
+
+
+def _split_row(line: str) -> list[str]:
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def render_markdown(md_text: str, resolve_link: LinkResolver = _keep_href) -> str:
+    out: list[str] = []
+    in_code = False
+    # Open lists as [tag, indent, index in out of the open <li>]; nested lists go inside it.
+    list_stack: list[list[Any]] = []
+    table_rows: list[str] = []
+    slugs: dict[str, int] = {}
+
+    def inline(text: str) -> str:
+        return format_inline(text, resolve_link)
+
+    def close_item() -> None:
+        item_index = list_stack[-1][2]
+        if item_index == len(out) - 1:
+            out[-1] += "</li>"
+        else:
+            out.append("</li>")
+
+    def close_list() -> None:
+        close_item()
+        out.append(f"</{list_stack.pop()[0]}>")
+
+    def close_lists(indent: int = -1) -> None:
+        while list_stack and list_stack[-1][1] > indent:
+            close_list()
+
+    def add_item(kind: str, indent: int, text: str) -> None:
+        close_lists(indent)
+        if list_stack and list_stack[-1][1] == indent:
+            if list_stack[-1][0] == kind:
+                close_item()
+            else:
+                close_list()
+        if not list_stack or list_stack[-1][1] < indent:
+            out.append(f"<{kind}>")
+            list_stack.append([kind, indent, -1])
+        out.append(f"<li>{inline(text)}")
+        list_stack[-1][2] = len(out) - 1
+
+    def flush_table() -> None:
+        if not table_rows:
+            return
+        rows = table_rows[:]
+        table_rows.clear()
+        if len(rows) < 2 or not TABLE_SEPARATOR_RE.match(rows[1]):
+            out.extend(f"<p>{inline(row)}</p>" for row in rows)
+            return
+        out.append('<div class="table-wrap"><table>')
+        out.append("<thead>\n<tr>")
+        out.extend(f"<th>{inline(cell)}</th>" for cell in _split_row(rows[0]))
+        out.append("</tr>\n</thead>\n<tbody>")
+        for row in rows[2:]:
+            out.append("<tr>")
+            out.extend(f"<td>{inline(cell)}</td>" for cell in _split_row(row))
+            out.append("</tr>")
+        out.append("</tbody>\n</table></div>")
+
+    for raw in md_text.splitlines():
+        line = raw.rstrip()
+        if in_code:
+            if line.startswith("```"):
+                out.append("</code></pre>")
+                in_code = False
+            else:
+                out.append(html.escape(line))
+            continue
+
+        match = BLOCK_RE.match(line)
+        kind = match.lastgroup if match else None
+        if kind != "table_row":
+            flush_table()
+
+        if kind == "fence":
+            close_lists()
+            out.append("<pre><code>")
+            in_code = True
+        elif not line.strip():
+            close_lists()
+        elif kind == "heading_text":
+            close_lists()
+            level = len(match.group("heading"))
+            body = inline(match.group("heading_text"))
+            slug = heading_slug(body)
+            seen = slugs.get(slug, 0)
+            slugs[slug] = seen + 1
+            anchor = f"{slug}-{seen}" if seen else slug
+            out.append(f'<h{level} id="{anchor}">{body}</h{level}>')
+        elif kind == "quote":
+            close_lists()
+            out.append(f"<blockquote>{inline(match.group('quote'))}</blockquote>")
+        elif kind == "raw_html":
+            close_lists()
+            out.append(line)
+        elif kind == "ol_item":
+            add_item("ol", len(match.group("ol_indent").expandtabs(4)), match.group("ol_item"))
+        elif kind == "ul_item":
+            add_item("ul", len(match.group("ul_indent").expandtabs(4)), match.group("ul_item"))
+        elif kind == "table_row":
+            close_lists()
+            table_rows.append(line)
+        else:
+            close_lists()
+            out.append(f"<p>{inline(line)}</p>")
+
+    flush_table()
+    if in_code:
+        out.append("</code></pre>")
+    close_lists()
+    return "\n".join(out)
+
+
+def link_resolver(document: SiteDocument, rendered_sources: frozenset[str]) -> LinkResolver:
+    """Point .md links at their rendered page; links to unpublished docs keep the path as a title."""
+
+    def resolve(href: str) -> tuple[str, str | None]:
+        path, sep, fragment = href.partition("#")
+        if not path.endswith(".md") or "://" in path or path.startswith("/"):
+            return href, None
+        target = posixpath.normpath(posixpath.join(posixpath.dirname(document.source), path))
+        if target not in rendered_sources:
+            return "#", href
+        output = target[: -len(".md")] + ".html"
+        relative = posixpath.relpath(output, posixpath.dirname(document.output) or ".")
+        return relative + sep + fragment, None
+
+    return resolve
+
+
+def build_page(*, document: SiteDocument, body_html: str) -> str:
+    prefix = document.rel_prefix
+    header_html = render_header_nav(rel_prefix=prefix, active_label=document.active_label)
+    return f"""<!doctype html>
+<html lang=\"en\">
+  <head>
+    <meta charset=\"utf-8\" />
+    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
+    <title>{html.escape(document.title)}</title>
+    <style>
+      :root {{ --fg:#111; --bg:#fff; --muted:#666; --card:#f6f7f9; --link:#0b5fff; }}
+      body {{ font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, sans-serif;
+             color: var(--fg); background: var(--bg); margin: 0; }}
+      header {{ border-bottom: 1px solid #e7e7e7; background: #fff; position: sticky; top: 0; }}
+      .wrap {{ max-width: 980px; margin: 0 auto; padding: 16px 20px; }}
+      nav a {{ margin-right: 14px; text-decoration: none; color: var(--link); font-weight: 600; }}
+      nav a.active {{ color: var(--fg); }}
+      .crumbs {{ margin-top: 10px; font-size: 13px; color: var(--muted); }}
+      .crumbs a {{ color: var(--link); text-decoration: none; font-weight: 600; }}
+      .crumbs .sep {{ margin: 0 6px; color: #999; }}
+      main {{ padding: 18px 20px 40px; }}
+      h1 {{ margin: 0 0 6px; font-size: 22px; }}
+      h2 {{ margin-top: 24px; font-size: 18px; }}
+      p {{ line-height: 1.5; }}
+      .muted {{ color: var(--muted); }}
+      .back {{ margin: 0 0 10px; }}
+      .back a {{ color: var(--link); text-decoration: none; font-weight: 600; }}
+      .card {{ background: var(--card); border: 1px solid #e8eaee; border-radius: 12px; padding: 14px 14px; }}
+      ul {{ padding-left: 18px; }}
+      code {{ background: #f1f1f1; padding: 1px 4px; border-radius: 6px; }}
+      .md {{ line-height: 1.55; }}
+      .md table {{ border-collapse: collapse; }}
+      .md th, .md td {{ border: 1px solid #dde0e6; padding: 6px 10px; }}
+      .md thead th {{ background: #eef1f6; }}
+      .md .table-wrap {{ overflow-x: auto; -webkit-overflow-scrolling: touch; }}
+      .md .table-wrap table {{ width: max-content; min-width: 100%; }}
+      .grid {{ display: grid; grid-template-columns: 1fr; gap: 12px; }}
+      @media (min-width: 760px) {{ .grid {{ grid-template-columns: 1fr 1fr; }} }}
+    </style>
+  </head>
+  <body>
+    {header_html}
+    <main>
+      <div class=\"wrap\">
+        <div class=\"md\">
+{body_html}
+        </div>
+      </div>
+    </main>
+    <footer style=\"border-top:1px solid #e7e7e7; background:#fff;\">
+      <div style=\"max-width:980px; margin:0 auto; padding:18px 20px 28px; color:#666; font-size:13px;\">
+        <a href=\"{prefix}privacy.html\" style=\"color:#0b5fff; text-decoration:none; font-weight:600;\">Privacy Policy</a>
+        <span style=\"margin:0 8px; color:#999;\">|</span>
+        <a href=\"{prefix}dte_instructions.html\" style=\"color:#0b5fff; text-decoration:none; font-weight:600;\">DTE Instructions v1.1</a>
+      </div>
+    </footer>
+  </body>
+</html>
+"""
+
+
+def render_document(document: SiteDocument, md_text: str, rendered_sources: frozenset[str]) -> str:
+    body_html = render_markdown(md_text, link_resolver(document, rendered_sources))
+    return build_page(document=document, body_html=body_html)
+
+
+def _render_job(job: tuple[SiteDocument, str, frozenset[str]]) -> str:
+    return render_document(*job)
+
+
+def _cache_key(document: SiteDocument, source_bytes: bytes, rendered_sources: frozenset[str]) -> str:
+    digest = hashlib.sha256()
+    for part in (
+        RENDERER_VERSION,
+        document.output,
+        document.title,
+        document.active_label or "",
+        render_header_nav(rel_prefix=document.rel_prefix, active_label=document.active_label),
+        "\n".join(sorted(rendered_sources)),
+    ):
+        digest.update(part.encode("utf-8") + b"\0")
+    digest.update(source_bytes)
+    return digest.hexdigest()
+
+
+def _load_cache(path: Path) -> dict[str, Any]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    documents = payload.get("documents") if isinstance(payload, dict) else None
+    return documents if isinstance(documents, dict) else {}
+
+
+def render_site(
+    *,
+    docs_root: Path,
+    site_root: Path,
+    documents: tuple[SiteDocument, ...] = SITE_DOCUMENTS,
+    jobs: int = 1,
+    force: bool = False,
+) -> dict[str, list[str]]:
+    """Render every document whose source, page settings or nav changed since the last run.
+
+    Source hashes live in <site_root>/.markdown_render_cache.json; a page is also
+    re-rendered when its output was edited or removed. Changed documents render in
+    parallel. Returns the output relpaths that were rendered and skipped.
+    """
+
+    for document in documents:
+        if not (docs_root / document.source).is_file():
+            raise SystemExit(f"Source markdown not found: {docs_root / document.source}")
+
+    site_root.mkdir(parents=True, exist_ok=True)
+    cache_path = site_root / RENDER_CACHE_NAME
+    cache = {} if force else _load_cache(cache_path)
+    rendered_sources = frozenset(document.source for document in documents)
+
+    pending: list[tuple[SiteDocument, str, str]] = []
+    skipped: list[str] = []
+    for document in documents:
+        source_bytes = (docs_root / document.source).read_bytes()
+        key = _cache_key(document, source_bytes, rendered_sources)
+        output_path = site_root / document.output
+        entry = cache.get(document.output, {})
+        if (
+            entry.get("key") == key
+            and output_path.is_file()
+            and hashlib.sha256(output_path.read_bytes()).hexdigest() == entry.get("output_sha256")
+        ):
+            skipped.append(document.output)
+            continue
+        pending.append((document, source_bytes.decode("utf-8"), key))
+
+    jobs_args = [(document, md_text, rendered_sources) for document, md_text, _key in pending]
+    if jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+            pages = list(executor.map(_render_job, jobs_args))
+    else:
+        pages = [_render_job(job) for job in jobs_args]
+
+    for (document, _md_text, key), page in zip(pending, pages):
+        output_path = site_root / document.output
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        data = page.encode("utf-8")
+        if not output_path.is_file() or output_path.read_bytes() != data:
+            output_path.write_bytes(data)
+        cache[document.output] = {"key": key, "output_sha256": hashlib.sha256(data).hexdigest()}
+
+    known_outputs = {document.output for document in documents}
+    cache = {output: cache[output] for output in sorted(cache) if output in known_outputs}
+    if pending or not cache_path.is_file():
+        cache_path.write_text(json.dumps({"documents": cache}, indent=2) + "\n", encoding="utf-8")
+    return {"rendered": [document.output for document, _md_text, _key in pending], "skipped": skipped}
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Render the Markdown documents under docs/ to site HTML.")
+    p.add_argument("--docs-root", default="docs", help="Folder containing the Markdown sources")
+    p.add_argument("--site-root", default="docs/site", help="Site root for output HTML")
+    p.add_argument("--jobs", type=int, default=0, help="Render processes (default: 0 = one per CPU)")
+    p.add_argument("--force", action="store_true", help="Re-render every document, ignoring the source-hash cache")
+    args = p.parse_args()
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    result = render_site(docs_root=Path(args.docs_root), site_root=Path(args.site_root), jobs=jobs, force=args.force)
+    print(f"Rendered {len(result['rendered'])} document(s), {len(result['skipped'])} unchanged")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from precompress_site import PRECOMPRESS_MANIFEST_NAME, sidecar_path
+
+
+# Preferred first when the client accepts several encodings equally.
+ENCODING_PREFERENCE = ("br", "gzip")
+
+
+def accepted_encodings(header: str | None) -> list[str]:
+    """Sidecar encodings the Accept-Encoding header allows, best first."""
+
+    if not header:
+        return []
+    weights: dict[str, float] = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[name] = quality
+    wildcard = weights.get("*")
+    allowed = []
+    for encoding in ENCODING_PREFERENCE:
+        quality = weights.get(encoding, wildcard if wildcard is not None else 0.0)
+        if quality > 0:
+            allowed.append((quality, encoding))
+    allowed.sort(key=lambda item: -item[0])  # stable: ties keep ENCODING_PREFERENCE order
+    return [encoding for _quality, encoding in allowed]
+
+
+class SidecarManifest:
+    """precompress_manifest.json, reloaded whenever the file changes on disk."""
+
+    def __init__(self, site_root: Path) -> None:
+        self.site_root = site_root
+        self.path = site_root / PRECOMPRESS_MANIFEST_NAME
+        self._mtime_ns: int | None = None
+        self._files: dict[str, Any] = {}
+
+    def files(self) -> dict[str, Any]:
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._mtime_ns, self._files = None, {}
+            return self._files
+        if mtime_ns != self._mtime_ns:
+            try:
+                files = json.loads(self.path.read_text(encoding="utf-8")).get("files", {})
+            except (OSError, ValueError, AttributeError):
+                files = {}
+            self._mtime_ns, self._files = mtime_ns, files if isinstance(files, dict) else {}
+        return self._files
+
+    def fresh_sidecar(self, source: Path, relpath: str, encoding: str) -> Path | None:
+        """The sidecar for encoding if the manifest lists it for the source as it is now."""
+
+        entry = self.files().get(relpath)
+        if not isinstance(entry, dict) or not entry.get(encoding):
+            return None
+        stat = source.stat()
+        if entry.get("bytes") != stat.st_size or entry.get("mtime_ns") != stat.st_mtime_ns:
+            return None
+        sidecar = sidecar_path(self.site_root, relpath, encoding)
+        return sidecar if sidecar.is_file() else None
+
+
+class SiteRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler that serves fresh .br/.gz sidecars when the client accepts them."""
+
+    def __init__(self, *args: Any, manifest: SidecarManifest, **kwargs: Any) -> None:
+        self.manifest = manifest
+        super().__init__(*args, **kwargs)
+
+    def send_head(self):  # type: ignore[override]
+        path = Path(self.translate_path(self.path))
+        if not path.is_file() or self.path.endswith("/"):
+            return super().send_head()
+        try:
+            relpath = path.resolve().relative_to(Path(self.directory).resolve()).as_posix()
+        except ValueError:
+            return super().send_head()
+        for encoding in accepted_encodings(self.headers.get("Accept-Encoding")):
+            sidecar = self.manifest.fresh_sidecar(path, relpath, encoding)
+            if sidecar is not None:
+                return self._send_file(sidecar, encoding, content_type=self.guess_type(str(path)))
+        return self._send_file(path, None)
+
+    def _send_file(self, path: Path, encoding: str | None, content_type: str | None = None):
+        try:
+            handle = path.open("rb")
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+        try:
+            stat = os.fstat(handle.fileno())
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", content_type or self.guess_type(str(path)))
+            if encoding is not None:
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Content-Length", str(stat.st_size))
+            self.send_header("Last-Modified", self.date_time_string(int(stat.st_mtime)))
+            self.end_headers()
+            return handle
+        except Exception:
+            handle.close()
+            raise
+
+
+def make_server(site_root: Path, bind: str = "127.0.0.1", port: int = 8000) -> ThreadingHTTPServer:
+    root = site_root.resolve()
+    handler = partial(SiteRequestHandler, directory=str(root), manifest=SidecarManifest(root))
+    return ThreadingHTTPServer((bind, port), handler)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Preview the static site locally, serving precompressed sidecars via Accept-Encoding."
+    )
+    parser.add_argument("--site-root", default="docs/site", help="Root folder containing site HTML")
+    parser.add_argument("--bind", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on (default: 8000)")
+    args = parser.parse_args()
+
+    site_root = Path(args.site_root)
+    if not site_root.is_dir():
+        raise SystemExit(f"Site root not found: {site_root}")
+
+    server = make_server(site_root, args.bind, args.port)
+    host, port = server.server_address[:2]
+    print(f"Serving {site_root} at http://{host}:{port}/ (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -26,6 +26,7 @@ def render_header_nav(*, rel_prefix: str, active_label: str | None = None) -> st
         NavItem("DTE Instructions v1.1", "dte_instructions.html"),
         NavItem("Conversation Starters", "dte_instructions.html#conversation-starters"),
         NavItem("AOI Reports", "aoi_reports/index.html"),
+        NavItem("DAO Reports", "dao_reports/index.html"),
         NavItem("DAO (Stakeholders)", "dao_stakeholders/index.html"),
         NavItem("DAO (Developers)", "dao_dev/index.html"),
     ]
@@ -1,117 +1,478 @@
-import re
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
 import json
+import re
 import ssl
-import socket
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
+from urllib.parse import urljoin, urlsplit
 
-REPOS = [
-    Path('/Users/server/projects/eudr-dmi-gil'),
-    Path('/Users/server/projects/eudr-dmi-gil-digital-twin'),
-]
 
-md_link_re = re.compile(r'\[[^\]]*\]\(([^)]+)\)')
-bare_url_re = re.compile(r'(?<!\()(?<!<)(https?://[^\s)>]+)')
+ROOT_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_OUTPUT = ROOT_DIR / "docs" / "link_check_strict.json"
+DEFAULT_CACHE = ROOT_DIR / ".link_check_cache.json"
+CACHE_VERSION = 1
+DEFAULT_TTL_SECONDS = 24 * 3600
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST = 4
+DEFAULT_TIMEOUT = 12.0
+MAX_REDIRECTS = 10
+# GET bodies up to this size are drained so the connection can be reused; larger or
+# unsized bodies close the connection instead.
+MAX_DRAIN_BYTES = 1 << 20
+USER_AGENT = "Mozilla/5.0 (compatible; EUDR-Docs-LinkCheck/1.0)"
+SKIPPED_DIR_NAMES = {".git", ".venv", "build", "out"}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+md_link_re = re.compile(r"\[[^\]]*\]\(([^)]+)\)")
+bare_url_re = re.compile(r"(?<!\()(?<!<)(https?://[^\s)>]+)")
 
 
 def normalize_url(raw: str) -> str:
-    cleaned = raw.strip().strip('<>').strip()
-    cleaned = cleaned.rstrip('.,;:!?')
-    cleaned = cleaned.rstrip('`')
+    cleaned = raw.strip().strip("<>").strip()
+    cleaned = cleaned.rstrip(".,;:!?")
+    cleaned = cleaned.rstrip("`")
     cleaned = cleaned.rstrip('"')
     cleaned = cleaned.rstrip("'")
-    cleaned = cleaned.rstrip(']')
-    cleaned = cleaned.rstrip(')')
-    cleaned = cleaned.rstrip('}')
+    cleaned = cleaned.rstrip("]")
+    cleaned = cleaned.rstrip(")")
+    cleaned = cleaned.rstrip("}")
     return cleaned
 
-urls_to_sources = {}
 
-for repo in REPOS:
-    for md in repo.rglob('*.md'):
-        if '.git' in md.parts or '.venv' in md.parts or 'build' in md.parts or 'out' in md.parts:
-            continue
-        text = md.read_text(encoding='utf-8', errors='ignore')
+def collect_urls(repos: list[Path]) -> dict[str, set[str]]:
+    """External URLs in every markdown file of the repos, mapped to `<repo>/<relpath>` sources."""
 
-        for raw in md_link_re.findall(text):
-            link = normalize_url(raw)
-            if link.startswith(('http://', 'https://')):
-                link = link.split('#', 1)[0]
-                urls_to_sources.setdefault(link, set()).add(str(md))
+    urls_to_sources: dict[str, set[str]] = {}
+    for repo in repos:
+        for md in sorted(repo.rglob("*.md")):
+            if SKIPPED_DIR_NAMES.intersection(md.relative_to(repo).parts):
+                continue
+            source = f"{repo.name}/{md.relative_to(repo).as_posix()}"
+            text = md.read_text(encoding="utf-8", errors="ignore")
+            raw_links = [normalize_url(raw) for raw in md_link_re.findall(text)]
+            raw_links += [normalize_url(raw) for raw in bare_url_re.findall(text)]
+            for link in raw_links:
+                if link.startswith(("http://", "https://")):
+                    urls_to_sources.setdefault(link.split("#", 1)[0], set()).add(source)
+    return urls_to_sources
 
-        for raw in bare_url_re.findall(text):
-            link = normalize_url(raw).split('#', 1)[0]
-            if link.startswith(('http://', 'https://')):
-                urls_to_sources.setdefault(link, set()).add(str(md))
 
-urls = sorted(urls_to_sources.keys())
-ctx = ssl.create_default_context()
+@dataclass(frozen=True)
+class Response:
+    status: int
+    reason: str
+    headers: dict[str, str]
 
 
-def check_url(url: str):
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (compatible; EUDR-Docs-LinkCheck/1.0)',
-        'Accept': '*/*',
-    }
+@dataclass
+class UrlResult:
+    url: str
+    ok: bool
+    status: int | None
+    error: str | None
+    etag: str | None = None
+    last_modified: str | None = None
+    # How the result was obtained: "checked", "revalidated" (304) or "cached" (no request).
+    source: str = "checked"
+
+
+class HostPool:
+    """Idle keep-alive connections and the concurrency cap for one scheme://host:port."""
+
+    def __init__(self, per_host: int) -> None:
+        self.semaphore = asyncio.Semaphore(per_host)
+        self.idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+
+class HttpClient:
+    """Minimal asyncio HTTP/1.1 client with per-host limits and keep-alive reuse.
+
+    `stand_in` ("host:port") sends every request to that plain-HTTP server while
+    keeping the original Host header and path, so tests can answer for any URL.
+    """
+
+    def __init__(self, per_host: int, timeout: float, stand_in: str | None = None) -> None:
+        self.per_host = per_host
+        self.timeout = timeout
+        self.stand_in = stand_in
+        self.pools: dict[tuple[str, str, int], HostPool] = {}
+        self.ssl_context = ssl.create_default_context()
+        self.requests_sent = 0
+        self.connections_opened = 0
+
+    def _pool(self, key: tuple[str, str, int]) -> HostPool:
+        if key not in self.pools:
+            self.pools[key] = HostPool(self.per_host)
+        return self.pools[key]
+
+    async def _connect(self, scheme: str, host: str, port: int) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self.stand_in:
+            stand_in_host, _, stand_in_port = self.stand_in.rpartition(":")
+            connection = await asyncio.open_connection(stand_in_host, int(stand_in_port))
+        elif scheme == "https":
+            connection = await asyncio.open_connection(host, port, ssl=self.ssl_context, server_hostname=host)
+        else:
+            connection = await asyncio.open_connection(host, port)
+        self.connections_opened += 1
+        return connection
+
+    async def request(self, method: str, url: str, headers: dict[str, str] | None = None) -> Response:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, host, port)
+        pool = self._pool(key)
+        async with pool.semaphore:
+            # A reused connection may have been closed by the server meanwhile; retry once on a fresh one.
+            for attempt in range(2):
+                reused = bool(pool.idle) and attempt == 0
+                reader, writer = pool.idle.pop() if reused else await self._connect(scheme, host, port)
+                try:
+                    response, reusable = await asyncio.wait_for(
+                        self._exchange(reader, writer, method, parts, headers or {}), self.timeout
+                    )
+                except (OSError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                if reusable:
+                    pool.idle.append((reader, writer))
+                else:
+                    writer.close()
+                return response
+        raise ConnectionError(f"connection to {host}:{port} failed")
+
+    async def _exchange(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        method: str,
+        parts: Any,
+        headers: dict[str, str],
+    ) -> tuple[Response, bool]:
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        host_header = parts.netloc.rsplit("@", 1)[-1]
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host_header}", f"User-Agent: {USER_AGENT}", "Accept: */*"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+        self.requests_sent += 1
+
+        while True:
+            status_line = (await reader.readline()).decode("latin-1").strip()
+            if not status_line:
+                raise ConnectionError("connection closed before a response")
+            version, _, rest = status_line.partition(" ")
+            code_text, _, reason = rest.partition(" ")
+            status = int(code_text)
+            response_headers: dict[str, str] = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1")
+                if line in ("\r\n", "\n", ""):
+                    break
+                name, _, value = line.partition(":")
+                response_headers[name.strip().lower()] = value.strip()
+            if status >= 200:
+                break  # skip 100 Continue and other interim responses
+
+        reusable = version == "HTTP/1.1" and response_headers.get("connection", "").lower() != "close"
+        if method != "HEAD" and status not in (204, 304):
+            reusable = await self._drain_body(reader, response_headers) and reusable
+        return Response(status, reason, response_headers), reusable
+
+    async def _drain_body(self, reader: asyncio.StreamReader, headers: dict[str, str]) -> bool:
+        """Read the body off the wire; False when the connection cannot be reused."""
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            total = 0
+            while True:
+                size = int((await reader.readline()).split(b";", 1)[0].strip() or b"0", 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    return True
+                total += size
+                if total > MAX_DRAIN_BYTES:
+                    return False
+                await reader.readexactly(size + 2)
+        length = headers.get("content-length")
+        if length is None or not length.isdigit() or int(length) > MAX_DRAIN_BYTES:
+            return False
+        await reader.readexactly(int(length))
+        return True
+
+    async def fetch(self, method: str, url: str, headers: dict[str, str] | None = None) -> tuple[str, Response]:
+        """Follow redirects like urlopen; returns the final URL and response."""
+
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await self.request(method, url, headers)
+            location = response.headers.get("location")
+            if response.status not in REDIRECT_STATUSES or not location:
+                return url, response
+            url = urljoin(url, location)
+            if response.status == 303:
+                method = "GET"
+        raise ConnectionError(f"more than {MAX_REDIRECTS} redirects")
+
+    def close(self) -> None:
+        for pool in self.pools.values():
+            for _reader, writer in pool.idle:
+                writer.close()
+            pool.idle.clear()
+
+
+def _http_error(response: Response) -> str:
+    return f"HTTPError: HTTP Error {response.status}: {response.reason}"
+
+
+def _describe(exc: BaseException) -> str:
+    if isinstance(exc, asyncio.TimeoutError):
+        return "TimeoutError: timed out"
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _success(url: str, response: Response, error: str | None = None) -> UrlResult:
+    return UrlResult(
+        url=url,
+        ok=True,
+        status=response.status,
+        error=error,
+        etag=response.headers.get("etag"),
+        last_modified=response.headers.get("last-modified"),
+    )
+
+
+async def check_url(client: HttpClient, url: str, cached: dict[str, Any] | None = None) -> UrlResult:
+    """HEAD, falling back to GET on 403/405 or transport errors.
+
+    A previously passing URL is revalidated with If-None-Match/If-Modified-Since
+    so an unchanged resource costs a 304.
+    """
+
+    conditional: dict[str, str] = {}
+    if cached and cached.get("ok"):
+        if cached.get("etag"):
+            conditional["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            conditional["If-Modified-Since"] = cached["last_modified"]
+
     try:
-        req = Request(url, headers=headers, method='HEAD')
-        with urlopen(req, timeout=12, context=ctx) as response:
-            return (url, True, getattr(response, 'status', 200), None)
-    except HTTPError as err:
-        if err.code in (403, 405):
-            try:
-                req2 = Request(url, headers=headers, method='GET')
-                with urlopen(req2, timeout=12, context=ctx) as response2:
-                    return (url, True, getattr(response2, 'status', 200), f'HEAD->{err.code}, GET ok')
-            except Exception as err2:
-                return (url, False, None, f'HEAD->{err.code}; GET failed: {type(err2).__name__}: {err2}')
-        return (url, False, err.code, f'HTTPError: {err}')
-    except (URLError, socket.timeout, ssl.SSLError) as err:
+        _final_url, response = await client.fetch("HEAD", url, conditional)
+    except Exception as exc:
+        try:
+            _final_url, response = await client.fetch("GET", url, conditional)
+        except Exception as exc2:
+            return UrlResult(url, False, None, f"{_describe(exc)}; GET failed: {_describe(exc2)}")
+        if response.status == 304 and conditional:
+            return _revalidated(url, cached)
+        if response.status < 400:
+            return _success(url, response, f"HEAD failed ({type(exc).__name__}), GET ok")
+        return UrlResult(url, False, response.status, f"{_describe(exc)}; GET failed: {_http_error(response)}")
+
+    if response.status == 304 and conditional:
+        return _revalidated(url, cached)
+    if response.status < 400:
+        return _success(url, response)
+    if response.status in (403, 405):
+        head_status = response.status
         try:
-            req2 = Request(url, headers=headers, method='GET')
-            with urlopen(req2, timeout=12, context=ctx) as response2:
-                return (url, True, getattr(response2, 'status', 200), f'HEAD failed ({type(err).__name__}), GET ok')
-        except Exception as err2:
-            return (url, False, None, f'{type(err).__name__}: {err}; GET failed: {type(err2).__name__}: {err2}')
-    except Exception as err:
-        return (url, False, None, f'{type(err).__name__}: {err}')
-
-results = []
-with ThreadPoolExecutor(max_workers=16) as executor:
-    futures = [executor.submit(check_url, url) for url in urls]
-    for future in as_completed(futures):
-        results.append(future.result())
-
-results.sort(key=lambda item: item[0])
-failed = [item for item in results if not item[1]]
-passed = [item for item in results if item[1]]
-
-report = {
-    'total_unique_urls': len(urls),
-    'passed': len(passed),
-    'failed': len(failed),
-    'failures': [
-        {
-            'url': url,
-            'status': status,
-            'error': error,
-            'sources': sorted(urls_to_sources.get(url, [])),
+            _final_url, response = await client.fetch("GET", url, conditional)
+        except Exception as exc2:
+            return UrlResult(url, False, None, f"HEAD->{head_status}; GET failed: {_describe(exc2)}")
+        if response.status == 304 and conditional:
+            return _revalidated(url, cached)
+        if response.status < 400:
+            return _success(url, response, f"HEAD->{head_status}, GET ok")
+        return UrlResult(url, False, response.status, f"HEAD->{head_status}; GET failed: {_http_error(response)}")
+    return UrlResult(url, False, response.status, _http_error(response))
+
+
+def _revalidated(url: str, cached: dict[str, Any]) -> UrlResult:
+    return UrlResult(
+        url=url,
+        ok=True,
+        status=cached.get("status"),
+        error=cached.get("error"),
+        etag=cached.get("etag"),
+        last_modified=cached.get("last_modified"),
+        source="revalidated",
+    )
+
+
+@dataclass
+class ResultCache:
+    """Per-URL results persisted between runs.
+
+    Passing results younger than the TTL are reused without a request; older ones
+    are revalidated. Failures are always re-checked.
+    """
+
+    path: Path | None
+    ttl_seconds: float
+    entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path | None, ttl_seconds: float) -> ResultCache:
+        cache = cls(path, ttl_seconds)
+        if path is not None and path.is_file():
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            if isinstance(payload, dict) and payload.get("version") == CACHE_VERSION:
+                cache.entries = payload.get("urls", {})
+        return cache
+
+    def fresh(self, url: str, now: float) -> dict[str, Any] | None:
+        entry = self.entries.get(url)
+        if entry and entry.get("ok") and now - entry.get("checked_at", 0) < self.ttl_seconds:
+            return entry
+        return None
+
+    def store(self, result: UrlResult, now: float) -> None:
+        self.entries[result.url] = {
+            "ok": result.ok,
+            "status": result.status,
+            "error": result.error,
+            "etag": result.etag,
+            "last_modified": result.last_modified,
+            "checked_at": now,
         }
-        for (url, _ok, status, error) in failed
-    ],
-}
-
-out = Path('/Users/server/projects/eudr-dmi-gil-digital-twin/docs/link_check_strict.json')
-out.write_text(json.dumps(report, indent=2), encoding='utf-8')
-
-print(f'Checked unique external URLs: {len(urls)}')
-print(f'Passed: {len(passed)}')
-print(f'Failed: {len(failed)}')
-print(f'Wrote report: {out}')
-
-if failed:
-    print('\nTop failures:')
-    for (url, _ok, _status, error) in failed[:20]:
-        print(f'- {url} :: {error}')
+
+    def save(self, urls: list[str]) -> None:
+        if self.path is None:
+            return
+        kept = {url: self.entries[url] for url in sorted(urls) if url in self.entries}
+        self.path.write_text(json.dumps({"version": CACHE_VERSION, "urls": kept}, indent=2) + "\n", encoding="utf-8")
+
+
+async def check_urls(
+    urls: list[str],
+    cache: ResultCache,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    per_host: int = DEFAULT_PER_HOST,
+    timeout: float = DEFAULT_TIMEOUT,
+    stand_in: str | None = None,
+) -> tuple[list[UrlResult], HttpClient]:
+    client = HttpClient(per_host, timeout, stand_in)
+    limit = asyncio.Semaphore(concurrency)
+    now = time.time()
+
+    async def one(url: str) -> UrlResult:
+        fresh = cache.fresh(url, now)
+        if fresh is not None:
+            return UrlResult(
+                url=url,
+                ok=True,
+                status=fresh.get("status"),
+                error=fresh.get("error"),
+                etag=fresh.get("etag"),
+                last_modified=fresh.get("last_modified"),
+                source="cached",
+            )
+        async with limit:
+            result = await check_url(client, url, cache.entries.get(url))
+        cache.store(result, time.time())
+        return result
+
+    try:
+        results = await asyncio.gather(*(one(url) for url in urls))
+    finally:
+        client.close()
+    return sorted(results, key=lambda result: result.url), client
+
+
+def build_report(results: list[UrlResult], urls_to_sources: dict[str, set[str]]) -> dict[str, Any]:
+    failed = [result for result in results if not result.ok]
+    return {
+        "total_unique_urls": len(results),
+        "passed": len(results) - len(failed),
+        "failed": len(failed),
+        "cached": sum(result.source == "cached" for result in results),
+        "revalidated": sum(result.source == "revalidated" for result in results),
+        "failures": [
+            {
+                "url": result.url,
+                "status": result.status,
+                "error": result.error,
+                "sources": sorted(urls_to_sources.get(result.url, [])),
+            }
+            for result in failed
+        ],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check external URLs referenced from markdown files.")
+    parser.add_argument(
+        "--repo",
+        action="append",
+        default=None,
+        help="Repository whose *.md files are scanned (repeatable; default: this repository)",
+    )
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help=f"Report path (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE), help=f"Result cache path (default: {DEFAULT_CACHE})")
+    parser.add_argument("--no-cache", action="store_true", help="Check every URL and do not persist results")
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=DEFAULT_TTL_SECONDS,
+        help=f"Seconds a passing result is reused without a request (default: {DEFAULT_TTL_SECONDS})",
+    )
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="URLs checked at once")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST, help="Connections per host")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Seconds per request")
+    parser.add_argument(
+        "--stand-in",
+        default=None,
+        metavar="HOST:PORT",
+        help="Send every request to this plain-HTTP server (keeps Host and path); for tests",
+    )
+    args = parser.parse_args()
+
+    repos = [Path(repo) for repo in args.repo] if args.repo else [ROOT_DIR]
+    for repo in repos:
+        if not repo.is_dir():
+            raise SystemExit(f"Repository not found: {repo}")
+
+    urls_to_sources = collect_urls(repos)
+    urls = sorted(urls_to_sources)
+    cache = ResultCache.load(None if args.no_cache else Path(args.cache), args.ttl)
+    results, client = asyncio.run(
+        check_urls(urls, cache, max(1, args.concurrency), max(1, args.per_host), args.timeout, args.stand_in)
+    )
+    cache.save(urls)
+
+    report = build_report(results, urls_to_sources)
+    out = Path(args.output)
+    out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    print(f"Checked unique external URLs: {len(urls)}")
+    print(f"Passed: {report['passed']}")
+    print(f"Failed: {report['failed']}")
+    print(
+        f"Requests: {client.requests_sent} over {client.connections_opened} connection(s); "
+        f"cached: {report['cached']}, revalidated: {report['revalidated']}"
+    )
+    print(f"Wrote report: {out}")
+
+    if report["failures"]:
+        print("\nTop failures:")
+        for failure in report["failures"][:20]:
+            print(f"- {failure['url']} :: {failure['error']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -45,6 +45,8 @@ if [[ -n "${S3_ENDPOINT_URL}" ]]; then
 fi
 
 sync_args=(s3 sync "${SOURCE_DIR}/" "${S3_ARTIFACTS_URI%/}/" --only-show-errors)
+# Local build caches are not published.
+sync_args+=(--exclude "*/.render_cache.json" --exclude "*/.digest_cache.json")
 
 if [[ "${DELETE_EXTRA}" == "true" ]]; then
   sync_args+=(--delete)
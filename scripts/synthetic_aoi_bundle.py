@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from aoi_report_renderer import render_aoi_run, update_evidence_hashes, write_report
+
+
+REPORT_VERSION = "aoi_report_v2"
+# Fixed so two generations with the same spec are byte-identical.
+GENERATED_AT_UTC = "2026-01-01T00:00:00+00:00"
+MASK_LAYERS = {
+    "forest_2000": ("forest_2000_mask", "hansen/forest_2000_tree_cover_mask.geojson"),
+    "forest_end_year": ("forest_current_mask", "hansen/forest_current_tree_cover_mask.geojson"),
+    "forest_loss_post_2020": ("forest_loss_mask", "hansen/forest_loss_post_2020_mask.geojson"),
+}
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """Size knobs for a generated AOI run; the same spec and seed always give the same bundle."""
+
+    aoi_id: str = "synthetic_aoi"
+    evidence: int = 10
+    parcels: int = 10
+    criteria: int = 5
+    results: int = 5
+    metrics: int = 10
+    mask_vertices: int = 64
+    mask_polygons: int = 4
+    seed: int = 0
+
+
+def _ring(rng: random.Random, lon: float, lat: float, radius: float, vertices: int) -> list[list[float]]:
+    vertices = max(vertices, 3)
+    ring = []
+    for index in range(vertices):
+        angle = 2 * math.pi * index / vertices
+        scale = radius * (0.75 + 0.25 * rng.random())
+        ring.append([round(lon + scale * math.cos(angle), 6), round(lat + scale * math.sin(angle), 6)])
+    ring.append(ring[0])
+    return ring
+
+
+def _feature(geometry: dict[str, Any], properties: dict[str, Any] | None = None) -> dict[str, Any]:
+    return {"type": "Feature", "properties": properties or {}, "geometry": geometry}
+
+
+def _collection(features: list[dict[str, Any]]) -> dict[str, Any]:
+    return {"type": "FeatureCollection", "features": features}
+
+
+def _write_json(path: Path, value: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(value, sort_keys=True, separators=(",", ":")) + "\n", encoding="utf-8")
+
+
+def synthetic_files(spec: SyntheticSpec) -> tuple[dict[str, Any], dict[str, Any]]:
+    """The run report and the input files it declares (relpath -> JSON value)."""
+
+    rng = random.Random(spec.seed)
+    aoi = spec.aoi_id
+    base = f"reports/{REPORT_VERSION}/{aoi}"
+    lon, lat = round(rng.uniform(-60.0, 30.0), 4), round(rng.uniform(-20.0, 55.0), 4)
+    radius = 0.1
+
+    boundary = _ring(rng, lon, lat, radius, spec.mask_vertices)
+    files: dict[str, Any] = {"inputs/aoi.geojson": _collection([_feature({"type": "Polygon", "coordinates": [boundary]})])}
+    for _key, (_role, relpath) in MASK_LAYERS.items():
+        polygons = [
+            [_ring(rng, lon + rng.uniform(-0.5, 0.5) * radius, lat + rng.uniform(-0.5, 0.5) * radius, radius / 5, spec.mask_vertices)]
+            for _ in range(max(spec.mask_polygons, 1))
+        ]
+        files[f"{base}/{relpath}"] = _collection([_feature({"type": "MultiPolygon", "coordinates": polygons})])
+
+    parcels = []
+    parcel_features = []
+    for index in range(spec.parcels):
+        parcel_id = f"{10000 + index}:{index % 7:03d}:{index:04d}"
+        land = round(rng.uniform(5.0, 150.0), 6)
+        forest = round(land * rng.random(), 6)
+        parcels.append(
+            {
+                "parcel_id": parcel_id,
+                "hansen_land_area_ha": land,
+                "maaamet_land_area_ha": round(land * rng.uniform(0.98, 1.02), 4),
+                "hansen_forest_area_ha": forest,
+                "maaamet_forest_area_ha": round(forest * rng.uniform(0.5, 1.5), 4),
+                "hansen_forest_loss_ha": round(forest * rng.random() * 0.05, 6),
+            }
+        )
+        center_lon = lon + rng.uniform(-0.8, 0.8) * radius
+        center_lat = lat + rng.uniform(-0.8, 0.8) * radius
+        parcel_features.append(
+            _feature({"type": "Polygon", "coordinates": [_ring(rng, center_lon, center_lat, radius / 20, 8)]}, {"parcel_id": parcel_id})
+        )
+    files[f"{base}/maaamet/maaamet_top10_parcels.geojson"] = _collection(parcel_features)
+
+    xs = [point[0] for point in boundary]
+    ys = [point[1] for point in boundary]
+    aoi_bbox = {"min_lon": min(xs), "min_lat": min(ys), "max_lon": max(xs), "max_lat": max(ys)}
+    layers = {"aoi_boundary": "../../../../inputs/aoi.geojson", "parcels": "../maaamet/maaamet_top10_parcels.geojson"}
+    layers.update({key: f"../{relpath}" for key, (_role, relpath) in MASK_LAYERS.items()})
+    files[f"{base}/map/map_config.json"] = {"aoi_bbox": aoi_bbox, "latest_year": 2024, "layers": layers}
+
+    for index in range(spec.evidence):
+        files[f"{base}/evidence/evidence_{index:05d}.json"] = {
+            "evidence_id": f"E-{index:05d}",
+            "values": [round(rng.random(), 6) for _ in range(8)],
+        }
+
+    evidence_artifacts = [
+        {"content_type": "application/geo+json", "meta": {"role": "aoi_geometry"}, "relpath": "inputs/aoi.geojson"},
+        {"content_type": "text/html", "meta": {"role": "report_html"}, "relpath": f"reports/{REPORT_VERSION}/{aoi}.html"},
+        {"content_type": "application/json", "meta": {"role": "report_json"}, "relpath": f"reports/{REPORT_VERSION}/{aoi}.json"},
+        {"content_type": "text/csv", "meta": {"role": "metrics_csv"}, "relpath": f"{base}/metrics.csv"},
+        {"content_type": "application/json", "meta": {"role": "report_map_config"}, "relpath": f"{base}/map/map_config.json"},
+        {
+            "content_type": "application/geo+json",
+            "meta": {"role": "maaamet_top10_geojson"},
+            "relpath": f"{base}/maaamet/maaamet_top10_parcels.geojson",
+        },
+    ]
+    evidence_artifacts += [
+        {"content_type": "application/geo+json", "meta": {"role": role}, "relpath": f"{base}/{relpath}"}
+        for role, relpath in MASK_LAYERS.values()
+    ]
+    evidence_artifacts += [
+        {"content_type": "application/json", "meta": {"role": "synthetic_evidence"}, "relpath": f"{base}/evidence/evidence_{index:05d}.json"}
+        for index in range(spec.evidence)
+    ]
+
+    criteria_ids = [f"criteria_{index:04d}" for index in range(spec.criteria)]
+    evidence_classes = ["aoi_geometry", "forest_loss_post_2020", "synthetic_evidence"]
+    report: dict[str, Any] = {
+        "aoi_id": aoi,
+        "bundle_id": "synthetic",
+        "report_version": REPORT_VERSION,
+        "generated_at_utc": GENERATED_AT_UTC,
+        "aoi_geometry_ref": {"kind": "geojson", "value": "inputs/aoi.geojson"},
+        "inputs": {"sources": [{"content_type": "application/geo+json", "source_id": "aoi_geometry", "uri": "inputs/aoi.geojson"}]},
+        "report_metadata": {
+            "assessment_capability": "inspectable_only",
+            "report_type": "synthetic",
+            "regulatory_context": {"in_scope_articles": ["article-3"], "out_of_scope_articles": [], "regulation": "EUDR"},
+        },
+        "evidence_registry": {
+            "evidence_classes": [
+                {"class_id": class_id, "mandatory": index < 2, "status": "present"}
+                for index, class_id in enumerate(evidence_classes)
+            ]
+        },
+        "acceptance_criteria": [
+            {
+                "criteria_id": criteria_id,
+                "decision_type": "threshold" if index % 2 else "presence",
+                "description": f"Synthetic criterion {index}.",
+                "evidence_classes": [evidence_classes[index % len(evidence_classes)]],
+            }
+            for index, criteria_id in enumerate(criteria_ids)
+        ],
+        "results": [
+            {
+                "result_id": f"result_{index:04d}",
+                "criteria_ids": [criteria_ids[index % len(criteria_ids)]] if criteria_ids else [],
+                "status": ("pass", "fail", "placeholder")[index % 3],
+                "observed_value": round(rng.uniform(0.0, 100.0), 6),
+                "threshold_value": 0.0,
+                "unit": "ha",
+            }
+            for index in range(spec.results)
+        ],
+        "regulatory_traceability": [
+            {
+                "acceptance_criteria": criteria_id,
+                "article_ref": "article-3",
+                "evidence_class": evidence_classes[index % len(evidence_classes)],
+                "regulation": "EUDR",
+                "result_ref": f"result_{index:04d}",
+            }
+            for index, criteria_id in enumerate(criteria_ids[: spec.results])
+        ],
+        "metrics": {
+            f"metric_{index:04d}": {"value": round(rng.uniform(0.0, 1000.0), 6), "unit": "ha", "notes": "synthetic"}
+            for index in range(spec.metrics)
+        },
+        "validation": {
+            "maaamet": {
+                "enabled": True,
+                "parcel_layer": "synthetic:parcels",
+                "parcel_count": spec.parcels,
+                "notes": "synthetic parcels",
+                "parcels": parcels,
+            }
+        },
+        "map_assets": {"config_relpath": f"{base}/map/map_config.json", "aoi_bbox": aoi_bbox, "latest_year": 2024, "layers": layers},
+        "assumptions": [],
+        "evidence_artifacts": evidence_artifacts,
+    }
+    return report, files
+
+
+def write_synthetic_run(
+    run_dir: Path, spec: SyntheticSpec, report_json_name: str = "synthetic_aoi_report.json", render: bool = True
+) -> Path:
+    """Write a run directory for spec; with render=True also render it and fill evidence hashes."""
+
+    report, files = synthetic_files(spec)
+    for relpath, value in files.items():
+        _write_json(run_dir / relpath, value)
+    report_path = run_dir / report_json_name
+    write_report(report_path, report)
+    if render:
+        render_aoi_run(run_dir, report_json_name=report_json_name, force=True)
+        write_report(report_path, update_evidence_hashes(run_dir, report))
+    return report_path
+
+
+def main() -> int:
+    defaults = SyntheticSpec()
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic AOI run for tests and benchmarks.")
+    parser.add_argument("--run-dir", required=True, help="Run directory to create (runs/<run_id>)")
+    parser.add_argument("--report-json-name", default="synthetic_aoi_report.json", help="Run report JSON filename")
+    for name, value in asdict(defaults).items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(value), default=value, help=f"(default: {value})")
+    parser.add_argument("--no-render", action="store_true", help="Only write the report JSON and its input files")
+    args = parser.parse_args()
+
+    spec = SyntheticSpec(**{name: getattr(args, name) for name in asdict(defaults)})
+    report_path = write_synthetic_run(Path(args.run_dir), spec, args.report_json_name, render=not args.no_render)
+    print(f"Wrote {report_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
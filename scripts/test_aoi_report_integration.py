@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import tempfile
 from pathlib import Path
 
+from synthetic_aoi_bundle import SyntheticSpec, write_synthetic_run
 from validate_aoi_run_artifacts import validate_run
 
 
@@ -10,8 +12,32 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 RUN_DIR = ROOT_DIR / "docs/site/aoi_reports/runs/example"
 
 
+def _tree_bytes(root: Path) -> dict[str, bytes]:
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and not path.name.startswith(".")
+    }
+
+
 def main() -> int:
     validate_run(RUN_DIR)
+
+    # A generated run exercises render -> hash -> validate without depending on the published layout.
+    spec = SyntheticSpec(evidence=3, parcels=4, criteria=3, results=4, metrics=3, mask_vertices=12, seed=7)
+    with tempfile.TemporaryDirectory() as tmp:
+        first = Path(tmp) / "runs" / "first"
+        second = Path(tmp) / "runs" / "second"
+        write_synthetic_run(first, spec)
+        write_synthetic_run(second, spec)
+        validate_run(first, verify_hashes=True)
+        if _tree_bytes(first) != _tree_bytes(second):
+            raise SystemExit("Synthetic bundle is not deterministic for a fixed spec")
+
+        other = Path(tmp) / "runs" / "other"
+        write_synthetic_run(other, SyntheticSpec(seed=8), render=False)
+        if (other / "inputs/aoi.geojson").read_bytes() == (first / "inputs/aoi.geojson").read_bytes():
+            raise SystemExit("Synthetic bundle ignores its seed")
     return 0
 
 
@@ -1,15 +1,22 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import json
+import os
 import shutil
 import tempfile
 from pathlib import Path
 
+import aoi_report_renderer
+from render_aoi_report_from_json import render_runs
 from aoi_report_renderer import (
+    EvidenceIndex,
     find_artifact_relpath,
     find_html_relpath,
     load_report,
     render_aoi_run,
+    render_report_html,
+    render_run_report_html,
     update_evidence_hashes,
     write_report,
 )
@@ -17,12 +24,13 @@ from aoi_report_renderer import (
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 FIXTURE_DIR = ROOT_DIR / "docs/site/aoi_reports/runs/example"
+FIXTURE_REPORT_NAME = "estonia_aoi_report.json"
 
 
-def copy_fixture(tmp_dir: Path) -> Path:
-    run_dir = tmp_dir / "example"
+def copy_fixture(tmp_dir: Path, run_id: str = "example") -> Path:
+    run_dir = tmp_dir / run_id
     run_dir.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(FIXTURE_DIR / "aoi_report.json", run_dir / "aoi_report.json")
+    shutil.copy2(FIXTURE_DIR / FIXTURE_REPORT_NAME, run_dir / "aoi_report.json")
     inputs_dir = run_dir / "inputs"
     inputs_dir.mkdir(parents=True, exist_ok=True)
     shutil.copy2(FIXTURE_DIR / "inputs" / "aoi.geojson", inputs_dir / "aoi.geojson")
@@ -63,13 +71,187 @@ def render_once(tmp_dir: Path) -> dict[str, bytes]:
     return outputs
 
 
+def snapshot_tree(root: Path) -> dict[str, bytes]:
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and not path.name.startswith(".")
+    }
+
+
+def render_batch_once(tmp_dir: Path, jobs: int) -> dict[str, bytes]:
+    for run_id in ["run_a", "run_b", "run_c"]:
+        run_dir = copy_fixture(tmp_dir, run_id)
+        ensure_declared_artifacts_exist(run_dir, load_report(run_dir / "aoi_report.json"))
+    render_runs(tmp_dir, update_json=True, jobs=jobs)
+    return snapshot_tree(tmp_dir)
+
+
+def check_streaming_matches_string(tmp_dir: Path) -> None:
+    run_dir = copy_fixture(tmp_dir)
+    report = load_report(run_dir / "aoi_report.json")
+    ensure_declared_artifacts_exist(run_dir, report)
+    render_aoi_run(run_dir)
+    html_relpath = find_html_relpath(report)
+    expected = {
+        html_relpath: render_report_html(report, run_dir, html_relpath),
+        "report.html": render_run_report_html(report, run_dir),
+    }
+    for relpath, content in expected.items():
+        if (run_dir / relpath).read_bytes() != content.encode("utf-8"):
+            raise SystemExit(f"Streaming render test failed: {relpath} differs from the string renderer")
+
+
+def check_render_cache(tmp_dir: Path) -> None:
+    run_dir = copy_fixture(tmp_dir)
+    report = load_report(run_dir / "aoi_report.json")
+    ensure_declared_artifacts_exist(run_dir, report)
+    # Settle the digests of non-output evidence first: <aoi_id>.json renders them.
+    write_report(run_dir / "aoi_report.json", update_evidence_hashes(run_dir, report))
+    first = render_aoi_run(run_dir)
+    write_report(run_dir / "aoi_report.json", update_evidence_hashes(run_dir, report))
+    before = {path: path.stat().st_mtime_ns for path in run_dir.rglob("*") if path.is_file()}
+
+    second = render_aoi_run(run_dir)
+    if first.cached or not second.cached:
+        raise SystemExit("Render cache test failed: unchanged report was re-rendered")
+    write_report(run_dir / "aoi_report.json", update_evidence_hashes(run_dir, load_report(run_dir / "aoi_report.json")))
+    after = {path: path.stat().st_mtime_ns for path in run_dir.rglob("*") if path.is_file()}
+    if before != after:
+        raise SystemExit("Render cache test failed: cached render touched files")
+
+    if render_aoi_run(run_dir, force=True).cached:
+        raise SystemExit("Render cache test failed: force=True did not re-render")
+
+    outputs = {
+        find_html_relpath(report),
+        find_artifact_relpath(report, ".json"),
+        find_artifact_relpath(report, "metrics.csv"),
+        "report.html",
+    }
+    edited = load_report(run_dir / "aoi_report.json")
+    entry = next(entry for entry in edited["evidence_artifacts"] if entry["relpath"] not in outputs)
+    entry["sha256"] = "0" * 64
+    write_report(run_dir / "aoi_report.json", edited)
+    if render_aoi_run(run_dir).cached:
+        raise SystemExit("Render cache test failed: a changed evidence digest rendered into the JSON did not re-render")
+    write_report(run_dir / "aoi_report.json", update_evidence_hashes(run_dir, edited))
+    render_aoi_run(run_dir)
+
+    # The map config and AOI boundary are inlined into the pages: a placeholder config is
+    # left for the browser to fetch, and editing either file must re-render.
+    if "const inlineConfig = null;" not in (run_dir / "report.html").read_text(encoding="utf-8"):
+        raise SystemExit("Render cache test failed: a non-JSON map config was inlined")
+    config_relpath = report["map_assets"]["config_relpath"]
+    shutil.copy2(FIXTURE_DIR / config_relpath, run_dir / config_relpath)
+    if render_aoi_run(run_dir).cached:
+        raise SystemExit("Render cache test failed: replacing the inlined map config did not re-render")
+    config_path = run_dir / config_relpath
+    boundary_path = config_path.parent / json.loads(config_path.read_text(encoding="utf-8"))["layers"]["aoi_boundary"]
+    boundary = json.loads(boundary_path.read_text(encoding="utf-8"))
+    boundary["name"] = "edited boundary"
+    boundary_path.write_text(json.dumps(boundary), encoding="utf-8")
+    if render_aoi_run(run_dir).cached:
+        raise SystemExit("Render cache test failed: editing the inlined AOI boundary did not re-render")
+    if "edited boundary" not in (run_dir / "report.html").read_text(encoding="utf-8"):
+        raise SystemExit("Render cache test failed: report.html does not inline the AOI boundary")
+
+
+def check_render_cache_reuses_output_digests(tmp_dir: Path) -> None:
+    run_dir = copy_fixture(tmp_dir)
+    report = load_report(run_dir / "aoi_report.json")
+    ensure_declared_artifacts_exist(run_dir, report)
+    write_report(run_dir / "aoi_report.json", update_evidence_hashes(run_dir, report))
+    render_aoi_run(run_dir)
+    write_report(run_dir / "aoi_report.json", update_evidence_hashes(run_dir, report))
+    # Age every file past the racy-mtime window so output digests can be cached.
+    for path in run_dir.rglob("*"):
+        if path.is_file():
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    if not render_aoi_run(run_dir).cached:
+        raise SystemExit("Render cache test failed: aged outputs were re-rendered")
+
+    hashed: list[Path] = []
+    original = aoi_report_renderer.sha256_hex
+    aoi_report_renderer.sha256_hex = lambda path: hashed.append(path) or original(path)
+    try:
+        cached = render_aoi_run(run_dir).cached
+    finally:
+        aoi_report_renderer.sha256_hex = original
+    if not cached or hashed:
+        raise SystemExit(f"Render cache test failed: warm freshness check rehashed outputs: {hashed}")
+
+    html_path = run_dir / find_html_relpath(report)
+    html_path.write_text(html_path.read_text(encoding="utf-8") + " ", encoding="utf-8")
+    if render_aoi_run(run_dir).cached:
+        raise SystemExit("Render cache test failed: an edited output was served from the cache")
+
+
+def check_digest_cache(tmp_dir: Path) -> None:
+    run_dir = copy_fixture(tmp_dir)
+    report = load_report(run_dir / "aoi_report.json")
+    ensure_declared_artifacts_exist(run_dir, report)
+    relpath = report["evidence_artifacts"][0]["relpath"]
+    artifact_path = run_dir / relpath
+    # Age the artefact past the racy-mtime window so its digest is cached.
+    os.utime(artifact_path, ns=(1_000_000_000, 1_000_000_000))
+    original = update_evidence_hashes(run_dir, report)["evidence_artifacts"][0]["sha256"]
+
+    # Same size, mtime and inode: the cached digest is trusted until --verify.
+    content = artifact_path.read_bytes()
+    with artifact_path.open("r+b") as handle:
+        handle.write(bytes([content[0] ^ 1]))
+    os.utime(artifact_path, ns=(1_000_000_000, 1_000_000_000))
+    if update_evidence_hashes(run_dir, report)["evidence_artifacts"][0]["sha256"] != original:
+        raise SystemExit("Digest cache test failed: unchanged stat did not reuse cached digest")
+    if update_evidence_hashes(run_dir, report, verify=True)["evidence_artifacts"][0]["sha256"] == original:
+        raise SystemExit("Digest cache test failed: verify=True did not rehash")
+
+
+def check_evidence_index() -> None:
+    report = load_report(FIXTURE_DIR / FIXTURE_REPORT_NAME)
+    evidence = report["evidence_artifacts"]
+    index = EvidenceIndex.from_report(report)
+    aoi_id = report["aoi_id"]
+    for suffix in (".html", ".json", ".geojson", "metrics.csv", f"{aoi_id}.json", f"{aoi_id}/metrics.csv", ".missing"):
+        expected = next((entry["relpath"] for entry in evidence if entry["relpath"].endswith(suffix)), None)
+        if index.find_suffix(suffix) != expected:
+            raise SystemExit(f"Evidence index test failed: lookup for {suffix} differs from a linear scan")
+    for entry in evidence:
+        role = entry.get("meta", {}).get("role")
+        if role and entry not in index.with_role(role):
+            raise SystemExit(f"Evidence index test failed: {entry['relpath']} missing from role {role}")
+
+
 def main() -> int:
+    check_evidence_index()
+
+
     with tempfile.TemporaryDirectory() as dir_one, tempfile.TemporaryDirectory() as dir_two:
         out_one = render_once(Path(dir_one))
         out_two = render_once(Path(dir_two))
 
     if out_one != out_two:
         raise SystemExit("Deterministic render test failed: outputs differ")
+
+    with tempfile.TemporaryDirectory() as dir_serial, tempfile.TemporaryDirectory() as dir_parallel:
+        serial = render_batch_once(Path(dir_serial), jobs=1)
+        parallel = render_batch_once(Path(dir_parallel), jobs=3)
+
+    if serial != parallel:
+        raise SystemExit("Batch render test failed: parallel outputs differ from serial outputs")
+
+    with tempfile.TemporaryDirectory() as dir_stream:
+        check_streaming_matches_string(Path(dir_stream))
+
+    with tempfile.TemporaryDirectory() as dir_cache:
+        check_render_cache(Path(dir_cache))
+
+    with tempfile.TemporaryDirectory() as dir_reuse:
+        check_render_cache_reuses_output_digests(Path(dir_reuse))
+
+    with tempfile.TemporaryDirectory() as dir_digest:
+        check_digest_cache(Path(dir_digest))
     return 0
 
 
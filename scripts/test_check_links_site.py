@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from check_links_site import check_site
+
+
+PAGES = {
+    "index.html": (
+        '<a href="docs/">docs</a> <a href="docs/page.html#usage">usage</a> <a href="#top">top</a>'
+        ' <h1 id="top">Top</h1> <a href="https://example.org/">external</a> <img src="img/map.png" />'
+    ),
+    "docs/index.html": '<h2 id="intro">Intro</h2> <a href="../index.html#top">home</a> <a href="page.html#missing">x</a>',
+    "docs/page.html": (
+        '<a name="usage"></a> <a href="../missing.html">gone</a> <a href="/abs.html">abs</a>'
+        ' <a href="../missing.html">gone again</a> <a href="secret.txt">symlinked out</a>'
+    ),
+    "docs/deep/page.html": '<a href="../../../outside.html">out</a> <a href="../index.html#intro">intro</a>',
+    ".objects/ignored.html": '<a href="nowhere.html">never scanned</a>',
+}
+
+
+def make_site(site_root: Path) -> None:
+    for relpath, body in PAGES.items():
+        path = site_root / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"<html><body>{body}</body></html>", encoding="utf-8")
+    (site_root / "img").mkdir()
+    (site_root / "img" / "map.png").write_bytes(b"png")
+    outside = site_root.parent / "secret.txt"
+    outside.write_text("<html></html>", encoding="utf-8")
+    (site_root / "docs" / "secret.txt").symlink_to(outside)
+
+
+def summarize(items: list[dict[str, str]]) -> list[tuple[str, str, str]]:
+    return sorted((item["page"], item["link"], item["reason"]) for item in items)
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        site_root = Path(tmp) / "site"
+        make_site(site_root)
+
+        serial = check_site(site_root, jobs=1)
+        if check_site(site_root, jobs=2) != serial:
+            raise SystemExit("Link check test failed: parallel and serial results differ")
+        if serial["scanned_files"] != 4 or serial["status"] != "FAIL":
+            raise SystemExit(f"Link check test failed: unexpected summary: {serial}")
+        if summarize(serial["broken"]) != [
+            ("docs/index.html", "page.html#missing", "missing_fragment"),
+            ("docs/page.html", "../missing.html", "missing_target"),
+        ]:
+            raise SystemExit(f"Link check test failed: unexpected broken links: {serial['broken']}")
+        if summarize(serial["disallowed"]) != [
+            ("docs/deep/page.html", "../../../outside.html", "escapes_site_root"),
+            ("docs/page.html", "/abs.html", "absolute_link"),
+            ("docs/page.html", "secret.txt", "escapes_site_root"),
+        ]:
+            raise SystemExit(f"Link check test failed: unexpected disallowed links: {serial['disallowed']}")
+        if serial["fragments_checked"] != 5:
+            raise SystemExit(f"Link check test failed: expected 5 fragments checked, got {serial['fragments_checked']}")
+
+        known = check_site(
+            site_root,
+            known_broken={("docs/page.html", "../missing.html"), ("index.html", "fixed.html")},
+        )
+        if summarize(known["known_broken"]) != [("docs/page.html", "../missing.html", "missing_target")]:
+            raise SystemExit("Link check test failed: known-broken link was not set aside")
+        if known["stale_known_broken"] != [{"page": "index.html", "link": "fixed.html"}]:
+            raise SystemExit("Link check test failed: stale known-broken entry was not reported")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from aoi_report_renderer import load_report, update_evidence_hashes, write_report, write_text
+from dedup_evidence_objects import OBJECTS_DIR_NAME, DedupReport, ObjectStore, dedup_run
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+FIXTURE_DIR = ROOT_DIR / "docs/site/aoi_reports/runs/example"
+FIXTURE_REPORT_NAME = "estonia_aoi_report.json"
+
+
+def copy_run(runs_dir: Path, run_id: str) -> Path:
+    run_dir = runs_dir / run_id
+    shutil.copytree(FIXTURE_DIR, run_dir)
+    report_path = run_dir / FIXTURE_REPORT_NAME
+    write_report(report_path, update_evidence_hashes(run_dir, load_report(report_path)))
+    return run_dir
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        site_root = Path(tmp)
+        runs_dir = site_root / "aoi_reports" / "runs"
+        run_a = copy_run(runs_dir, "a")
+        run_b = copy_run(runs_dir, "b")
+
+        store = ObjectStore(site_root / OBJECTS_DIR_NAME, mode="hardlink")
+        report = DedupReport()
+        for run_dir in (run_a, run_b):
+            dedup_run(run_dir, store, report)
+
+        declared = [entry["relpath"] for entry in load_report(run_a / FIXTURE_REPORT_NAME)["evidence_artifacts"]]
+        if report.skipped or report.files != 2 * len(declared):
+            raise SystemExit(f"Dedup test failed: unexpected skips {report.skipped}")
+        if report.bytes_saved < report.runs["b"]["bytes"]:
+            raise SystemExit("Dedup test failed: the second identical run was not fully deduplicated")
+
+        relpath = declared[0]
+        if not (run_a / relpath).samefile(run_b / relpath):
+            raise SystemExit(f"Dedup test failed: {relpath} is not shared between runs")
+
+        # Rewriting one copy through the renderer must not change the other.
+        original = (run_b / relpath).read_bytes()
+        write_text(run_a / relpath, "rewritten\n")
+        if (run_b / relpath).read_bytes() != original:
+            raise SystemExit("Dedup test failed: writing one hardlinked copy changed another run")
+        if (store.object_path(report_digest(run_b, relpath))).read_bytes() != original:
+            raise SystemExit("Dedup test failed: writing a hardlinked copy changed the object store")
+
+        test_prune_keeps_referenced_objects(runs_dir / "prune", site_root / ".prune-objects")
+        test_reflinked_copy_is_left_in_place(runs_dir / "reflink", site_root / ".reflink-objects")
+    return 0
+
+
+def test_reflinked_copy_is_left_in_place(runs_dir: Path, store_root: Path) -> None:
+    run_a = copy_run(runs_dir, "a")
+    run_b = copy_run(runs_dir, "b")
+    store = ObjectStore(store_root, mode="auto")
+    dedup_run(run_a, store, DedupReport())
+
+    # Stand in for a reflink clone: a separate inode carrying the object's content and mtime.
+    relpath = next(iter(load_report(run_b / FIXTURE_REPORT_NAME)["evidence_artifacts"]))["relpath"]
+    obj = store.object_path(report_digest(run_b, relpath))
+    shutil.copy2(obj, run_b / relpath)
+    inode = (run_b / relpath).stat().st_ino
+
+    report = DedupReport()
+    dedup_run(run_b, store, report)
+    if (run_b / relpath).stat().st_ino != inode:
+        raise SystemExit("Dedup test failed: a file already sharing its object was re-cloned")
+    if report.already_linked < 1:
+        raise SystemExit(f"Dedup test failed: reflinked copy not reported as already linked: {report.as_dict()}")
+
+
+def test_prune_keeps_referenced_objects(runs_dir: Path, store_root: Path) -> None:
+    run_dir = copy_run(runs_dir, "a")
+    store = ObjectStore(store_root, mode="hardlink")
+    report = DedupReport()
+    dedup_run(run_dir, store, report)
+
+    # A reflinked object keeps st_nlink == 1 while runs still use it; simulate that with copies.
+    for digest in report.objects:
+        obj = store.object_path(digest)
+        copy = obj.with_name(obj.name + ".copy")
+        shutil.copy2(obj, copy)
+        copy.replace(obj)
+    orphan = store.object_path("0" * 64)
+    orphan.parent.mkdir(parents=True, exist_ok=True)
+    orphan.write_bytes(b"orphan\n")
+
+    if store.prune(report.referenced) != 1 or orphan.exists():
+        raise SystemExit("Dedup test failed: prune did not remove exactly the unreferenced object")
+    missing = [digest for digest in report.objects if not store.object_path(digest).is_file()]
+    if missing:
+        raise SystemExit(f"Dedup test failed: prune removed referenced objects {missing}")
+
+
+def report_digest(run_dir: Path, relpath: str) -> str:
+    for entry in load_report(run_dir / FIXTURE_REPORT_NAME)["evidence_artifacts"]:
+        if entry["relpath"] == relpath:
+            return entry["sha256"]
+    raise SystemExit(f"Dedup test failed: {relpath} is not declared")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
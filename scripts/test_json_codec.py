@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import json_codec
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+RUNS_DIR = ROOT_DIR / "docs/site/aoi_reports/runs"
+
+EDGE_CASES = [
+    {"b": [], "a": {}, "c": [{}], "d": None, "e": True, "f": False},
+    {"text": "\x00\x1f\x7f  é ü 森林 \"quoted\" back\\slash\n\t\b\f\r"},
+    {"floats": [0.0, -0.0, 0.1, 1 / 3, 2.5, 100.0, 123456789012345.6, 0.0001, 5e-324]},
+    {"exponents": [1e16, 1e-05, 1e22, 1.7976931348623157e308, 1.2345678901234568e16]},
+    {"non_finite": [float("nan"), float("inf"), float("-inf")]},
+    {"ints": [0, -1, 2**63 - 1, -(2**63), 2**64, 10**30]},
+    {"nested": {"z": {"y": {"x": [1, [2, [3, {"w": "v"}]]]}}}},
+    [],
+    "plain string",
+    42,
+]
+
+
+def reference_pretty(value: object, sort_keys: bool) -> str:
+    return json.dumps(value, sort_keys=sort_keys, indent=2, ensure_ascii=False)
+
+
+def reference_compact(value: object, sort_keys: bool) -> str:
+    return json.dumps(value, sort_keys=sort_keys, ensure_ascii=False, separators=(",", ":"))
+
+
+def check_backend(backend: str, samples: list[object]) -> None:
+    for sample in samples:
+        for sort_keys in (False, True):
+            if json_codec.dumps_pretty(sample, sort_keys=sort_keys, backend=backend) != reference_pretty(sample, sort_keys):
+                raise SystemExit(f"JSON codec test failed: {backend} pretty output differs (sort_keys={sort_keys})")
+            if json_codec.dumps_compact(sample, sort_keys=sort_keys, backend=backend) != reference_compact(sample, sort_keys):
+                raise SystemExit(f"JSON codec test failed: {backend} compact output differs (sort_keys={sort_keys})")
+        encoded = reference_pretty(sample, False)
+        if reference_pretty(json_codec.loads(encoded.encode("utf-8"), backend=backend), False) != encoded:
+            raise SystemExit(f"JSON codec test failed: {backend} loads did not round-trip")
+
+
+def main() -> int:
+    samples: list[object] = list(EDGE_CASES)
+    for report_path in sorted(RUNS_DIR.glob("*/*_aoi_report.json")):
+        samples.append(json.loads(report_path.read_text(encoding="utf-8")))
+
+    for backend in json_codec.BACKENDS:
+        check_backend(backend, samples)
+    if "orjson" not in json_codec.BACKENDS:
+        print("orjson not installed: only the stdlib backend was checked")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
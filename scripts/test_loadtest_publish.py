@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from loadtest_publish import mirror_tree
+
+
+def write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        staging, target = Path(tmp) / "staging", Path(tmp) / "target"
+        write(staging / "runs/kept/aoi_report.json", "{}\n")
+        write(target / "runs/kept/aoi_report.json", "{}\n")
+        write(target / "runs/kept/.render_cache.json", "{}\n")
+        write(target / "runs/removed/aoi_report.json", "{}\n")
+        write(target / "runs/removed/.render_cache.json", "{}\n")
+        write(target / "runs/removed/.digest_cache.json", "{}\n")
+        write(target / "runs_index.json", "{}\n")
+        write(staging / "runs/kept/evidence.csv.gz", "staged\n")
+        write(target / "runs/kept/stale.csv.gz", "stale\n")
+
+        mirror_tree(staging, target)
+
+        if not (target / "runs/kept/.render_cache.json").is_file() or not (target / "runs_index.json").is_file():
+            raise SystemExit("Mirror test failed: build caches of a staged run were deleted")
+        if (target / "runs/removed").exists():
+            raise SystemExit("Mirror test failed: caches kept a run removed from staging alive")
+        if not (target / "runs/kept/evidence.csv.gz").is_file() or (target / "runs/kept/stale.csv.gz").exists():
+            raise SystemExit("Mirror test failed: .gz artefacts were not mirrored like any other file")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
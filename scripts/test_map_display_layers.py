@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+from aoi_report_renderer import display_relpath, load_report, render_run_report_html
+from build_map_display_layers import build_run_display_layers
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+FIXTURE_DIR = ROOT_DIR / "docs/site/aoi_reports/runs/example"
+FIXTURE_REPORT_NAME = "estonia_aoi_report.json"
+
+
+def snapshot(run_dir: Path) -> dict[str, bytes]:
+    return {path.relative_to(run_dir).as_posix(): path.read_bytes() for path in run_dir.rglob("*") if path.is_file()}
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = Path(tmp) / "example"
+        shutil.copytree(FIXTURE_DIR, run_dir)
+        before = snapshot(run_dir)
+
+        debug = build_run_display_layers(run_dir, FIXTURE_REPORT_NAME)
+        if debug is None or not debug["layers"]:
+            raise SystemExit("Map display test failed: no display layers were built")
+
+        after = snapshot(run_dir)
+        changed = [relpath for relpath, content in before.items() if after.get(relpath) != content]
+        if changed:
+            raise SystemExit(f"Map display test failed: original files were modified: {changed}")
+
+        for layer in debug["layers"]:
+            if layer["display_bytes"] >= layer["source_bytes"]:
+                raise SystemExit(f"Map display test failed: {layer['layer']} did not shrink")
+            if layer["display_features"] != layer["source_features"]:
+                raise SystemExit(f"Map display test failed: {layer['layer']} dropped features")
+
+        display_config_path = run_dir / debug["display_config_relpath"]
+        display_config = json.loads(display_config_path.read_text(encoding="utf-8"))
+        for layer in debug["layers"]:
+            href = display_config["layers"][layer["layer"]]
+            if not href.endswith(".display.geojson") or not (display_config_path.parent / href).is_file():
+                raise SystemExit(f"Map display test failed: {layer['layer']} does not point at its display copy")
+
+        tiles = display_config.get("tiles")
+        if not tiles or not tiles["layers"]:
+            raise SystemExit("Map display test failed: map_config.display.json has no tile index")
+        indexed = set()
+        for layer, zooms in tiles["layers"].items():
+            for zoom, entries in zooms.items():
+                for x, y, *_bounds in entries:
+                    indexed.add(tiles["template"].format(layer=layer, z=zoom, x=x, y=y))
+            max_zoom_features = sum(
+                len(json.loads((display_config_path.parent / tiles["template"].format(layer=layer, z=tiles["max_zoom"], x=x, y=y)).read_text(encoding="utf-8"))["features"])
+                for x, y, *_bounds in zooms[str(tiles["max_zoom"])]
+            )
+            source = json.loads((display_config_path.parent / display_config["layers"][layer]).read_text(encoding="utf-8"))
+            if max_zoom_features < len(source["features"]):
+                raise SystemExit(f"Map display test failed: {layer} tiles dropped features at max zoom")
+        on_disk = {
+            path.relative_to(display_config_path.parent).as_posix()
+            for path in (display_config_path.parent / "tiles").rglob("*.geojson")
+        }
+        if on_disk != indexed:
+            raise SystemExit("Map display test failed: tile files on disk do not match the tile index")
+
+        report = load_report(run_dir / FIXTURE_REPORT_NAME)
+        config_relpath = report["map_assets"]["config_relpath"]
+        page = render_run_report_html(report, run_dir, FIXTURE_REPORT_NAME)
+        if f"const configUrl = '{display_relpath(config_relpath)}';" not in page:
+            raise SystemExit("Map display test failed: report.html map does not load the display config")
+        if f"<a href=\"{config_relpath}\">map_config.json</a>" not in page:
+            raise SystemExit("Map display test failed: report.html no longer links the declared map_config.json")
+        inlined = [line.strip() for line in page.splitlines() if line.strip().startswith("const inline")]
+        if json.loads(inlined[0].removeprefix("const inlineConfig = ").rstrip(";")) != display_config:
+            raise SystemExit("Map display test failed: report.html does not inline the display config")
+        if inlined[1] == "const inlineBoundary = null;":
+            raise SystemExit("Map display test failed: report.html does not inline the AOI boundary")
+
+        build_run_display_layers(run_dir, FIXTURE_REPORT_NAME)
+        if snapshot(run_dir) != after:
+            raise SystemExit("Map display test failed: rebuilding display layers is not deterministic")
+
+        build_run_display_layers(run_dir, FIXTURE_REPORT_NAME, tiles=False)
+        if (display_config_path.parent / "tiles").exists() or "tiles" in json.loads(display_config_path.read_text(encoding="utf-8")):
+            raise SystemExit("Map display test failed: building without tiles left the tile pyramid behind")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
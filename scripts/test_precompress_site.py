@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import gzip
+import json
+import shutil
+import subprocess
+import tempfile
+import threading
+import urllib.request
+from pathlib import Path
+
+from aoi_report_renderer import load_report, update_evidence_hashes
+from precompress_site import (
+    PRECOMPRESS_MANIFEST_NAME,
+    SIDECAR_DIR_NAME,
+    precompress_site,
+    sidecar_path,
+)
+from serve_site import SiteRequestHandler, make_server
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+FIXTURE_DIR = ROOT_DIR / "docs/site/aoi_reports/runs/example"
+FIXTURE_REPORT_NAME = "estonia_aoi_report.json"
+
+
+def make_site(tmp_dir: Path) -> Path:
+    site_root = tmp_dir / "site"
+    shutil.copytree(FIXTURE_DIR, site_root / "aoi_reports" / "runs" / "example")
+    return site_root
+
+
+def sidecars(site_root: Path) -> dict[str, bytes]:
+    return {path.relative_to(site_root).as_posix(): path.read_bytes() for path in sorted(site_root.rglob("*.gz"))}
+
+
+def fetch(url: str, accept_encoding: str | None) -> tuple[str | None, bytes]:
+    request = urllib.request.Request(url, headers={"Accept-Encoding": accept_encoding} if accept_encoding else {})
+    with urllib.request.urlopen(request) as response:
+        return response.headers.get("Content-Encoding"), response.read()
+
+
+def check_server(site_root: Path, relpath: str) -> None:
+    SiteRequestHandler.log_message = lambda *args: None  # keep test output quiet
+    server = make_server(site_root, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/{relpath}"
+        original = (site_root / relpath).read_bytes()
+        encoding, body = fetch(url, "br;q=0, gzip")
+        if encoding != "gzip" or gzip.decompress(body) != original:
+            raise SystemExit("Precompress test failed: server did not serve the .gz sidecar")
+        encoding, body = fetch(url, None)
+        if encoding is not None or body != original:
+            raise SystemExit("Precompress test failed: server compressed a response the client did not accept")
+
+        # A source changed after precompression must not be served from its stale sidecar.
+        (site_root / relpath).write_bytes(original + b"\n")
+        encoding, body = fetch(url, "gzip")
+        if encoding is not None or body != original + b"\n":
+            raise SystemExit("Precompress test failed: server served a stale sidecar")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def check_git_ignores_only_sidecars() -> None:
+    """Generated sidecars are gitignored; a staged .gz evidence file must still publish."""
+
+    evidence = "docs/site/aoi_reports/runs/example/evidence/parcels.geojson.gz"
+    generated = f"docs/site/{SIDECAR_DIR_NAME}/aoi_reports/runs/example/report.html.gz"
+    for relpath, ignored in ((evidence, False), (generated, True)):
+        completed = subprocess.run(["git", "check-ignore", "-q", relpath], cwd=ROOT_DIR)
+        if completed.returncode != (0 if ignored else 1):
+            state = "not ignored" if ignored else "ignored"
+            raise SystemExit(f"Precompress test failed: git check-ignore reports {relpath} as {state}")
+
+
+def check_legacy_sidecars_removed(site_root: Path, manifest: dict) -> None:
+    relpath = min(manifest["files"])
+    legacy = site_root / f"{relpath}.gz"
+    legacy.write_bytes(b"old sidecar")
+    manifest_path = site_root / PRECOMPRESS_MANIFEST_NAME
+    manifest_path.write_text(json.dumps({"version": 1, "files": {relpath: {}}}), encoding="utf-8")
+    precompress_site(site_root, jobs=1)
+    if legacy.exists():
+        raise SystemExit("Precompress test failed: a sidecar written next to its source by version 1 was kept")
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as dir_one, tempfile.TemporaryDirectory() as dir_two:
+        site_one = make_site(Path(dir_one))
+        site_two = make_site(Path(dir_two))
+        run_dir = site_one / "aoi_reports" / "runs" / "example"
+        report = load_report(run_dir / FIXTURE_REPORT_NAME)
+        declared = update_evidence_hashes(run_dir, report)
+
+        manifest = precompress_site(site_one, jobs=1)
+        precompress_site(site_two, jobs=4)
+        if not manifest["files"]:
+            raise SystemExit("Precompress test failed: no files were compressed")
+        if sidecars(site_one) != sidecars(site_two):
+            raise SystemExit("Precompress test failed: sidecars are not deterministic")
+
+        for relpath, entry in manifest["files"].items():
+            source = site_one / relpath
+            if gzip.decompress(sidecar_path(site_one, relpath, "gzip").read_bytes()) != source.read_bytes():
+                raise SystemExit(f"Precompress test failed: {relpath}.gz does not decompress to the original")
+            if entry["bytes"] != source.stat().st_size or entry["gzip"] >= entry["bytes"]:
+                raise SystemExit(f"Precompress test failed: manifest sizes are wrong for {relpath}")
+        if PRECOMPRESS_MANIFEST_NAME in manifest["files"]:
+            raise SystemExit("Precompress test failed: the manifest compressed itself")
+
+        if update_evidence_hashes(run_dir, load_report(run_dir / FIXTURE_REPORT_NAME)) != declared:
+            raise SystemExit("Precompress test failed: declared artefact hashes changed")
+
+        if precompress_site(site_one, jobs=1)["sidecars_written"]:
+            raise SystemExit("Precompress test failed: unchanged sources were recompressed")
+
+        check_git_ignores_only_sidecars()
+        check_legacy_sidecars_removed(site_two, manifest)
+
+        largest = max(manifest["files"], key=lambda relpath: manifest["files"][relpath]["bytes"])
+        check_server(site_one, largest)
+
+        (site_one / largest).unlink()
+        precompress_site(site_one, jobs=1)
+        if sidecar_path(site_one, largest, "gzip").exists():
+            raise SystemExit("Precompress test failed: sidecar of a removed file was kept")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import tempfile
+from pathlib import Path
+
+import profiling
+from render_aoi_report_from_json import render_runs
+from synthetic_aoi_bundle import SyntheticSpec, write_synthetic_run
+
+
+def test_disabled_is_a_no_op() -> None:
+    if profiling.enabled():
+        raise SystemExit("Profiling test failed: profiling should be off outside a session")
+    if profiling.span("a") is not profiling.span("b"):
+        raise SystemExit("Profiling test failed: disabled span() should return the shared no-op span")
+    with profiling.span("ignored", run="r1"):
+        profiling.add_read(10)
+        profiling.add_written(10)
+    with profiling.session(None, "noop"):
+        if profiling.enabled():
+            raise SystemExit("Profiling test failed: session(None) should not enable profiling")
+
+
+def test_session_nests_spans_and_counts_bytes(tmp: Path) -> None:
+    output = tmp / "profile.json"
+    with profiling.session(str(output), "unit"):
+        with profiling.span("run", run="r1"):
+            profiling.add_read(100)
+            with profiling.span("render"):
+                profiling.add_written(40)
+        with profiling.span("run", run="r2"):
+            pass
+    profile = json.loads(output.read_text(encoding="utf-8"))
+    if profiling.enabled():
+        raise SystemExit("Profiling test failed: profiling should be off after the session")
+    stages = profile["stages"]
+    if stages["run"]["count"] != 2 or stages["run/render"]["bytes_written"] != 40:
+        raise SystemExit(f"Profiling test failed: unexpected stages: {stages}")
+    if stages["run"]["bytes_read"] != 100 or profile["bytes_written"] != 40:
+        raise SystemExit(f"Profiling test failed: bytes not counted inclusively: {profile}")
+    if set(profile["runs"]) != {"r1", "r2"} or "run/render" not in profile["runs"]["r1"]:
+        raise SystemExit(f"Profiling test failed: unexpected per-run breakdown: {profile['runs']}")
+
+
+def test_merge_nests_worker_spans(tmp: Path) -> None:
+    def worker() -> str:
+        with profiling.span("run", run="w1"):
+            profiling.add_read(7)
+        return "done"
+
+    output = tmp / "merge.json"
+    with profiling.session(str(output), "merge"):
+        with profiling.span("batch"):
+            result, spans = profiling.call_in_worker(profiling.enabled(), worker)
+            profiling.merge(spans)
+    profile = json.loads(output.read_text(encoding="utf-8"))
+    if result != "done" or profile["stages"]["batch/run"]["bytes_read"] != 7:
+        raise SystemExit(f"Profiling test failed: worker spans not merged: {profile['stages']}")
+    if profile["stages"]["batch"]["bytes_read"] != 7 or profile["bytes_read"] != 7:
+        raise SystemExit(f"Profiling test failed: worker bytes not added to the parent: {profile}")
+
+
+def test_render_profile_covers_every_stage(tmp: Path) -> None:
+    runs_dir = tmp / "runs"
+    spec = SyntheticSpec(evidence=2, parcels=2, criteria=2, results=2, metrics=2, mask_vertices=8)
+    for run_id in ("a", "b"):
+        write_synthetic_run(runs_dir / run_id, spec, render=False)
+    output = tmp / "render.json"
+    with profiling.session(str(output), "render", use_tracemalloc=True):
+        render_runs(runs_dir, update_json=True, jobs=1)
+    profile = json.loads(output.read_text(encoding="utf-8"))
+    expected = {
+        "run/load_report",
+        "run/render_aoi_run/render_report_html",
+        "run/render_aoi_run/render_run_report_html",
+        "run/render_aoi_run/render_report_json",
+        "run/render_aoi_run/render_metrics_csv",
+        "run/hash_evidence",
+        "run/write_report",
+    }
+    missing = expected - set(profile["stages"])
+    if missing:
+        raise SystemExit(f"Profiling test failed: render profile missing stages: {sorted(missing)}")
+    if set(profile["runs"]) != {"a", "b"}:
+        raise SystemExit(f"Profiling test failed: render profile runs: {sorted(profile['runs'])}")
+    html = profile["runs"]["a"]["run/render_aoi_run/render_report_html"]
+    if html["bytes_written"] != (runs_dir / "a/reports/aoi_report_v2/synthetic_aoi.html").stat().st_size:
+        raise SystemExit(f"Profiling test failed: render_report_html bytes_written mismatch: {html}")
+    if profile["tracemalloc"]["peak_bytes"] <= 0:
+        raise SystemExit("Profiling test failed: tracemalloc peak not recorded")
+
+
+def main() -> int:
+    test_disabled_is_a_no_op()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_session_nests_spans_and_counts_bytes(Path(tmp))
+        test_merge_nests_worker_spans(Path(tmp))
+        test_render_profile_covers_every_stage(Path(tmp))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
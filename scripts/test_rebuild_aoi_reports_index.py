@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from rebuild_aoi_reports_index import RUNS_INDEX_NAME, refresh_runs_index
+
+
+def write_run(runs_dir: Path, run_id: str, generated_at_utc: str) -> Path:
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / "report.html").write_text("<html></html>\n", encoding="utf-8")
+    report_path = run_dir / "aoi_report.json"
+    report_path.write_text(json.dumps({"aoi_id": run_id, "generated_at_utc": generated_at_utc}) + "\n", encoding="utf-8")
+    return report_path
+
+
+def replace_atomically(path: Path, content: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(content, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        aoi_reports = Path(tmp)
+        runs_dir = aoi_reports / "runs"
+        index_path = aoi_reports / RUNS_INDEX_NAME
+        report_path = write_run(runs_dir, "r1", "2025-01-01T00:00:00+00:00")
+        write_run(runs_dir, "r2", "2025-01-01T00:00:00+00:00")
+        runs = refresh_runs_index(runs_dir, index_path)
+        if sorted(runs) != ["r1", "r2"]:
+            raise SystemExit(f"Index test failed: initial scan found {sorted(runs)}")
+
+        # Re-publishing a run rewrites files inside runs/<id>/ only; runs/ keeps its mtime,
+        # so a plain refresh trusts the index and the publish path names the run.
+        runs_dir_mtime_ns = runs_dir.stat().st_mtime_ns
+        replace_atomically(report_path, json.dumps({"aoi_id": "r1", "generated_at_utc": "2099-01-01T00:00:00+00:00"}))
+        os.utime(runs_dir, ns=(runs_dir_mtime_ns, runs_dir_mtime_ns))
+        runs = refresh_runs_index(runs_dir, index_path)
+        if runs["r1"]["generated_at_utc"] != "2025-01-01T00:00:00+00:00":
+            raise SystemExit(f"Index test failed: unchanged runs/ should reuse the index: {runs['r1']}")
+        runs = refresh_runs_index(runs_dir, index_path, run_ids=["r1"])
+        if runs["r1"]["generated_at_utc"] != "2099-01-01T00:00:00+00:00":
+            raise SystemExit(f"Index test failed: --run-id did not rescan the run: {runs['r1']}")
+
+        # An in-place rewrite keeps the directory mtime; --full-rescan's stat sweep sees the
+        # report JSON's own size and mtime change.
+        run_dir_mtime_ns = report_path.parent.stat().st_mtime_ns
+        report_path.write_text(json.dumps({"aoi_id": "r1", "generated_at_utc": "2100-01-01T00:00:00+00:00"}), encoding="utf-8")
+        os.utime(report_path.parent, ns=(run_dir_mtime_ns, run_dir_mtime_ns))
+        runs = refresh_runs_index(runs_dir, index_path, full_rescan=True)
+        if runs["r1"]["generated_at_utc"] != "2100-01-01T00:00:00+00:00":
+            raise SystemExit(f"Index test failed: full rescan missed an in-place report rewrite: {runs['r1']}")
+
+        write_run(runs_dir, "r3", "2025-01-01T00:00:00+00:00")
+        (runs_dir / "r2" / "report.html").unlink()
+        (runs_dir / "r2" / "aoi_report.json").unlink()
+        (runs_dir / "r2").rmdir()
+        runs = refresh_runs_index(runs_dir, index_path)
+        if sorted(runs) != ["r1", "r3"]:
+            raise SystemExit(f"Index test failed: added/removed runs not picked up: {sorted(runs)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from rebuild_site_nav import rebuild_site
+from site_nav import render_header_nav
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SITE_ROOT = ROOT_DIR / "docs/site"
+STALE_HEADER = '<header>\n<nav><a href="index.html" class="active">{label}</a></nav>\n</header>'
+
+
+def page(header: str) -> str:
+    return f"<!doctype html>\n<html>\n<body>\n{header}\n<main>content</main>\n</body>\n</html>\n"
+
+
+def check_published_site() -> None:
+    header = render_header_nav(rel_prefix="")
+    for index_page in sorted(SITE_ROOT.glob("*/index.html")):
+        href = index_page.relative_to(SITE_ROOT).as_posix()
+        if f'href="{href}"' not in header:
+            raise SystemExit(f"Nav test failed: the shared nav has no entry for section page {href}")
+    stale = [result.relpath for result in rebuild_site(SITE_ROOT, jobs=1, dry_run=True) if result.status == "changed"]
+    if stale:
+        raise SystemExit(f"Nav test failed: committed pages differ from the shared nav: {stale}")
+
+
+def main() -> int:
+    check_published_site()
+    with tempfile.TemporaryDirectory() as tmp:
+        site_root = Path(tmp)
+        (site_root / "views").mkdir()
+        (site_root / "aoi_reports" / "runs" / "r1").mkdir(parents=True)
+        (site_root / ".objects").mkdir()
+        (site_root / "index.html").write_text(page(STALE_HEADER.format(label="Home")), encoding="utf-8")
+        (site_root / "views" / "index.html").write_text(page(STALE_HEADER.format(label="Views")), encoding="utf-8")
+        indented = "  " + STALE_HEADER.format(label="AOI Reports").replace("\n", "\n  ")
+        (site_root / "aoi_reports" / "runs" / "r1" / "report.html").write_text(page(indented), encoding="utf-8")
+        (site_root / "aoi_reports" / "runs" / "r1" / "standalone.html").write_text(page(""), encoding="utf-8")
+        (site_root / ".objects" / "hidden.html").write_text(page(STALE_HEADER.format(label="Home")), encoding="utf-8")
+
+        before = {path: path.read_bytes() for path in site_root.rglob("*.html")}
+        dry = {result.relpath: result.status for result in rebuild_site(site_root, jobs=1, dry_run=True)}
+        if {path: path.read_bytes() for path in site_root.rglob("*.html")} != before:
+            raise SystemExit("Nav test failed: dry run wrote files")
+        expected = {
+            "aoi_reports/runs/r1/report.html": "changed",
+            "aoi_reports/runs/r1/standalone.html": "no_header",
+            "index.html": "changed",
+            "views/index.html": "changed",
+        }
+        if dry != expected:
+            raise SystemExit(f"Nav test failed: unexpected dry-run statuses: {dry}")
+
+        rebuild_site(site_root, jobs=2)
+        views = (site_root / "views" / "index.html").read_text(encoding="utf-8")
+        if render_header_nav(rel_prefix="../", active_label="Views") not in views:
+            raise SystemExit("Nav test failed: nested page did not get a ../ prefixed header")
+        report = (site_root / "aoi_reports" / "runs" / "r1" / "report.html").read_text(encoding="utf-8")
+        expected_header = "  " + render_header_nav(rel_prefix="../../../", active_label="AOI Reports").replace("\n", "\n  ")
+        if expected_header not in report:
+            raise SystemExit("Nav test failed: indented header lost its indentation or active label")
+        if (site_root / ".objects" / "hidden.html").read_bytes() != before[site_root / ".objects" / "hidden.html"]:
+            raise SystemExit("Nav test failed: hidden folders were rewritten")
+
+        mtimes = {path: path.stat().st_mtime_ns for path in site_root.rglob("*.html")}
+        results = rebuild_site(site_root, jobs=1)
+        if any(result.status == "changed" for result in results):
+            raise SystemExit("Nav test failed: second rebuild was not a no-op")
+        if {path: path.stat().st_mtime_ns for path in site_root.rglob("*.html")} != mtimes:
+            raise SystemExit("Nav test failed: unchanged pages were rewritten")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
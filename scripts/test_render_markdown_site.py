@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from render_markdown_site import SiteDocument, render_markdown, render_site
+
+
+DOCUMENTS = (
+    SiteDocument("guide.md", "guide.html", "Guide"),
+    SiteDocument("views/a_view.md", "views/a_view.html", "A view", "Views"),
+    SiteDocument("views/b_view.md", "views/b_view.html", "B view", "Views"),
+)
+
+SOURCES = {
+    "guide.md": "# Guide\n\nSee [the A view](views/a_view.md#scope) and [notes](notes.md).\n",
+    "views/a_view.md": (
+        "# A view\n\n## Scope\n\n"
+        "| Task | Where |\n|---|---|\n| **One** | [guide](../guide.md), `runs/<run_id>/**x**` |\n\n"
+        "1. first\n2. second\n- item\n\n```\n<raw> & **kept**\n```\n## Scope\n"
+    ),
+    "views/b_view.md": "# B view\n\n> quoted `code`\n<div>raw html</div>\n",
+}
+
+
+def check_tokenizer() -> None:
+    body = render_markdown("- [**bold** `c`](x.html) and `[not](a link)` and **b**")
+    expected = (
+        '<ul>\n<li><a href="x.html"><strong>bold</strong> <code>c</code></a>'
+        " and <code>[not](a link)</code> and <strong>b</strong></li>\n</ul>"
+    )
+    if body != expected:
+        raise SystemExit(f"Markdown test failed: unexpected inline rendering:\n{body}")
+
+
+def check_nested_lists_and_bare_urls() -> None:
+    body = render_markdown("- top\n  - child https://example.org/a.md.\n    1. deep\n  - sibling\n- next")
+    expected = "\n".join(
+        [
+            "<ul>",
+            "<li>top",
+            "<ul>",
+            '<li>child <a href="https://example.org/a.md">https://example.org/a.md</a>.',
+            "<ol>",
+            "<li>deep</li>",
+            "</ol>",
+            "</li>",
+            "<li>sibling</li>",
+            "</ul>",
+            "</li>",
+            "<li>next</li>",
+            "</ul>",
+        ]
+    )
+    if body != expected:
+        raise SystemExit(f"Markdown test failed: unexpected nested list rendering:\n{body}")
+    linked = render_markdown("[site](https://example.org/) and `https://example.org/code`")
+    if linked != '<p><a href="https://example.org/">site</a> and <code>https://example.org/code</code></p>':
+        raise SystemExit(f"Markdown test failed: bare URL autolinking touched a link or code span:\n{linked}")
+
+
+def main() -> int:
+    check_tokenizer()
+    check_nested_lists_and_bare_urls()
+    with tempfile.TemporaryDirectory() as tmp:
+        docs_root = Path(tmp) / "docs"
+        for relpath, text in SOURCES.items():
+            (docs_root / relpath).parent.mkdir(parents=True, exist_ok=True)
+            (docs_root / relpath).write_text(text, encoding="utf-8")
+
+        serial_root = Path(tmp) / "serial"
+        parallel_root = Path(tmp) / "parallel"
+        result = render_site(docs_root=docs_root, site_root=serial_root, documents=DOCUMENTS, jobs=1)
+        render_site(docs_root=docs_root, site_root=parallel_root, documents=DOCUMENTS, jobs=3)
+        if len(result["rendered"]) != 3:
+            raise SystemExit(f"Markdown test failed: expected three rendered documents: {result}")
+        for document in DOCUMENTS:
+            if (serial_root / document.output).read_bytes() != (parallel_root / document.output).read_bytes():
+                raise SystemExit(f"Markdown test failed: parallel output differs for {document.output}")
+
+        guide = (serial_root / "guide.html").read_text(encoding="utf-8")
+        if '<a href="views/a_view.html#scope">' not in guide or '<a href="#" title="notes.md">' not in guide:
+            raise SystemExit("Markdown test failed: .md links were not rewritten")
+        view = (serial_root / "views" / "a_view.html").read_text(encoding="utf-8")
+        for snippet in (
+            '<h2 id="scope">Scope</h2>',
+            '<h2 id="scope-1">Scope</h2>',
+            "<th>Task</th>",
+            '<td><a href="../guide.html">guide</a>, <code>runs/&lt;run_id&gt;/**x**</code></td>',
+            "&lt;raw&gt; &amp; **kept**",
+            '<a href="../privacy.html"',
+            '<a href="../views/index.html" class="active">Views</a>',
+        ):
+            if snippet not in view:
+                raise SystemExit(f"Markdown test failed: {snippet!r} missing from views/a_view.html")
+
+        if render_site(docs_root=docs_root, site_root=serial_root, documents=DOCUMENTS)["rendered"]:
+            raise SystemExit("Markdown test failed: unchanged sources were re-rendered")
+        (docs_root / "views" / "b_view.md").write_text("# B view\n\nChanged.\n", encoding="utf-8")
+        (serial_root / "guide.html").write_text("edited by hand", encoding="utf-8")
+        result = render_site(docs_root=docs_root, site_root=serial_root, documents=DOCUMENTS)
+        if sorted(result["rendered"]) != ["guide.html", "views/b_view.html"]:
+            raise SystemExit(f"Markdown test failed: expected only changed documents to render: {result}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from strict_md_url_check import ResultCache, build_report, check_urls, collect_urls
+
+
+ETAG = '"v1"'
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers for any Host: the path picks the behaviour."""
+
+    protocol_version = "HTTP/1.1"
+    requests: list[tuple[str, str, str]] = []
+    client_ports: set[int] = set()
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+    def _respond(self, status: int, headers: dict[str, str] | None = None, body: bytes = b"") -> None:
+        cls = type(self)
+        with cls.lock:
+            cls.requests.append((self.command, self.headers.get("Host", ""), self.path))
+            cls.client_ports.add(self.client_address[1])
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        time.sleep(0.02)
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+        with cls.lock:
+            cls.active -= 1
+
+    def do_HEAD(self) -> None:
+        self.handle_path()
+
+    def do_GET(self) -> None:
+        self.handle_path()
+
+    def handle_path(self) -> None:
+        if self.path.startswith("/ok"):
+            if self.headers.get("If-None-Match") == ETAG:
+                self._respond(304, {"ETag": ETAG})
+            else:
+                self._respond(200, {"ETag": ETAG}, b"ok")
+        elif self.path == "/no-head":
+            self._respond(405 if self.command == "HEAD" else 200, body=b"get only")
+        elif self.path == "/moved":
+            self._respond(301, {"Location": "/ok-target"})
+        else:
+            self._respond(404, body=b"missing")
+
+
+def run_check(port: int, urls: list[str], cache: ResultCache, per_host: int = 2):
+    return asyncio.run(check_urls(urls, cache, concurrency=8, per_host=per_host, stand_in=f"127.0.0.1:{port}"))
+
+
+def main() -> int:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp) / "repo"
+            (repo / "docs").mkdir(parents=True)
+            ok_urls = [f"https://example.org/ok{index}" for index in range(6)]
+            (repo / "docs" / "sources.md").write_text(
+                "\n".join(f"- [ok {index}]({url})" for index, url in enumerate(ok_urls))
+                + "\nSee https://example.org/no-head, https://example.org/moved and"
+                " [gone](https://other.example/gone#section).\n",
+                encoding="utf-8",
+            )
+            (repo / ".venv").mkdir()
+            (repo / ".venv" / "skip.md").write_text("https://example.org/skipped\n", encoding="utf-8")
+
+            urls_to_sources = collect_urls([repo])
+            urls = sorted(urls_to_sources)
+            if len(urls) != 9 or "https://other.example/gone" not in urls:
+                raise SystemExit(f"URL check test failed: unexpected URLs collected: {urls}")
+
+            cache_path = Path(tmp) / "cache.json"
+            cache = ResultCache.load(cache_path, ttl_seconds=3600)
+            results, client = run_check(port, urls, cache, per_host=2)
+            cache.save(urls)
+            report = build_report(results, urls_to_sources)
+            if report["failed"] != 1 or report["failures"][0]["url"] != "https://other.example/gone":
+                raise SystemExit(f"URL check test failed: unexpected failures: {report}")
+            if report["failures"][0]["status"] != 404 or report["failures"][0]["sources"] != ["repo/docs/sources.md"]:
+                raise SystemExit(f"URL check test failed: failure entry is incomplete: {report['failures']}")
+            if StandInHandler.max_active > 4:
+                raise SystemExit(f"URL check test failed: per-host cap exceeded ({StandInHandler.max_active} active)")
+            if client.connections_opened >= client.requests_sent:
+                raise SystemExit("URL check test failed: keep-alive connections were not reused")
+            if ("GET", "example.org", "/no-head") not in StandInHandler.requests:
+                raise SystemExit("URL check test failed: HEAD 405 did not fall back to GET")
+
+            # Within the TTL passing URLs cost nothing; the failure is checked again.
+            StandInHandler.requests.clear()
+            results, _client = run_check(port, urls, ResultCache.load(cache_path, ttl_seconds=3600))
+            if [path for _method, _host, path in StandInHandler.requests] != ["/gone"]:
+                raise SystemExit(f"URL check test failed: fresh cache entries were re-requested: {StandInHandler.requests}")
+            if build_report(results, urls_to_sources)["cached"] != 8:
+                raise SystemExit("URL check test failed: cached results were not reported")
+
+            # Expired entries with an ETag are revalidated and answered with 304.
+            StandInHandler.requests.clear()
+            results, _client = run_check(port, urls, ResultCache.load(cache_path, ttl_seconds=0))
+            report = build_report(results, urls_to_sources)
+            if report["revalidated"] != len(ok_urls) + 1 or report["passed"] != 8:
+                raise SystemExit(f"URL check test failed: expired entries were not revalidated: {report}")
+    finally:
+        server.shutdown()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
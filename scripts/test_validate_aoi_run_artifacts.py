@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from aoi_report_renderer import load_report, update_evidence_hashes, write_report
+from validate_aoi_run_artifacts import check_run, validate_run, validate_runs
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+FIXTURE_DIR = ROOT_DIR / "docs/site/aoi_reports/runs/example"
+FIXTURE_REPORT_NAME = "estonia_aoi_report.json"
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        runs_dir = Path(tmp)
+        for run_id in ("a_ok", "b_broken", "c_ambiguous"):
+            shutil.copytree(FIXTURE_DIR, runs_dir / run_id)
+
+        broken = runs_dir / "b_broken"
+        declared = load_report(broken / FIXTURE_REPORT_NAME)["evidence_artifacts"][0]["relpath"]
+        (broken / declared).unlink()
+        (broken / "report.html").unlink()
+        shutil.copy2(runs_dir / "c_ambiguous" / FIXTURE_REPORT_NAME, runs_dir / "c_ambiguous" / "copy_aoi_report.json")
+
+        results = {result.run_id: result for result in validate_runs(sorted(runs_dir.iterdir()), jobs=2)}
+        if not results["a_ok"].ok or results["a_ok"].report_json != FIXTURE_REPORT_NAME:
+            raise SystemExit("Validation test failed: a valid run was reported as broken")
+        kinds = [problem.kind for problem in results["b_broken"].problems]
+        if kinds != ["missing_artifacts", "missing_report_html"]:
+            raise SystemExit(f"Validation test failed: broken run problems were not all collected: {kinds}")
+        if results["b_broken"].problems[0].details != [declared]:
+            raise SystemExit("Validation test failed: missing artefact was not listed")
+        if [problem.kind for problem in results["c_ambiguous"].problems] != ["ambiguous_report_json"]:
+            raise SystemExit("Validation test failed: ambiguous report JSON was not reported")
+
+        # The default mode still stops at the first problem of a run.
+        try:
+            validate_run(broken)
+        except SystemExit as exc:
+            if str(exc) != results["b_broken"].problems[0].message:
+                raise SystemExit(f"Validation test failed: unexpected first-failure message: {exc}")
+        else:
+            raise SystemExit("Validation test failed: validate_run accepted a broken run")
+
+        check_verify_hashes(runs_dir / "a_ok")
+    return 0
+
+
+def check_verify_hashes(run_dir: Path) -> None:
+    report_path = run_dir / FIXTURE_REPORT_NAME
+    report = update_evidence_hashes(run_dir, load_report(report_path))
+    write_report(report_path, report)
+    _path, problems = check_run(run_dir, verify_hashes=True)
+    if problems:
+        raise SystemExit(f"Hash verification test failed: fresh hashes were rejected: {problems}")
+
+    entries = [entry for entry in report["evidence_artifacts"] if entry["size_bytes"] > 0]
+    flipped, truncated = entries[0]["relpath"], entries[1]["relpath"]
+    data = (run_dir / flipped).read_bytes()
+    (run_dir / flipped).write_bytes(bytes([data[0] ^ 1]) + data[1:])
+    (run_dir / truncated).write_bytes((run_dir / truncated).read_bytes()[:-1])
+
+    _path, problems = check_run(run_dir, verify_hashes=True, hash_workers=2)
+    by_kind = {problem.kind: problem.details for problem in problems}
+    if [detail.split(":")[0] for detail in by_kind.get("size_mismatch", [])] != [truncated]:
+        raise SystemExit(f"Hash verification test failed: truncated file not reported: {problems}")
+    if [detail.split(":")[0] for detail in by_kind.get("sha256_mismatch", [])] != [flipped]:
+        raise SystemExit(f"Hash verification test failed: modified file not reported: {problems}")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
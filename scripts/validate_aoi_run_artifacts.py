@@ -3,80 +3,322 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import partial
 from pathlib import Path
+from typing import Any
 
+import profiling
+from aoi_report_renderer import DEFAULT_HASH_WORKERS, DigestCache, EvidenceIndex, load_report, sha256_hex_many
 
-def resolve_report_json_path(run_dir: Path) -> Path:
+
+@dataclass(frozen=True)
+class RunProblem:
+    """One validation failure; `details` lists the offending relpaths or file names."""
+
+    kind: str
+    message: str
+    details: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class RunValidation:
+    run_id: str
+    report_json: str | None
+    seconds: float
+    problems: list[RunProblem]
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "ok": self.ok,
+            "report_json": self.report_json,
+            "seconds": round(self.seconds, 6),
+            "errors": [asdict(problem) for problem in self.problems],
+        }
+
+
+def _resolve_report_json(run_dir: Path) -> Path | RunProblem:
     preferred_candidates = sorted(path for path in run_dir.glob("*_aoi_report.json") if path.is_file())
     if len(preferred_candidates) == 1:
         return preferred_candidates[0]
     if len(preferred_candidates) > 1:
-        names = ", ".join(path.name for path in preferred_candidates)
-        raise SystemExit(f"Multiple *_aoi_report.json candidates in {run_dir}: {names}")
+        names = [path.name for path in preferred_candidates]
+        return RunProblem(
+            "ambiguous_report_json",
+            f"Multiple *_aoi_report.json candidates in {run_dir}: {', '.join(names)}",
+            names,
+        )
 
     default = run_dir / "aoi_report.json"
     if default.is_file():
         return default
 
     candidates = sorted(
-        path for path in run_dir.glob("*.json") if path.name not in {"summary.json", "manifest.json"}
+        path
+        for path in run_dir.glob("*.json")
+        if path.name not in {"summary.json", "manifest.json"} and not path.name.startswith(".")
     )
     if len(candidates) == 1:
         return candidates[0]
     if not candidates:
-        raise SystemExit(f"Missing run report JSON in {run_dir}")
-    names = ", ".join(path.name for path in candidates)
-    raise SystemExit(f"Multiple run report JSON candidates in {run_dir}: {names}")
+        return RunProblem("missing_report_json", f"Missing run report JSON in {run_dir}")
+    names = [path.name for path in candidates]
+    return RunProblem(
+        "ambiguous_report_json",
+        f"Multiple run report JSON candidates in {run_dir}: {', '.join(names)}",
+        names,
+    )
+
+
+def resolve_report_json_path(run_dir: Path) -> Path:
+    resolved = _resolve_report_json(run_dir)
+    if isinstance(resolved, RunProblem):
+        raise SystemExit(resolved.message)
+    return resolved
+
+
+def verify_declared_hashes(
+    run_dir: Path, entries: list[dict[str, Any]], workers: int = DEFAULT_HASH_WORKERS
+) -> list[RunProblem]:
+    """Compare declared size_bytes/sha256 with the files on disk.
+
+    Sizes are compared first so a truncated or replaced file is caught without
+    hashing it. The remaining files are hashed `workers` at a time; digests of
+    files whose inode, size and mtime are unchanged come from .digest_cache.json.
+    Missing files are left to the existence check.
+    """
+
+    cache = DigestCache.for_run(run_dir)
+    size_mismatches: list[str] = []
+    undeclared: list[str] = []
+    declared_digests: dict[str, str] = {}
+    actual_digests: dict[str, str] = {}
+    to_hash: list[tuple[str, Path, os.stat_result]] = []
+    for entry in entries:
+        relpath = entry.get("relpath")
+        if not relpath:
+            continue
+        path = run_dir / relpath
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        declared_size = entry.get("size_bytes")
+        declared = entry.get("sha256")
+        if not isinstance(declared, str) or not isinstance(declared_size, int):
+            undeclared.append(relpath)
+            continue
+        if declared_size != stat.st_size:
+            size_mismatches.append(f"{relpath}: declared {declared_size} bytes, found {stat.st_size}")
+            continue
+        declared_digests[relpath] = declared
+        cached = cache.lookup(relpath, stat)
+        if cached is None:
+            to_hash.append((relpath, path, stat))
+        else:
+            actual_digests[relpath] = cached
 
+    profiling.add_read(sum(stat.st_size for _relpath, _path, stat in to_hash))
+    for (relpath, _path, stat), digest in zip(to_hash, sha256_hex_many([path for _, path, _ in to_hash], workers)):
+        cache.store(relpath, stat, digest)
+        actual_digests[relpath] = digest
+    cache.save()
 
-def validate_run(run_dir: Path) -> None:
-    report_path = resolve_report_json_path(run_dir)
+    digest_mismatches = [
+        f"{relpath}: declared sha256 {declared}, found {actual_digests[relpath]}"
+        for relpath, declared in declared_digests.items()
+        if actual_digests[relpath] != declared
+    ]
+    problems = []
+    if undeclared:
+        problems.append(
+            RunProblem("undeclared_digest", f"Declared artefacts without sha256/size_bytes in {run_dir}: {undeclared}", undeclared)
+        )
+    if size_mismatches:
+        problems.append(
+            RunProblem("size_mismatch", f"size_bytes mismatch in {run_dir}: {'; '.join(size_mismatches)}", size_mismatches)
+        )
+    if digest_mismatches:
+        problems.append(
+            RunProblem("sha256_mismatch", f"sha256 mismatch in {run_dir}: {'; '.join(digest_mismatches)}", digest_mismatches)
+        )
+    return problems
 
-    report = json.loads(report_path.read_text(encoding="utf-8"))
-    evidence = report.get("evidence_artifacts", [])
-    if not evidence:
-        raise SystemExit(f"No evidence_artifacts entries in {report_path}")
 
+def check_run(
+    run_dir: Path, verify_hashes: bool = False, hash_workers: int = DEFAULT_HASH_WORKERS
+) -> tuple[Path | None, list[RunProblem]]:
+    """Every problem with one run, in the order validate_run reports them."""
+
+    with profiling.span("validate", run=run_dir.name):
+        return _check_run(run_dir, verify_hashes, hash_workers)
+
+
+def _check_run(run_dir: Path, verify_hashes: bool, hash_workers: int) -> tuple[Path | None, list[RunProblem]]:
+    resolved = _resolve_report_json(run_dir)
+    if isinstance(resolved, RunProblem):
+        return None, [resolved]
+    report_path = resolved
+
+    try:
+        report = load_report(report_path)
+    except (OSError, ValueError) as exc:
+        return report_path, [RunProblem("invalid_report_json", f"Cannot read {report_path}: {exc}", [report_path.name])]
+    index = EvidenceIndex.from_report(report)
+    if not index.entries:
+        return report_path, [RunProblem("no_evidence", f"No evidence_artifacts entries in {report_path}")]
+
+    problems = []
     missing = []
-    html_relpaths = []
-    for entry in evidence:
+    for entry in index.entries:
         relpath = entry.get("relpath")
         if not relpath:
             continue
         artifact_path = run_dir / relpath
         if not artifact_path.is_file():
             missing.append(relpath)
-        if relpath.endswith(".html"):
-            html_relpaths.append(relpath)
+    html_relpaths = index.relpaths_with_extension(".html")
 
     if missing:
-        raise SystemExit(f"Missing declared artefacts in {run_dir}: {missing}")
+        problems.append(
+            RunProblem("missing_artifacts", f"Missing declared artefacts in {run_dir}: {missing}", missing)
+        )
+    if verify_hashes:
+        with profiling.span("verify_hashes"):
+            problems.extend(verify_declared_hashes(run_dir, index.entries, hash_workers))
 
     report_html = run_dir / "report.html"
     if not report_html.is_file():
-        raise SystemExit(f"Missing run report.html: {report_html}")
+        problems.append(RunProblem("missing_report_html", f"Missing run report.html: {report_html}"))
+        return report_path, problems
 
     report_html_text = report_html.read_text(encoding="utf-8")
-    for relpath in html_relpaths:
-        if relpath not in report_html_text:
-            raise SystemExit(
-                f"report.html missing link to declared HTML artefact: {relpath}"
+    profiling.add_read_file(report_html)
+    unlinked = [relpath for relpath in html_relpaths if relpath not in report_html_text]
+    if unlinked:
+        problems.append(
+            RunProblem(
+                "missing_report_html_links",
+                f"report.html missing link to declared HTML artefact: {unlinked[0]}",
+                unlinked,
             )
+        )
+    return report_path, problems
+
+
+def validate_run(run_dir: Path, verify_hashes: bool = False, hash_workers: int = DEFAULT_HASH_WORKERS) -> None:
+    _report_path, problems = check_run(run_dir, verify_hashes, hash_workers)
+    if problems:
+        raise SystemExit(problems[0].message)
+
+
+def validate_run_timed(
+    run_dir: Path, verify_hashes: bool = False, hash_workers: int = DEFAULT_HASH_WORKERS
+) -> RunValidation:
+    started = time.perf_counter()
+    report_path, problems = check_run(run_dir, verify_hashes, hash_workers)
+    return RunValidation(
+        run_id=run_dir.name,
+        report_json=report_path.name if report_path else None,
+        seconds=time.perf_counter() - started,
+        problems=problems,
+    )
+
+
+def validate_runs(
+    run_dirs: list[Path], jobs: int, verify_hashes: bool = False, hash_workers: int = DEFAULT_HASH_WORKERS
+) -> list[RunValidation]:
+    """Validate every run, collecting problems instead of stopping at the first one."""
+
+    validate = partial(validate_run_timed, verify_hashes=verify_hashes, hash_workers=hash_workers)
+    if jobs <= 1 or len(run_dirs) <= 1:
+        return [validate(run_dir) for run_dir in run_dirs]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(run_dirs))) as executor:
+        results = []
+        for result, spans in executor.map(partial(profiling.call_in_worker, profiling.enabled(), validate), run_dirs):
+            profiling.merge(spans)
+            results.append(result)
+        return results
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Validate AOI run artefacts and links.")
     parser.add_argument("--runs-dir", default="docs/site/aoi_reports/runs", help="Runs directory")
+    parser.add_argument(
+        "--collect",
+        action="store_true",
+        help="Validate every run and report all failures instead of stopping at the first",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="With --collect: parallel worker processes (default: 0 = one per CPU)",
+    )
+    parser.add_argument("--report-json", default=None, help="With --collect: write per-run results to this path")
+    parser.add_argument(
+        "--verify-hashes",
+        action="store_true",
+        help="Also check declared size_bytes and sha256 against the files on disk",
+    )
+    parser.add_argument(
+        "--hash-workers",
+        type=int,
+        default=DEFAULT_HASH_WORKERS,
+        help=f"Files hashed concurrently per run with --verify-hashes (default: {DEFAULT_HASH_WORKERS})",
+    )
+    profiling.add_profile_arguments(parser)
     args = parser.parse_args()
 
+    with profiling.session_from_args(args, "validate_aoi_run_artifacts"):
+        return _run(parser, args)
+
+
+def _run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    hash_workers = max(1, args.hash_workers)
+
     runs_dir = Path(args.runs_dir)
     if not runs_dir.is_dir():
         raise SystemExit(f"Runs directory not found: {runs_dir}")
+    run_dirs = [entry for entry in sorted(runs_dir.iterdir()) if entry.is_dir()]
+
+    if not args.collect:
+        if args.report_json:
+            parser.error("--report-json requires --collect")
+        for run_dir in run_dirs:
+            validate_run(run_dir, args.verify_hashes, hash_workers)
+        return 0
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    started = time.perf_counter()
+    results = validate_runs(run_dirs, jobs, args.verify_hashes, hash_workers)
+    wall_seconds = time.perf_counter() - started
+    failed = [result for result in results if not result.ok]
 
-    for entry in sorted(runs_dir.iterdir()):
-        if entry.is_dir():
-            validate_run(entry)
-    return 0
+    if args.report_json:
+        summary = {
+            "runs_dir": str(runs_dir),
+            "ok": not failed,
+            "runs_checked": len(results),
+            "runs_failed": len(failed),
+            "jobs": jobs,
+            "wall_seconds": round(wall_seconds, 6),
+            "runs": [result.as_dict() for result in results],
+        }
+        Path(args.report_json).write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+    for result in failed:
+        for problem in result.problems:
+            print(f"FAIL: {result.run_id}: [{problem.kind}] {problem.message}")
+    print(f"Validated {len(results)} run(s) with {jobs} job(s) in {wall_seconds:.3f}s: {len(failed)} failed")
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":